@@ -0,0 +1,153 @@
+"""Paramètres de l'application lus depuis l'environnement.
+
+Toutes les variables sont optionnelles sauf ``DATABASE_URL`` ; les valeurs
+par défaut correspondent à une instance d'API unique sur un PostgreSQL
+standard. Le fichier ``.env`` est chargé s'il existe.
+"""
+
+import os
+from dataclasses import dataclass, field
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return default if value is None or value == "" else int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return default if value is None or value == "" else float(value)
+
+
+def _env_list(name: str) -> tuple[str, ...]:
+    value = os.getenv(name, "")
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Configuration typée de l'application.
+
+    Attributes:
+        database_url: URL SQLAlchemy de la base principale.
+        database_replica_urls: URLs des réplicas en lecture servant les routes de lecture.
+        replica_strategy: Choix de la réplica, ``round_robin`` ou ``least_connections``.
+        read_your_writes_seconds: Durée pendant laquelle un client qui vient d'écrire
+            lit sur la base principale (0 pour aucune).
+        write_window_secret: Clé HMAC du cookie de dernière écriture, identique sur
+            toutes les instances ; vide, une clé aléatoire propre au processus est tirée.
+        async_database_url: URL du driver asynchrone ; dérivée de database_url si vide.
+        use_async_db: Sert les routes ``async def`` sur l'AsyncEngine.
+        pool_size: Connexions conservées ouvertes dans le pool.
+        max_overflow: Connexions supplémentaires autorisées au-delà de pool_size.
+        pool_timeout: Secondes d'attente d'une connexion libre avant erreur.
+        pool_recycle: Âge maximal d'une connexion en secondes (-1 pour désactiver).
+        pool_pre_ping: Vérifie chaque connexion avant de la prêter.
+        statement_timeout_ms: Durée maximale d'une requête côté PostgreSQL (0 pour aucune).
+        item_cache_enabled: Active le cache en mémoire de GET /items/{item_id}.
+        item_cache_size: Nombre maximal d'articles gardés en cache.
+        item_cache_ttl: Durée de vie d'une entrée du cache en secondes.
+        cache_backend: ``memory`` (cache du processus) ou ``redis`` (cache partagé).
+        cache_redis_url: URL ``redis://`` du serveur de cache partagé.
+        cache_invalidation_channel: Canal de diffusion des invalidations entre répliques.
+        item_count_ttl: Validité en secondes du total d'articles en cache (0 pour aucun cache).
+        item_stats_ttl: Validité en secondes des statistiques de prix en cache (0 pour aucun cache).
+        fast_list_responses: Sert les listes GET /items/ par le chemin rapide
+            (colonnes seules, sérialisation orjson) plutôt que par response_model.
+        page_time_budget_ms: Budget de temps d'une page de liste ; au-delà, la taille
+            de page maximale du client est réduite (0 pour aucune régulation).
+        page_limit_min: Taille de page maximale la plus basse imposée à un client.
+        client_id_header: En-tête identifiant le client (renseigné par le client ou par
+            la passerelle d'authentification) ; à défaut, le client est son adresse IP.
+        request_timing: Mesure chaque requête (temps total, SQL, sérialisation), renvoyée
+            dans l'en-tête ``Server-Timing`` et journalisée.
+        metrics_enabled: Expose ``/metrics`` (latences par route, requêtes SQL, pools,
+            caches) au format texte de Prometheus.
+        slow_query_ms: Durée à partir de laquelle une requête SQL est journalisée
+            avec la forme de ses paramètres et sa route (0 pour aucun journal).
+        query_budget: Nombre de requêtes SQL par requête HTTP au-delà duquel la
+            requête est signalée (0 pour aucun budget).
+    """
+
+    database_url: str = ""
+    database_replica_urls: tuple[str, ...] = ()
+    replica_strategy: str = "round_robin"
+    read_your_writes_seconds: float = 5.0
+    write_window_secret: str = field(default="", repr=False)
+    async_database_url: str = ""
+    use_async_db: bool = False
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int = 0
+    item_cache_enabled: bool = True
+    item_cache_size: int = 10000
+    item_cache_ttl: float = 30.0
+    cache_backend: str = "memory"
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_invalidation_channel: str = "items:invalidate"
+    item_count_ttl: float = 60.0
+    item_stats_ttl: float = 5.0
+    fast_list_responses: bool = True
+    page_time_budget_ms: float = 500.0
+    page_limit_min: int = 10
+    client_id_header: str = "X-Client-Id"
+    request_timing: bool = True
+    metrics_enabled: bool = True
+    slow_query_ms: float = 200.0
+    query_budget: int = 20
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Construit les paramètres à partir des variables d'environnement."""
+        return cls(
+            database_url=os.getenv("DATABASE_URL", ""),
+            database_replica_urls=_env_list("DATABASE_REPLICA_URLS"),
+            replica_strategy=os.getenv("REPLICA_STRATEGY", cls.replica_strategy),
+            read_your_writes_seconds=_env_float(
+                "READ_YOUR_WRITES_SECONDS", cls.read_your_writes_seconds
+            ),
+            write_window_secret=os.getenv("WRITE_WINDOW_SECRET", ""),
+            async_database_url=os.getenv("ASYNC_DATABASE_URL", ""),
+            use_async_db=_env_bool("USE_ASYNC_DB", cls.use_async_db),
+            pool_size=_env_int("DB_POOL_SIZE", cls.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_float("DB_POOL_TIMEOUT", cls.pool_timeout),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", cls.pool_recycle),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", cls.statement_timeout_ms),
+            item_cache_enabled=_env_bool("ITEM_CACHE_ENABLED", cls.item_cache_enabled),
+            item_cache_size=_env_int("ITEM_CACHE_SIZE", cls.item_cache_size),
+            item_cache_ttl=_env_float("ITEM_CACHE_TTL", cls.item_cache_ttl),
+            cache_backend=os.getenv("CACHE_BACKEND", cls.cache_backend),
+            cache_redis_url=os.getenv("CACHE_REDIS_URL", cls.cache_redis_url),
+            cache_invalidation_channel=os.getenv(
+                "CACHE_INVALIDATION_CHANNEL", cls.cache_invalidation_channel
+            ),
+            item_count_ttl=_env_float("ITEM_COUNT_TTL", cls.item_count_ttl),
+            item_stats_ttl=_env_float("ITEM_STATS_TTL", cls.item_stats_ttl),
+            fast_list_responses=_env_bool("FAST_LIST_RESPONSES", cls.fast_list_responses),
+            page_time_budget_ms=_env_float("PAGE_TIME_BUDGET_MS", cls.page_time_budget_ms),
+            page_limit_min=_env_int("PAGE_LIMIT_MIN", cls.page_limit_min),
+            client_id_header=os.getenv("CLIENT_ID_HEADER", cls.client_id_header),
+            request_timing=_env_bool("REQUEST_TIMING", cls.request_timing),
+            metrics_enabled=_env_bool("METRICS_ENABLED", cls.metrics_enabled),
+            slow_query_ms=_env_float("SLOW_QUERY_MS", cls.slow_query_ms),
+            query_budget=_env_int("QUERY_BUDGET", cls.query_budget),
+        )
+
+
+settings = Settings.from_env()
@@ -2,23 +2,340 @@
 
 Ce module gère la connexion à la base de données PostgreSQL
 et fournit une fonction générateur pour obtenir des sessions de base de données.
+
+Une pile asynchrone (AsyncEngine et AsyncSession) est disponible en parallèle
+de la pile synchrone ; elle est activée par ``USE_ASYNC_DB``. L'engine
+asynchrone n'est créé qu'au premier usage, pour ne pas exiger le driver
+asynchrone (asyncpg, aiosqlite) lorsque seule la pile synchrone sert.
+
+Le dimensionnement du pool et le timeout des requêtes viennent de
+app.config.settings.
+
+Des réplicas en lecture (``DATABASE_REPLICA_URLS``) peuvent servir les
+routes de lecture, qui prennent leur session par ``get_read_db`` (ou
+``get_async_read_db``) ; les écritures restent sur la base primaire
+(``get_db``). Un client qui vient d'écrire lit sur la primaire pendant
+``READ_YOUR_WRITES_SECONDS``, le temps que les réplicas rattrapent leur
+retard ; la date de sa dernière écriture lui est confiée dans un cookie
+signé, pour que la fenêtre tienne quelle que soit l'instance qui le sert.
 """
 
-import os
-from collections.abc import Generator
+import hashlib
+import hmac
+import itertools
+import math
+import secrets
+import time
+from collections.abc import AsyncGenerator, Generator, Sequence
+from functools import cache
+from http.cookies import SimpleCookie
+from typing import Any
 
-from dotenv import load_dotenv
+from fastapi import Request
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import Pool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import Settings, settings
+from app.services.cache import REPLICA_SESSION, WRITE_WINDOW_SESSION
+
+DATABASE_URL = settings.database_url
+ASYNC_DATABASE_URL = settings.async_database_url
+USE_ASYNC_DB = settings.use_async_db
+
+POOL_SIZE = settings.pool_size
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def engine_options(url: str, config: Settings) -> dict[str, Any]:
+    """Calcule les arguments de create_engine pour une URL donnée.
+
+    La taille du pool ne s'applique pas à SQLite en mémoire, dont le pool
+    dédié n'accepte ni pool_size ni max_overflow. Le timeout des requêtes
+    est transmis à PostgreSQL à l'ouverture de chaque connexion.
+
+    Example:
+        >>> engine_options("sqlite:///:memory:", Settings())
+        {'pool_pre_ping': True, 'pool_recycle': 1800}
+    """
+    parsed = make_url(url)
+    options: dict[str, Any] = {
+        "pool_pre_ping": config.pool_pre_ping,
+        "pool_recycle": config.pool_recycle,
+    }
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+    )
+    if config.statement_timeout_ms > 0 and parsed.get_backend_name() == "postgresql":
+        timeout = str(config.statement_timeout_ms)
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def to_async_url(url: str) -> str:
+    """Convertit une URL synchrone vers le driver asynchrone équivalent.
+
+    Example:
+        >>> to_async_url("postgresql://user:pwd@db/items")
+        'postgresql+asyncpg://user:pwd@db/items'
+    """
+    backend = make_url(url).get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    _, _, location = url.partition("://")
+    return f"{ASYNC_DRIVERS[backend]}://{location}"
+
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+
+class ReplicaRouter:
+    """Choisit la réplica servant une lecture.
+
+    Les réplicas sont prises à tour de rôle (``round_robin``) ou selon le
+    nombre de connexions prêtées par leur pool (``least_connections``,
+    départagé à tour de rôle ; un pool sans compteur compte pour zéro).
+
+    Example:
+        >>> router = ReplicaRouter(strategy="least_connections")
+        >>> router.choose([replica.pool for replica in replica_engines])
+        0
+    """
+
+    def __init__(self, strategy: str = "round_robin") -> None:
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+        self.strategy = strategy
+        self._turns = itertools.count()
+
+    def choose(self, replicas: Sequence[Pool]) -> int | None:
+        """Indice de la réplica servant la lecture, ou None s'il n'y en a aucune."""
+        if not replicas:
+            return None
+        start = next(self._turns) % len(replicas)
+        order = [(start + offset) % len(replicas) for offset in range(len(replicas))]
+        if self.strategy == "round_robin":
+            return order[0]
+        return min(order, key=lambda index: _checked_out(replicas[index]))
+
+
+LAST_WRITE_COOKIE = "last_write"
+
+
+class WriteWindow:
+    """Fenêtre pendant laquelle un client qui vient d'écrire lit sur la primaire.
+
+    La fenêtre voyage avec le client : après une écriture, il reçoit le
+    cookie ``last_write``, heure de l'écriture signée par HMAC-SHA256, que
+    n'importe quelle instance derrière le répartiteur sait vérifier pourvu
+    que toutes partagent la clé ``WRITE_WINDOW_SECRET``. Sans clé, une clé
+    aléatoire est tirée au démarrage, ce qui ne convient qu'à une instance unique.
+
+    Example:
+        >>> window = WriteWindow(seconds=5, secret="partagée")
+        >>> window.contains(window.token(100.0), now=104.0)
+        True
+        >>> window.contains("100.000.signature-forgée", now=104.0)
+        False
+    """
+
+    def __init__(self, seconds: float = 5.0, secret: str = "") -> None:
+        self.seconds = seconds
+        self._key = secret.encode() or secrets.token_bytes(32)
+
+    def _sign(self, stamp: str) -> str:
+        return hmac.new(self._key, stamp.encode(), hashlib.sha256).hexdigest()
+
+    def token(self, written: float) -> str:
+        """Valeur du cookie pour une écriture à l'heure ``written`` (secondes epoch)."""
+        stamp = f"{written:.3f}"
+        return f"{stamp}.{self._sign(stamp)}"
+
+    def cookie(self, written: float) -> str:
+        """En-tête Set-Cookie d'une écriture, expirant avec la fenêtre."""
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[LAST_WRITE_COOKIE] = self.token(written)
+        morsel = cookie[LAST_WRITE_COOKIE]
+        morsel["max-age"] = math.ceil(self.seconds)
+        morsel["path"] = "/"
+        morsel["httponly"] = True
+        morsel["samesite"] = "lax"
+        return morsel.OutputString()
+
+    def contains(self, token: str | None, now: float) -> bool:
+        """Indique si le cookie est authentique et date de moins de ``seconds`` secondes."""
+        if self.seconds <= 0 or not token:
+            return False
+        stamp, _, signature = token.rpartition(".")
+        if not hmac.compare_digest(signature, self._sign(stamp)):
+            return False
+        try:
+            written = float(stamp)
+        except ValueError:
+            return False
+        return now - written < self.seconds
 
-load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL", "")
+def _checked_out(pool: Pool) -> int:
+    checkedout = getattr(pool, "checkedout", None)
+    return checkedout() if callable(checkedout) else 0
 
-POOL_SIZE = 10
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, settings))
+replica_engines = [
+    create_engine(url, **engine_options(url, settings)) for url in settings.database_replica_urls
+]
+replica_router = ReplicaRouter(settings.replica_strategy)
+write_window = WriteWindow(settings.read_your_writes_seconds, settings.write_window_secret)
 
 
+@cache
+def get_async_engine() -> AsyncEngine:
+    url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+    return create_async_engine(url, **engine_options(url, settings))
+
+
+@cache
+def get_async_replica_engines() -> list[AsyncEngine]:
+    urls = [to_async_url(url) for url in settings.database_replica_urls]
+    return [create_async_engine(url, **engine_options(url, settings)) for url in urls]
+
+
+def pool_status(target: Engine | AsyncEngine) -> dict[str, Any]:
+    """Décrit l'occupation du pool de connexions d'un engine.
+
+    Les compteurs que le type de pool ne fournit pas (SQLite en mémoire
+    notamment) valent None.
+    """
+    pool = target.pool
+
+    def counter(name: str) -> int | None:
+        method = getattr(pool, name, None)
+        return method() if callable(method) else None
+
+    return {
+        "pool": type(pool).__name__,
+        "size": counter("size"),
+        "checked_out": counter("checkedout"),
+        "idle": counter("checkedin"),
+        "overflow": counter("overflow"),
+    }
+
+
+def get_pool_status() -> dict[str, dict[str, Any]]:
+    """Occupation du pool synchrone et, s'il a été créé, du pool asynchrone."""
+    status = {"sync": pool_status(engine)}
+    for index, replica in enumerate(replica_engines):
+        status[f"replica{index}"] = pool_status(replica)
+    if get_async_engine.cache_info().currsize:
+        status["async"] = pool_status(get_async_engine())
+    if get_async_replica_engines.cache_info().currsize:
+        for index, async_replica in enumerate(get_async_replica_engines()):
+            status[f"async_replica{index}"] = pool_status(async_replica)
+    return status
+
+
+# Une session vit le temps d'une requête : après un commit, les objets déjà
+# chargés restent lisibles sans être relus en base (ni chargement implicite,
+# interdit sur AsyncSession), leurs valeurs étant celles qui viennent d'être écrites
 def get_db() -> Generator[Session]:
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession]:
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
+
+
+def track_writes(request: Request) -> None:
+    """Dépendance des routes d'écriture : le client lira sur la primaire un moment.
+
+    La requête est seulement marquée ; WriteWindowMiddleware pose le cookie
+    à l'envoi de la réponse, une fois l'écriture validée, pour que la
+    fenêtre couvre toute la durée d'une écriture lente.
+    """
+    request.state.wrote = True
+
+
+def wrote_recently(request: Request) -> bool:
+    """Indique si le client de la requête est dans sa fenêtre de lecture de ses écritures."""
+    return write_window.contains(request.cookies.get(LAST_WRITE_COOKIE), time.time())
+
+
+class WriteWindowMiddleware:
+    """Middleware ASGI posant le cookie ``last_write`` sur les réponses des écritures.
+
+    Seules les écritures réussies (statut inférieur à 400) ouvrent la
+    fenêtre : un 404, un 412 ou un 422 n'a rien écrit.
+
+    Example:
+        >>> app.add_middleware(WriteWindowMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and scope.get("state", {}).get("wrote", False)
+                and write_window.seconds > 0
+            ):
+                headers = MutableHeaders(scope=message)
+                headers.append("Set-Cookie", write_window.cookie(time.time()))
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def get_read_db(request: Request) -> Generator[Session]:
+    """Session des routes de lecture, sur une réplica si possible.
+
+    ``session.info`` indique si la session lit sur une réplica et si le
+    client est dans sa fenêtre d'écriture ; le service en déduit l'usage du
+    cache des articles (app.services.cache.reads_cache et fills_cache).
+    """
+    in_window = wrote_recently(request)
+    index = None
+    if not in_window:
+        index = replica_router.choose([replica.pool for replica in replica_engines])
+    target = engine if index is None else replica_engines[index]
+    info = {REPLICA_SESSION: index is not None, WRITE_WINDOW_SESSION: in_window}
+    with Session(target, expire_on_commit=False, info=info) as session:
+        yield session
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Variante asynchrone de get_read_db."""
+    replicas = get_async_replica_engines()
+    in_window = wrote_recently(request)
+    index = None
+    if not in_window:
+        index = replica_router.choose([replica.pool for replica in replicas])
+    target = get_async_engine() if index is None else replicas[index]
+    info = {REPLICA_SESSION: index is not None, WRITE_WINDOW_SESSION: in_window}
+    async with AsyncSession(target, expire_on_commit=False, info=info) as session:
         yield session
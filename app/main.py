@@ -1,11 +1,32 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from sqlmodel import SQLModel
 
-from app.database import engine
+from app.config import settings
+from app.database import (
+    USE_ASYNC_DB,
+    WriteWindowMiddleware,
+    engine,
+    get_async_engine,
+    get_async_replica_engines,
+    get_pool_status,
+)
+from app.migrations import run_migrations
+from app.observability import (
+    CONTENT_TYPE,
+    MetricsMiddleware,
+    QueryProfilerMiddleware,
+    TimingMiddleware,
+    instrument_engine_metrics,
+    instrument_engines,
+    instrument_query_profiler,
+    registry,
+)
+from app.observability.collectors import register_app_metrics
 from app.routes import items_router
+from app.services.cache import item_cache
 
 DEBUG_MODE = True
 UNUSED_VAR = "cette variable n'est jamais utilisée"
@@ -14,7 +35,14 @@ UNUSED_VAR = "cette variable n'est jamais utilisée"
 @asynccontextmanager
 async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None]:
     SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
+    item_cache.start()
     yield
+    item_cache.stop()
+    if USE_ASYNC_DB:
+        await get_async_engine().dispose()
+        for replica in get_async_replica_engines():
+            await replica.dispose()
 
 
 app = FastAPI(
@@ -24,6 +52,26 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if settings.request_timing:
+    instrument_engines()
+    app.add_middleware(TimingMiddleware)
+
+if settings.slow_query_ms > 0 or settings.query_budget > 0:
+    instrument_query_profiler(settings.slow_query_ms, settings.query_budget)
+    app.add_middleware(QueryProfilerMiddleware)
+
+if settings.metrics_enabled:
+    instrument_engine_metrics()
+    register_app_metrics(registry)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> Response:
+        """Métriques de l'API au format d'exposition texte de Prometheus."""
+        return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+app.add_middleware(WriteWindowMiddleware)
 app.include_router(items_router)
 
 
@@ -35,3 +83,15 @@ def root() -> dict:
 @app.get("/health")
 def health() -> dict:
     return {"status": "healthy"}
+
+
+@app.get("/health/pool")
+def health_pool() -> dict:
+    """Occupation des pools de connexions (connexions prêtées, libres, débordement)."""
+    return get_pool_status()
+
+
+@app.get("/health/cache")
+def health_cache() -> dict:
+    """Compteurs du cache des items (succès, échecs, évictions, occupation)."""
+    return item_cache.stats()
@@ -0,0 +1,160 @@
+"""Évolutions du schéma sur une base existante.
+
+SQLModel.metadata.create_all crée les tables manquantes mais ne modifie
+jamais une table déjà présente, et ne connaît ni les extensions, ni les
+index d'expression, ni les tables virtuelles. Les fonctions de ce module
+complètent le schéma. Chaque étape est idempotente : elle inspecte la base
+et ne fait rien si elle est déjà appliquée, ce qui permet de les rejouer à
+chaque démarrage.
+"""
+
+import logging
+
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.services.item_queries import postgres_search
+
+logger = logging.getLogger(__name__)
+
+# unaccent() n'est pas IMMUTABLE (il dépend du dictionnaire courant) et ne
+# peut donc pas servir dans un index : cette enveloppe fige le dictionnaire
+POSTGRES_UNACCENT_FUNCTION = """
+CREATE OR REPLACE FUNCTION items_unaccent(value text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, value) $$
+"""
+
+SQLITE_FTS_TRIGGERS = (
+    """
+        CREATE TRIGGER items_fts_insert AFTER INSERT ON items BEGIN
+            INSERT INTO items_fts (rowid, nom) VALUES (new.id, new.nom);
+        END
+    """,
+    """
+        CREATE TRIGGER items_fts_delete AFTER DELETE ON items BEGIN
+            INSERT INTO items_fts (items_fts, rowid, nom) VALUES ('delete', old.id, old.nom);
+        END
+    """,
+    """
+        CREATE TRIGGER items_fts_update AFTER UPDATE OF nom ON items BEGIN
+            INSERT INTO items_fts (items_fts, rowid, nom) VALUES ('delete', old.id, old.nom);
+            INSERT INTO items_fts (rowid, nom) VALUES (new.id, new.nom);
+        END
+    """,
+)
+
+
+def add_item_version_column(connection: Connection) -> None:
+    """Ajoute la colonne ``items.version`` (ETag et contrôle de concurrence)."""
+    columns = {column["name"] for column in inspect(connection).get_columns("items")}
+    if "version" not in columns:
+        connection.execute(text("ALTER TABLE items ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+def ensure_extensions(connection: Connection, *names: str) -> set[str]:
+    """Renvoie les extensions PostgreSQL disponibles parmi ``names``.
+
+    Les extensions absentes de ``pg_extension`` sont créées si le rôle en a
+    le droit. Chaque création est isolée dans un SAVEPOINT : un refus (rôle
+    sans privilège, paquet non installé) est journalisé sans interrompre la
+    migration ni le démarrage.
+    """
+    rows = connection.execute(
+        text("SELECT extname FROM pg_extension WHERE extname = ANY(:names)"),
+        {"names": list(names)},
+    )
+    installed = set(rows.scalars())
+    for name in names:
+        if name in installed:
+            continue
+        try:
+            with connection.begin_nested():
+                connection.execute(text(f'CREATE EXTENSION IF NOT EXISTS "{name}"'))
+        except DBAPIError as exc:
+            logger.warning("Extension %s unavailable, search falls back to ILIKE: %s", name, exc)
+        else:
+            installed.add(name)
+    return installed
+
+
+def add_item_search_index(connection: Connection) -> None:
+    """Crée l'index de recherche plein texte sur ``items.nom``.
+
+    PostgreSQL : index GIN trigrammes (pg_trgm) sur ``lower(nom)`` et sur sa
+    forme sans accents (unaccent). Les extensions peuvent être créées au
+    déploiement par un rôle privilégié ; si elles manquent et que le rôle de
+    l'application ne peut pas les créer, les index correspondants ne sont pas
+    créés et la recherche se replie sur ILIKE (voir PostgresSearch).
+    SQLite : table FTS5 externe, alimentée par triggers et reconstruite à sa
+    création. Les autres bases n'ont pas d'index de recherche.
+    """
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        installed = ensure_extensions(connection, "pg_trgm", "unaccent")
+        postgres_search.trigram = "pg_trgm" in installed
+        postgres_search.unaccent = "unaccent" in installed
+        if postgres_search.unaccent:
+            connection.execute(text(POSTGRES_UNACCENT_FUNCTION))
+        if not postgres_search.trigram:
+            return
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_items_nom_trgm "
+                "ON items USING gin (lower(nom) gin_trgm_ops)"
+            )
+        )
+        if postgres_search.unaccent:
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_items_nom_unaccent_trgm "
+                    "ON items USING gin (items_unaccent(lower(nom)) gin_trgm_ops)"
+                )
+            )
+    elif dialect == "sqlite":
+        if inspect(connection).has_table("items_fts"):
+            return
+        connection.execute(
+            text(
+                "CREATE VIRTUAL TABLE items_fts USING fts5(nom, content='items', "
+                "content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+            )
+        )
+        for statement in SQLITE_FTS_TRIGGERS:
+            connection.execute(text(statement))
+        connection.execute(text("INSERT INTO items_fts (items_fts) VALUES ('rebuild')"))
+
+
+def add_item_sort_indexes(connection: Connection) -> None:
+    """Crée les index des filtres et tris de liste.
+
+    ``(prix, id)`` sert les filtres de prix triés par prix sans tri en
+    mémoire. Sous PostgreSQL, ``nom text_pattern_ops`` permet à
+    ``nom LIKE 'préfixe%'`` d'utiliser un index quelle que soit la collation.
+    """
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_items_prix_id ON items (prix, id)"))
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_items_nom_pattern ON items (nom text_pattern_ops)")
+        )
+
+
+MIGRATIONS = [add_item_version_column, add_item_search_index, add_item_sort_indexes]
+
+
+def migrate(connection: Connection) -> None:
+    """Applique dans l'ordre les étapes de migration sur une connexion ouverte.
+
+    Utilisable avec ``AsyncConnection.run_sync`` pour une base asynchrone.
+    """
+    if not inspect(connection).has_table("items"):
+        return
+    for migration in MIGRATIONS:
+        migration(connection)
+
+
+def run_migrations(target: Engine) -> None:
+    """Applique les étapes de migration dans une transaction."""
+    with target.begin() as connection:
+        migrate(connection)
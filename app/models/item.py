@@ -1,9 +1,14 @@
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class Item(SQLModel, table=True):
     __tablename__ = "items"
+    # Sert les filtres de prix triés par prix (ou pagination keyset sur prix)
+    __table_args__ = (Index("ix_items_prix_id", "prix", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     nom: str = Field(index=True)
     prix: float
+    # Incrémentée à chaque modification : sert d'ETag et de contrôle de concurrence
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
@@ -0,0 +1,51 @@
+from .metrics import (
+    CONTENT_TYPE,
+    CallbackMetric,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+    instrument_engine_metrics,
+    registry,
+)
+from .profiler import (
+    QueryCounter,
+    QueryProfilerMiddleware,
+    count_queries,
+    instrument_query_profiler,
+    parameters_shape,
+)
+from .queries import ExecutedQuery, observe_queries, observed_query
+from .timing import (
+    RequestTiming,
+    TimedRoute,
+    TimingMiddleware,
+    current_timing,
+    instrument_engines,
+)
+
+__all__ = [
+    "CONTENT_TYPE",
+    "CallbackMetric",
+    "Counter",
+    "ExecutedQuery",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "QueryCounter",
+    "QueryProfilerMiddleware",
+    "RequestTiming",
+    "TimedRoute",
+    "TimingMiddleware",
+    "count_queries",
+    "current_timing",
+    "instrument_engine_metrics",
+    "instrument_engines",
+    "instrument_query_profiler",
+    "observe_queries",
+    "observed_query",
+    "parameters_shape",
+    "registry",
+]
@@ -0,0 +1,83 @@
+"""Métriques calculées à partir de l'état des pools de connexions et des caches."""
+
+from app.database import get_pool_status
+from app.observability.metrics import CallbackMetric, Labels, MetricsRegistry
+from app.services.cache import item_cache, item_count, item_stats
+
+POOL_STATES = ("checked_out", "idle", "overflow")
+
+
+def pool_connections() -> dict[Labels, float | None]:
+    return {
+        (name, state): status[state]
+        for name, status in get_pool_status().items()
+        for state in POOL_STATES
+    }
+
+
+def pool_sizes() -> dict[Labels, float | None]:
+    return {(name,): status["size"] for name, status in get_pool_status().items()}
+
+
+def cache_counters() -> dict[str, tuple[int, int]]:
+    """Succès et échecs de chaque cache, par nom de cache."""
+    counters = {}
+    item = item_cache.stats()
+    counters["item"] = (item["hits"], item["misses"])
+    if "shared" in item:
+        counters["item_shared"] = (item["shared"]["hits"], item["shared"]["misses"])
+    for name, cache in (("item_count", item_count), ("item_stats", item_stats)):
+        stats = cache.stats()
+        counters[name] = (stats["hits"], stats["misses"])
+    return counters
+
+
+def cache_lookups() -> dict[Labels, float | None]:
+    return {
+        (name, result): count
+        for name, (hits, misses) in cache_counters().items()
+        for result, count in (("hit", hits), ("miss", misses))
+    }
+
+
+def cache_hit_ratios() -> dict[Labels, float | None]:
+    return {
+        (name,): hits / (hits + misses) if hits + misses else None
+        for name, (hits, misses) in cache_counters().items()
+    }
+
+
+def register_app_metrics(registry: MetricsRegistry) -> None:
+    """Ajoute au registre les jauges des pools et les compteurs des caches."""
+    registry.register(
+        CallbackMetric(
+            "db_pool_connections",
+            "Pooled connections by state.",
+            "gauge",
+            pool_connections,
+            ("engine", "state"),
+        )
+    )
+    registry.register(
+        CallbackMetric(
+            "db_pool_size", "Connections kept open by the pool.", "gauge", pool_sizes, ("engine",)
+        )
+    )
+    registry.register(
+        CallbackMetric(
+            "cache_lookups_total",
+            "Cache lookups by result.",
+            "counter",
+            cache_lookups,
+            ("cache", "result"),
+        )
+    )
+    registry.register(
+        CallbackMetric(
+            "cache_hit_ratio",
+            "Share of cache lookups served from the cache.",
+            "gauge",
+            cache_hit_ratios,
+            ("cache",),
+        )
+    )
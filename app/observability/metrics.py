@@ -0,0 +1,335 @@
+"""Métriques de l'API au format d'exposition texte de Prometheus.
+
+Le registre est tenu dans le processus, sans dépendance ni service externe.
+Compteurs et histogrammes sont répartis par thread : chaque thread
+(boucle d'évènements, threads du threadpool) écrit dans ses propres
+valeurs sans verrou, et la lecture de ``/metrics`` additionne les parts de
+tous les threads. Le seul verrou sert à enregistrer la part d'un nouveau
+thread, une fois par thread et par métrique.
+
+Les métriques dont la valeur existe déjà ailleurs (pools de connexions,
+compteurs des caches) sont des métriques calculées, lues seulement au
+moment de l'exposition.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from contextvars import ContextVar
+from typing import TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .queries import ExecutedQuery, observe_queries
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Secondes : de la lecture servie par le cache à la page lente
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = zip(names, values, strict=True)
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Shards:
+    """Valeurs d'une métrique, une part par thread."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._all: list[dict[Labels, list[float]]] = []
+        self._lock = threading.Lock()
+
+    def local(self) -> dict[Labels, list[float]]:
+        values: dict[Labels, list[float]] | None = getattr(self._local, "values", None)
+        if values is None:
+            values = {}
+            with self._lock:
+                self._all.append(values)
+            self._local.values = values
+        return values
+
+    def merged(self, width: int) -> dict[Labels, list[float]]:
+        """Somme des parts de tous les threads, par combinaison de labels."""
+        with self._lock:
+            shards = list(self._all)
+        merged: dict[Labels, list[float]] = {}
+        for shard in shards:
+            for labels, values in list(shard.items()):
+                total = merged.setdefault(labels, [0.0] * width)
+                for index, value in enumerate(list(values)):
+                    total[index] += value
+        return merged
+
+    def clear(self) -> None:
+        with self._lock:
+            for shard in self._all:
+                shard.clear()
+
+
+class Metric(ABC):
+    """Base des métriques : nom, aide, type et noms de labels."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def lines(self) -> Iterator[str]:
+        """Lignes d'échantillons de la métrique, sans HELP ni TYPE."""
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.type}"
+        yield from self.lines()
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remet les valeurs à zéro."""
+
+
+class Counter(Metric):
+    """Compteur croissant ; ``inc`` n'écrit que dans la part du thread courant."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._shards = _Shards()
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        values = self._shards.local()
+        state = values.get(labels)
+        if state is None:
+            state = values[labels] = [0.0]
+        state[0] += amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._shards.merged(1).get(labels, [0.0])[0]
+
+    def lines(self) -> Iterator[str]:
+        for labels, (value,) in sorted(self._shards.merged(1).items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+    def clear(self) -> None:
+        self._shards.clear()
+
+
+class Gauge(Counter):
+    """Jauge montante et descendante (requêtes en cours par exemple)."""
+
+    type = "gauge"
+
+    def dec(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        self.inc(-amount, labels)
+
+
+class Histogram(Metric):
+    """Histogramme à classes fixes, réparti par thread comme Counter."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Une case par classe, une pour +Inf, puis la somme des valeurs
+        self._width = len(self.buckets) + 2
+        self._shards = _Shards()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        values = self._shards.local()
+        state = values.get(labels)
+        if state is None:
+            state = values[labels] = [0.0] * self._width
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def lines(self) -> Iterator[str]:
+        bucket_labels = (*self.labelnames, "le")
+        bounds = [*self.buckets, float("inf")]
+        for labels, state in sorted(self._shards.merged(self._width).items()):
+            cumulative = 0.0
+            for bound, count in zip(bounds, state[:-1], strict=True):
+                cumulative += count
+                formatted = _format_labels(bucket_labels, (*labels, _format_value(bound)))
+                yield f"{self.name}_bucket{formatted} {_format_value(cumulative)}"
+            formatted = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{formatted} {_format_value(state[-1])}"
+            yield f"{self.name}_count{formatted} {_format_value(cumulative)}"
+
+    def clear(self) -> None:
+        self._shards.clear()
+
+
+class CallbackMetric(Metric):
+    """Métrique calculée à l'exposition par une fonction renvoyant ses valeurs par labels.
+
+    Une valeur None (compteur que le pool ne fournit pas par exemple) n'est pas exposée.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        type: str,
+        function: Callable[[], dict[Labels, float | None]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.type = type
+        self.function = function
+
+    def lines(self) -> Iterator[str]:
+        for labels, value in self.function().items():
+            if value is not None:
+                yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+    def clear(self) -> None:
+        """Rien à remettre à zéro : les valeurs sont lues à chaque exposition."""
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    """Ensemble des métriques exposées par ``/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Ajoute une métrique ; un nom déjà pris lève ValueError."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        """Toutes les métriques au format d'exposition texte."""
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Remet à zéro les compteurs et histogrammes (les métriques calculées sont lues)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests being served.")
+)
+request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ("method", "route", "status"),
+    )
+)
+queries_per_request = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL statements executed per HTTP request.",
+        ("method", "route"),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+query_duration = registry.register(
+    Histogram(
+        "db_query_duration_seconds",
+        "SQL statement execution time by statement type.",
+        ("operation",),
+        buckets=QUERY_BUCKETS,
+    )
+)
+
+# Nombre de requêtes SQL de la requête HTTP en cours (liste d'un élément, mutable)
+_request_queries: ContextVar[list[int] | None] = ContextVar("metrics_queries", default=None)
+
+
+def _observe_query(query: ExecutedQuery) -> None:
+    statement = query.statement
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+    query_duration.observe(query.elapsed, (operation,))
+    counter = _request_queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def instrument_engine_metrics() -> None:
+    """Alimente les métriques SQL depuis tous les engines (synchrones et asynchrones)."""
+    observe_queries(_observe_query)
+
+
+class MetricsMiddleware:
+    """Middleware ASGI alimentant les métriques HTTP.
+
+    La latence est étiquetée par modèle de route (``/items/{item_id}``) et
+    non par chemin, pour garder un nombre de séries borné ; les requêtes
+    qui ne correspondent à aucune route sont regroupées sous ``unmatched``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        queries = [0]
+        token = _request_queries.set(queries)
+        requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_flight.dec()
+            _request_queries.reset(token)
+            route = scope.get("route")
+            template = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            request_duration.observe(time.perf_counter() - started, (method, template, str(status)))
+            queries_per_request.observe(queries[0], (method, template))
@@ -0,0 +1,175 @@
+"""Journal des requêtes SQL lentes et budget de requêtes par requête HTTP.
+
+Toute requête SQL plus longue que ``SLOW_QUERY_MS`` est journalisée avec
+la forme de ses paramètres (noms et types, jamais les valeurs) et la route
+qui l'a émise. Une requête HTTP qui exécute plus de ``QUERY_BUDGET``
+requêtes SQL est signalée : c'est le symptôme d'un N+1 ou d'un aller-retour
+ajouté par mégarde.
+
+QueryCounter compte les requêtes d'un bloc de code ; les tests s'en servent
+(fixture ``assert_max_queries``) pour figer le nombre d'allers-retours des
+méthodes d'ItemService.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .queries import ExecutedQuery, observe_queries
+
+logger = logging.getLogger(__name__)
+
+
+def parameters_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Forme des paramètres d'une requête : noms et types, sans les valeurs.
+
+    Example:
+        >>> parameters_shape({"id": 1, "nom": "A"})
+        {'id': 'int', 'nom': 'str'}
+        >>> parameters_shape([(1, "A"), (2, "B")], executemany=True)
+        '2 x (int, str)'
+    """
+    if executemany and parameters:
+        return f"{len(parameters)} x {_shape_repr(parameters_shape(parameters[0]))}"
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return tuple(type(value).__name__ for value in parameters)
+    return type(parameters).__name__
+
+
+def _shape_repr(shape: Any) -> str:
+    if isinstance(shape, tuple):
+        return "(" + ", ".join(shape) + ")"
+    return str(shape)
+
+
+@dataclass
+class QueryProfile:
+    """Requêtes SQL exécutées pendant une requête HTTP."""
+
+    scope: Scope
+    queries: int = 0
+
+    @property
+    def route(self) -> str:
+        """Modèle de la route (``/items/{item_id}``), ou le chemin avant le routage."""
+        path: str | None = getattr(self.scope.get("route"), "path", None)
+        return path or str(self.scope["path"])
+
+
+@dataclass
+class QueryCounter:
+    """Requêtes SQL exécutées dans un bloc ``count_queries``."""
+
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_current: ContextVar[QueryProfile | None] = ContextVar("query_profile", default=None)
+_counters: list[QueryCounter] = []
+
+# Seuils en vigueur, fixés par instrument_query_profiler
+_limits = {"slow_query_ms": 0.0, "query_budget": 0}
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Compte les requêtes SQL exécutées, sur tous les engines, pendant le bloc.
+
+    Example:
+        >>> with count_queries() as counter:
+        ...     ItemService.update(db, item_id, changes)
+        >>> counter.count
+        3
+    """
+    observe_queries(_observe_query)
+    counter = QueryCounter()
+    _counters.append(counter)
+    try:
+        yield counter
+    finally:
+        _counters.remove(counter)
+
+
+def _observe_query(query: ExecutedQuery) -> None:
+    elapsed_ms = query.elapsed * 1000
+    for counter in _counters:
+        counter.statements.append(query.statement)
+    profile = _current.get()
+    if profile is not None:
+        profile.queries += 1
+
+    threshold = _limits["slow_query_ms"]
+    if threshold and elapsed_ms >= threshold:
+        route = profile.route if profile is not None else None
+        shape = parameters_shape(query.parameters, query.executemany)
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed_ms,
+            route or "<no request>",
+            " ".join(query.statement.split()),
+            extra={
+                "slow_query": {
+                    "duration_ms": round(elapsed_ms, 3),
+                    "statement": query.statement,
+                    "parameters": shape,
+                    "route": route,
+                }
+            },
+        )
+
+
+def instrument_query_profiler(slow_query_ms: float, query_budget: int) -> None:
+    """Active le journal des requêtes lentes et le budget de requêtes (0 désactive chacun)."""
+    _limits["slow_query_ms"] = slow_query_ms
+    _limits["query_budget"] = query_budget
+    observe_queries(_observe_query)
+
+
+class QueryProfilerMiddleware:
+    """Middleware ASGI comptant les requêtes SQL de chaque requête HTTP.
+
+    Au-delà du budget fixé par instrument_query_profiler, la requête est
+    signalée dans le journal avec son nombre de requêtes SQL.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(scope)
+        token = _current.set(profile)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            budget = _limits["query_budget"]
+            if budget and profile.queries > budget:
+                logger.warning(
+                    "%s %s ran %d queries (budget %d)",
+                    scope["method"],
+                    profile.route,
+                    profile.queries,
+                    budget,
+                    extra={
+                        "query_budget": {
+                            "method": scope["method"],
+                            "route": profile.route,
+                            "queries": profile.queries,
+                            "budget": budget,
+                        }
+                    },
+                )
@@ -0,0 +1,100 @@
+"""Point d'accroche unique sur l'exécution des requêtes SQL.
+
+Un seul trio de listeners (``before_cursor_execute``,
+``after_cursor_execute``, ``handle_error``) est posé sur Engine, donc sur
+tous les engines synchrones et asynchrones. Il mesure la durée de chaque
+requête une seule fois, avec une seule pile de débuts dans ``conn.info``,
+et la transmet aux observateurs inscrits : mesure des requêtes HTTP
+(timing), métriques et journal des requêtes lentes (profiler).
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_QUERY_STARTS = "query_starts"
+
+
+@dataclass(frozen=True)
+class ExecutedQuery:
+    """Requête SQL exécutée, telle que transmise aux observateurs.
+
+    Attributes:
+        statement: Texte SQL envoyé au pilote.
+        parameters: Paramètres de la requête (une séquence en executemany).
+        executemany: La requête a été exécutée pour plusieurs jeux de paramètres.
+        elapsed: Durée d'exécution en secondes.
+    """
+
+    statement: str
+    parameters: Any
+    executemany: bool
+    elapsed: float
+
+
+QueryObserver = Callable[[ExecutedQuery], None]
+
+_observers: list[QueryObserver] = []
+
+
+def observe_queries(observer: QueryObserver) -> None:
+    """Inscrit un observateur des requêtes SQL et pose les listeners au premier appel.
+
+    Inscrire deux fois le même observateur n'a pas d'effet.
+
+    Example:
+        >>> observe_queries(lambda query: print(query.elapsed))
+    """
+    if observer not in _observers:
+        _observers.append(observer)
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def observed_query(statement: str, parameters: Any, executemany: bool = False) -> Iterator[None]:
+    """Chronomètre une instruction envoyée hors curseur SQLAlchemy et la transmet aux observateurs.
+
+    Le COPY des imports passe directement par le pilote (psycopg2, asyncpg)
+    et n'émet pas les évènements ``*_cursor_execute`` ; sans cela, il
+    échapperait à la mesure, aux métriques et au profiler.
+
+    Example:
+        >>> with observed_query(COPY_ITEMS_SQL, rows, executemany=True):
+        ...     cursor.copy_expert(COPY_ITEMS_SQL, payload)
+    """
+    started = time.perf_counter()
+    yield
+    query = ExecutedQuery(statement, parameters, executemany, time.perf_counter() - started)
+    for observer in _observers:
+        observer(query)
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    conn.info.setdefault(_QUERY_STARTS, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    starts = conn.info.get(_QUERY_STARTS)
+    if not starts:
+        return
+    query = ExecutedQuery(statement, parameters, executemany, time.perf_counter() - starts.pop())
+    for observer in _observers:
+        observer(query)
+
+
+def _handle_error(context: Any) -> None:
+    # Une requête en erreur n'atteint pas after_cursor_execute
+    connection = context.connection
+    starts = connection.info.get(_QUERY_STARTS) if connection is not None else None
+    if starts:
+        starts.pop()
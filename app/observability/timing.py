@@ -0,0 +1,187 @@
+"""Mesure du temps de traitement de chaque requête HTTP.
+
+Un middleware ASGI pur ouvre pour chaque requête un RequestTiming, rangé
+dans une ContextVar : le contexte est copié dans le thread du threadpool
+(routes synchrones) et dans les greenlets de SQLAlchemy (routes
+asynchrones), si bien que le point d'accroche SQL commun (``queries``) et
+les routes des items (TimedRoute) y inscrivent leurs
+mesures sans rien se passer explicitement.
+
+Le temps total est découpé en :
+
+- ``validation`` : routage, dépendances et validation de la requête,
+  jusqu'à l'appel de la fonction de route ;
+- ``app`` : la fonction de route, accès à la base compris ;
+- ``db`` : exécution des requêtes SQL (et leur nombre) ;
+- ``serialization`` : validation contre response_model et encodage de la
+  réponse, du retour de la fonction de route à l'envoi des en-têtes.
+
+Les mesures sont renvoyées dans l'en-tête ``Server-Timing`` et journalisées
+avec des champs structurés (``extra={"timing": {...}}``).
+"""
+
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .queries import ExecutedQuery, observe_queries
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestTiming:
+    """Mesures d'une requête en cours, en secondes (horloge perf_counter)."""
+
+    started: float
+    db: float = 0.0
+    queries: int = 0
+    endpoint_started: float | None = None
+    endpoint_finished: float | None = None
+    response_started: float | None = None
+
+    def _ms(self, start: float | None, end: float | None) -> float | None:
+        if start is None or end is None:
+            return None
+        return round((end - start) * 1000, 3)
+
+    def fields(self, now: float) -> dict[str, Any]:
+        """Mesures en millisecondes ; None pour une étape non observée."""
+        return {
+            "total_ms": self._ms(self.started, now),
+            "validation_ms": self._ms(self.started, self.endpoint_started),
+            "app_ms": self._ms(self.endpoint_started, self.endpoint_finished),
+            "db_ms": round(self.db * 1000, 3),
+            "queries": self.queries,
+            "serialization_ms": self._ms(self.endpoint_finished, self.response_started),
+        }
+
+    def server_timing(self, now: float) -> str:
+        """Valeur de l'en-tête Server-Timing."""
+        fields = self.fields(now)
+        metrics = [f'db;dur={fields["db_ms"]};desc="{self.queries} queries"']
+        for name in ("validation", "app", "serialization", "total"):
+            if fields[f"{name}_ms"] is not None:
+                metrics.append(f"{name};dur={fields[f'{name}_ms']}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> RequestTiming | None:
+    """Mesures de la requête en cours, ou None hors requête ou si la mesure est désactivée."""
+    return _current.get()
+
+
+def _observe_query(query: ExecutedQuery) -> None:
+    timing = _current.get()
+    if timing is None:
+        return
+    timing.db += query.elapsed
+    timing.queries += 1
+
+
+def instrument_engines() -> None:
+    """Branche la mesure du temps SQL sur tous les engines (synchrones et asynchrones)."""
+    observe_queries(_observe_query)
+
+
+def timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Enveloppe une fonction de route pour noter son début et sa fin dans RequestTiming."""
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            timing = _current.get()
+            if timing is None:
+                return await endpoint(*args, **kwargs)
+            timing.endpoint_started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timing.endpoint_finished = time.perf_counter()
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timing = _current.get()
+        if timing is None:
+            return endpoint(*args, **kwargs)
+        timing.endpoint_started = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            timing.endpoint_finished = time.perf_counter()
+
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """Route dont la fonction est chronométrée, pour séparer validation, app et sérialisation."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, timed_endpoint(endpoint), **kwargs)
+
+
+class TimingMiddleware:
+    """Middleware ASGI mesurant chaque requête HTTP.
+
+    Example:
+        >>> instrument_engines()
+        >>> app.add_middleware(TimingMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(started=time.perf_counter())
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing.response_started = time.perf_counter()
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.server_timing(timing.response_started))
+            await send(message)
+
+        token = _current.set(timing)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            fields = timing.fields(time.perf_counter())
+            logger.info(
+                "%s %s %d in %.1f ms (db %.1f ms, %d queries)",
+                scope["method"],
+                scope["path"],
+                status,
+                fields["total_ms"],
+                fields["db_ms"],
+                fields["queries"],
+                extra={
+                    "timing": {
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        **fields,
+                    }
+                },
+            )
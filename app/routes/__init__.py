@@ -1,3 +1,37 @@
-from .items import router as items_router
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
 
-__all__ = ["items_router"]
+from app.database import USE_ASYNC_DB
+
+from .items import router as sync_items_router
+from .items_async import router as async_items_router
+
+
+def build_items_router(use_async: bool = USE_ASYNC_DB) -> APIRouter:
+    """Assemble le routeur des items pour la pile synchrone ou asynchrone.
+
+    En mode asynchrone, chaque route synchrone est remplacée par la route
+    ``async def`` de même chemin et mêmes méthodes. L'ordre de déclaration du
+    routeur synchrone est conservé, ce qui garde les chemins fixes (``/bulk``)
+    devant ``/{item_id}`` ; une route sans variante asynchrone reste synchrone.
+    """
+    if not use_async:
+        return sync_items_router
+
+    def key(route: APIRoute) -> tuple[str, frozenset[str]]:
+        return route.path, frozenset(route.methods or ())
+
+    async_routes = {
+        key(route): route for route in async_items_router.routes if isinstance(route, APIRoute)
+    }
+    router = APIRouter()
+    for route in sync_items_router.routes:
+        if isinstance(route, APIRoute):
+            route = async_routes.get(key(route), route)
+        router.routes.append(route)
+    return router
+
+
+items_router = build_items_router()
+
+__all__ = ["items_router", "build_items_router"]
@@ -0,0 +1,116 @@
+"""Requêtes conditionnelles HTTP (ETag, If-None-Match, If-Match) sur les items.
+
+L'ETag d'un article est dérivé de son identifiant et de sa colonne
+``version`` : il se calcule sans sérialiser ni hacher le corps de la
+réponse. L'ETag d'une liste condense les couples (id, version) des
+articles qu'elle contient.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Row
+
+from app.models.item import Item
+
+# Colonne ``version`` en INTEGER : une version au-delà ne peut désigner aucun article
+MAX_VERSION = 2**31 - 1
+
+
+def item_etag(item: Item) -> str:
+    """ETag fort d'un article, de la forme ``"<id>-<version>"``."""
+    return f'"{item.id}-{item.version}"'
+
+
+def list_etag(items: Iterable[Item | Row[*tuple[Any, ...]]], *extra: str | None) -> str:
+    """ETag fort d'une liste d'articles.
+
+    Args:
+        items: Articles (ou lignes id, version) de la réponse, dans leur ordre d'affichage.
+        *extra: Autres éléments de la réponse (par exemple le curseur suivant).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for item in items:
+        digest.update(f"{item.id}-{item.version};".encode())
+    for value in extra:
+        digest.update(f"|{value or ''}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _parse_etags(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparaison faible de If-None-Match (RFC 9110, section 13.1.2)."""
+    tags = _parse_etags(if_none_match)
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def not_modified(if_none_match: str | None, etag: str, response: Response) -> Response | None:
+    """Pose l'ETag sur la réponse et renvoie une réponse 304 si le client est à jour.
+
+    Le 304 reprend les en-têtes déjà posés sur ``response`` (``X-Page-Limit``,
+    ``X-Total-Count``...) : ce sont ceux que la réponse 200 aurait portés.
+
+    Example:
+        >>> cached = not_modified(if_none_match, item_etag(item), response)
+        >>> if cached is not None:
+        ...     return cached
+    """
+    response.headers["ETag"] = etag
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers))
+    return None
+
+
+def expected_version(if_match: str | None, item_id: int) -> int | None:
+    """Extrait d'un en-tête If-Match la version attendue d'un article.
+
+    Returns:
+        La version portée par l'ETag de l'article, ou None si l'en-tête est
+        absent ou vaut ``*`` (aucune vérification).
+
+    Raises:
+        HTTPException: 412 si aucun ETag fort de l'en-tête ne désigne cet article
+            (version non numérique ou hors de la colonne comprise).
+    """
+    if if_match is None:
+        return None
+    tags = _parse_etags(if_match)
+    if "*" in tags:
+        return None
+    prefix = f'"{item_id}-'
+    for tag in tags:
+        digits = tag[len(prefix) : -1]
+        if not (tag.startswith(prefix) and tag.endswith('"')):
+            continue
+        if digits.isascii() and digits.isdigit() and int(digits) <= MAX_VERSION:
+            return int(digits)
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=f"If-Match does not match the current version of item {item_id}",
+    )
+
+
+def item_not_found(item_id: int, if_match: str | None) -> HTTPException:
+    """Erreur d'une écriture conditionnelle sur un article absent.
+
+    Un If-Match, même ``*``, est faux sans représentation actuelle de la
+    ressource (RFC 9110, section 13.1.1) : 412 plutôt que 404.
+
+    Example:
+        >>> if not item:
+        ...     raise item_not_found(item_id, if_match)
+    """
+    if if_match is not None:
+        return HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item with id {item_id} does not exist",
+        )
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Item with id {item_id} not found",
+    )
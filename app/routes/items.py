@@ -1,58 +1,447 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import time
+from collections.abc import AsyncIterator, Generator, Iterator
+from typing import Annotated, Any, Literal
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import Field
 from sqlmodel import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db, track_writes
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
-from app.services.item_service import ItemService
+from app.observability import TimedRoute
+from app.routes.conditional import (
+    expected_version,
+    item_etag,
+    item_not_found,
+    list_etag,
+    not_modified,
+)
+from app.routes.responses import rows_response
+from app.schemas.item import (
+    MAX_ITEM_ID,
+    BulkCreateResult,
+    BulkUpdateResult,
+    BulkWriteResult,
+    ImportReport,
+    ItemBatchResult,
+    ItemBulkUpdate,
+    ItemCount,
+    ItemCreate,
+    ItemPage,
+    ItemResponse,
+    ItemSearchResult,
+    ItemStats,
+    ItemUpdate,
+)
+from app.services.item_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    accepts_gzip,
+    encode_export,
+)
+from app.services.item_import import ImportFormatError, body_format, run_import
+from app.services.item_queries import (
+    EXPORT_BATCH_SIZE,
+    IMPORT_BATCH_SIZE,
+    ItemFilters,
+    VersionConflictError,
+)
+from app.services.item_service import BULK_CHUNK_SIZE, ItemService
+from app.services.page_limits import AdaptivePageLimiter
+from app.services.pagination import InvalidCursorError
 
-router = APIRouter(prefix="/items", tags=["items"])
+router = APIRouter(prefix="/items", tags=["items"], route_class=TimedRoute)
 
 MAX_ITEMS_PER_PAGE = 1000
+MAX_BULK_ITEMS = 10000
+MAX_STATS_BUCKETS = 100
+MAX_BATCH_IDS = MAX_ITEMS_PER_PAGE
+BatchId = Annotated[int, Field(ge=0, le=MAX_ITEM_ID)]
+
+page_limiter = AdaptivePageLimiter(
+    max_limit=MAX_ITEMS_PER_PAGE,
+    min_limit=settings.page_limit_min,
+    budget_ms=settings.page_time_budget_ms,
+)
+
+
+def export_response(
+    body: Iterator[bytes] | AsyncIterator[bytes], export_format: ExportFormat, gzip: bool
+) -> StreamingResponse:
+    """Enveloppe un flux d'export dans une réponse HTTP téléchargeable."""
+    headers = {
+        "Content-Disposition": f'attachment; filename="items.{export_format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers)
+
+
+def item_filters(
+    prix_min: float | None = Query(None, ge=0),
+    prix_max: float | None = Query(None, ge=0),
+    nom_prefix: str | None = Query(None, min_length=1, max_length=255),
+) -> ItemFilters:
+    """Dépendance lisant les filtres de liste dans la query string."""
+    return ItemFilters(prix_min=prix_min, prix_max=prix_max, nom_prefix=nom_prefix)
+
+
+def client_id(request: Request) -> str:
+    """Identifiant du client d'une requête, clé de son plafond de taille de page.
+
+    L'en-tête CLIENT_ID_HEADER (identifiant d'application, ou sujet du jeton
+    recopié par la passerelle d'authentification) prime sur l'adresse IP :
+    derrière un répartiteur de charge, toutes les requêtes portent la même
+    adresse et partageraient un seul plafond.
+    """
+    header = request.headers.get(settings.client_id_header)
+    if header:
+        return f"id:{header}"
+    return f"ip:{request.client.host}" if request.client else "ip:unknown"
+
+
+def page_limit(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_ITEMS_PER_PAGE),
+) -> Generator[int]:
+    """Dépendance fixant la taille de page effective d'une liste.
+
+    La taille demandée est bornée par le plafond adaptatif du client
+    (voir app.services.page_limits) et renvoyée dans l'en-tête
+    ``X-Page-Limit`` ; la durée de la requête ajuste ensuite ce plafond.
+    """
+    client = client_id(request)
+    effective = min(limit, page_limiter.cap(client))
+    response.headers["X-Page-Limit"] = str(effective)
+    started = time.perf_counter()
+    yield effective
+    page_limiter.record(client, effective, (time.perf_counter() - started) * 1000)
+
+
+def batch_ids(
+    ids: str = Query(
+        ...,
+        pattern=r"^\d+(,\d+)*$",
+        max_length=MAX_BATCH_IDS * 20,
+        description="Identifiants séparés par des virgules",
+    ),
+) -> list[int]:
+    """Dépendance lisant la liste ``ids=1,2,3`` de GET /items/batch."""
+    parsed = [int(item_id) for item_id in ids.split(",")]
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"At most {MAX_BATCH_IDS} ids per request",
+        )
+    if max(parsed) > MAX_ITEM_ID:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Item ids must not exceed {MAX_ITEM_ID}",
+        )
+    return parsed
+
+
+def batch_result(ids: list[int], items: list[Item | None]) -> ItemBatchResult:
+    """Réponse d'une lecture par lot : un élément par id demandé, null si introuvable."""
+    return ItemBatchResult(
+        items=[None if item is None else ItemResponse.model_validate(item) for item in items],
+        missing_ids=list(
+            dict.fromkeys(item_id for item_id, item in zip(ids, items, strict=True) if item is None)
+        ),
+    )
+
+
+@router.get("/", response_model=list[ItemResponse] | ItemPage)
+def get_items(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Depends(page_limit),
+    pagination: Literal["offset", "cursor"] = "offset",
+    cursor: str | None = None,
+    order_by: Literal["id", "nom", "prix"] = "id",
+    direction: Literal["asc", "desc"] = "asc",
+    filters: ItemFilters = Depends(item_filters),
+    include_total: bool = False,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_read_db),
+) -> list[Item] | ItemPage | Response:
+    """Récupère la liste des items avec pagination.
+
+    Le mode ``offset`` (par défaut) renvoie une simple liste. Le mode ``cursor``,
+    activé par ``pagination=cursor`` ou par la présence d'un ``cursor``, renvoie
+    une page accompagnée du ``next_cursor`` à repasser pour la page suivante.
+    Les filtres (``prix_min``, ``prix_max``, ``nom_prefix``) et le tri
+    (``order_by``, ``direction``) sont appliqués en SQL dans les deux modes.
+    En mode ``offset``, la liste est servie par le chemin rapide
+    (FAST_LIST_RESPONSES, voir app.routes.responses) : colonnes seules,
+    sérialisées par orjson sans revalidation.
+    La réponse porte un ETag ; un client à jour (If-None-Match) reçoit un 304.
+    Avec ``include_total=true``, l'en-tête ``X-Total-Count`` donne le nombre
+    d'items correspondant aux filtres (voir ItemService.count).
+    ``limit`` est borné à MAX_ITEMS_PER_PAGE, puis au plafond adaptatif du
+    client ; la taille de page appliquée est renvoyée dans ``X-Page-Limit``.
+    En mode ``offset``, une page peut donc contenir moins d'items que
+    ``limit`` sans être la dernière : la page suivante commence à ``skip``
+    plus ``X-Page-Limit`` (et non plus ``limit``), faute de quoi des items
+    sont sautés. Le mode ``cursor`` n'a pas ce problème.
+    """
+    if include_total:
+        response.headers["X-Total-Count"] = str(ItemService.count(db, filters))
+    if pagination == "offset" and cursor is None and settings.fast_list_responses:
+        rows = ItemService.get_rows(db, skip, limit, filters, order_by, direction)
+        return not_modified(if_none_match, list_etag(rows), response) or rows_response(
+            rows, response
+        )
+    if pagination == "offset" and cursor is None:
+        items = ItemService.get_all(db, skip, limit, filters, order_by, direction)
+        return not_modified(if_none_match, list_etag(items), response) or items
+
+    try:
+        items, next_cursor = ItemService.get_page(db, limit, cursor, order_by, direction, filters)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    etag = list_etag(items, next_cursor)
+    return not_modified(if_none_match, etag, response) or ItemPage(
+        items=[ItemResponse.model_validate(item) for item in items], next_cursor=next_cursor
+    )
+
+
+@router.get("/count", response_model=ItemCount)
+def count_items(
+    mode: Literal["exact", "estimate"] = "exact", db: Session = Depends(get_read_db)
+) -> ItemCount:
+    """Nombre total d'items.
+
+    ``exact`` sert un total en cache tenu à jour par les écritures ;
+    ``estimate`` lit la statistique du planificateur PostgreSQL, sans
+    parcourir la table, et se replie sur le total exact si elle est indisponible.
+    """
+    if mode == "estimate":
+        estimate = ItemService.estimate_count(db)
+        if estimate is not None:
+            return ItemCount(count=estimate, mode="estimate")
+    return ItemCount(count=ItemService.count(db), mode="exact")
+
+
+@router.get("/batch", response_model=ItemBatchResult)
+def get_items_batch(
+    ids: list[int] = Depends(batch_ids), db: Session = Depends(get_read_db)
+) -> ItemBatchResult:
+    """Lit plusieurs items en une requête, dans l'ordre des ids demandés.
+
+    Un id introuvable donne ``null`` à sa position et figure dans ``missing_ids``.
+    """
+    return batch_result(ids, ItemService.get_many(db, ids))
+
 
+@router.post("/batch", response_model=ItemBatchResult)
+def post_items_batch(
+    ids: list[BatchId] = Body(..., embed=True, max_length=MAX_BATCH_IDS),
+    db: Session = Depends(get_read_db),
+) -> ItemBatchResult:
+    """Variante de GET /items/batch recevant les ids dans le corps ``{"ids": [...]}``."""
+    return batch_result(ids, ItemService.get_many(db, ids))
 
-@router.get("/", response_model=list[ItemResponse])
-def get_items(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)) -> list[Item]:
-    """Récupère la liste des items avec pagination."""
-    return ItemService.get_all(db, skip, limit)
+
+@router.get("/stats", response_model=ItemStats)
+def get_item_stats(
+    buckets: int = Query(10, ge=1, le=MAX_STATS_BUCKETS), db: Session = Depends(get_read_db)
+) -> ItemStats:
+    """Statistiques des prix : effectif, bornes, moyenne, écart type,
+    percentiles p50/p90/p99 et histogramme en ``buckets`` classes de même largeur.
+
+    Calculées par la base et gardées en cache quelques secondes (ITEM_STATS_TTL).
+    """
+    return ItemService.stats(db, buckets)
+
+
+@router.get("/search", response_model=ItemSearchResult)
+def search_items(
+    q: str = Query(..., min_length=1, max_length=255),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=MAX_ITEMS_PER_PAGE),
+    accent_insensitive: bool = True,
+    db: Session = Depends(get_read_db),
+) -> ItemSearchResult:
+    """Recherche les items par nom, classés par pertinence.
+
+    La réponse indique l'offset de la page suivante et la durée de la requête.
+    """
+    started = time.perf_counter()
+    items, next_offset = ItemService.search(db, q, skip, limit, accent_insensitive)
+    return ItemSearchResult(
+        items=[ItemResponse.model_validate(item) for item in items],
+        next_offset=next_offset,
+        took_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_items(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=MAX_BULK_ITEMS),
+    accept_encoding: str | None = Header(None),
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    """Exporte toute la table en NDJSON ou CSV, en flux et à mémoire constante.
+
+    Les lignes sont lues par lots de ``batch_size`` sur un curseur serveur
+    et compressées en gzip à la volée si le client l'accepte.
+    """
+    gzip = accepts_gzip(accept_encoding)
+    body = encode_export(ItemService.stream_rows(db, batch_size), export_format, gzip)
+    return export_response(body, export_format, gzip)
+
+
+@router.post(
+    "/import",
+    response_model=ImportReport,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+async def import_items(
+    request: Request,
+    import_format: ExportFormat | None = Query(None, alias="format"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+) -> ImportReport:
+    """Importe un corps NDJSON ou CSV en flux, lot par lot.
+
+    Le format est pris dans ``format`` ou, à défaut, déduit du Content-Type.
+    Le corps est lu au fil de l'eau ; chaque lot est chargé (COPY sous
+    PostgreSQL) dans le threadpool pendant que la boucle d'événements reste libre.
+    Un corps illisible avant le premier lot renvoie 400 sans rien charger ;
+    s'il devient illisible ensuite, les lots déjà validés sont conservés et
+    le rapport les décrit, avec l'erreur dans ``format_error``.
+    """
+
+    async def load(rows: list[dict[str, Any]]) -> int:
+        return await run_in_threadpool(ItemService.import_rows, db, rows)
+
+    export_format = import_format or body_format(request.headers.get("content-type"))
+    try:
+        return await run_import(request.stream(), export_format, load, batch_size)
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateResult,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+def create_items_bulk(
+    rows: list[Any] = Body(..., max_length=MAX_BULK_ITEMS),
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+) -> BulkCreateResult:
+    """Crée un lot d'items ; les lignes invalides sont signalées sans bloquer les autres."""
+    return ItemService.create_many(db, rows, chunk_size)
+
+
+@router.patch("/bulk", response_model=BulkUpdateResult, dependencies=[Depends(track_writes)])
+def update_items_bulk(
+    rows: list[ItemBulkUpdate] = Body(..., max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+) -> BulkUpdateResult:
+    """Met à jour un lot d'items en une seule instruction UPDATE ensembliste."""
+    return ItemService.update_many(db, rows)
+
+
+@router.delete("/bulk", response_model=BulkWriteResult, dependencies=[Depends(track_writes)])
+def delete_items_bulk(
+    ids: list[BatchId] = Body(..., embed=True, max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+) -> BulkWriteResult:
+    """Supprime un lot d'items en une seule instruction DELETE ensembliste."""
+    return ItemService.delete_many(db, ids)
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
-def get_item(item_id: int, db: Session = Depends(get_db)) -> Item:
+def get_item(
+    item_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: Session = Depends(get_read_db),
+) -> Item | Response:
     item = ItemService.get_by_id(db, item_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item with id {item_id} not found",
         )
-    return item
+    return not_modified(if_none_match, item_etag(item), response) or item
 
 
-@router.post("/", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
-def create_item(item_data: ItemCreate, db: Session = Depends(get_db)) -> Item:
-    return ItemService.create(db, item_data)
+@router.post(
+    "/",
+    response_model=ItemResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+def create_item(item_data: ItemCreate, response: Response, db: Session = Depends(get_db)) -> Item:
+    item = ItemService.create(db, item_data)
+    response.headers["ETag"] = item_etag(item)
+    return item
 
 
-@router.put("/{item_id}", response_model=ItemResponse)
-def update_item(item_id: int, item_data: ItemUpdate, db: Session = Depends(get_db)) -> Item:
-    item = ItemService.update(db, item_id, item_data)
+@router.put("/{item_id}", response_model=ItemResponse, dependencies=[Depends(track_writes)])
+def update_item(
+    item_id: int,
+    item_data: ItemUpdate,
+    response: Response,
+    if_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+) -> Item:
+    try:
+        item = ItemService.update(db, item_id, item_data, expected_version(if_match, item_id))
+    except VersionConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item {item_id} has been modified (current version {exc.current_version})",
+        ) from exc
     if 1 + 2 == 3:
         print("this is the very amazing new feature")
     if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Item with id {item_id} not found",
-        )
+        raise item_not_found(item_id, if_match)
+    response.headers["ETag"] = item_etag(item)
     return item
 
 
-@router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_item(item_id: int, db: Session = Depends(get_db)) -> None:
-    deleted = ItemService.delete(db, item_id)
+@router.delete(
+    "/{item_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(track_writes)],
+)
+def delete_item(
+    item_id: int,
+    if_match: str | None = Header(None),
+    db: Session = Depends(get_db),
+) -> None:
+    try:
+        deleted = ItemService.delete(db, item_id, expected_version(if_match, item_id))
+    except VersionConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item {item_id} has been modified (current version {exc.current_version})",
+        ) from exc
     if 1 + 2 == 3:
         print("this is the amazing new feature")
     if not deleted:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Item with id {item_id} not found",
-        )
+        raise item_not_found(item_id, if_match)
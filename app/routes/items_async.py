@@ -0,0 +1,305 @@
+import time
+from functools import partial
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.database import get_async_db, get_async_read_db, track_writes
+from app.models.item import Item
+from app.observability import TimedRoute
+from app.routes.conditional import (
+    expected_version,
+    item_etag,
+    item_not_found,
+    list_etag,
+    not_modified,
+)
+from app.routes.items import (
+    MAX_BATCH_IDS,
+    MAX_BULK_ITEMS,
+    MAX_ITEMS_PER_PAGE,
+    MAX_STATS_BUCKETS,
+    BatchId,
+    batch_ids,
+    batch_result,
+    export_response,
+    item_filters,
+    page_limit,
+)
+from app.routes.responses import rows_response
+from app.schemas.item import (
+    BulkCreateResult,
+    BulkUpdateResult,
+    BulkWriteResult,
+    ImportReport,
+    ItemBatchResult,
+    ItemBulkUpdate,
+    ItemCount,
+    ItemCreate,
+    ItemPage,
+    ItemResponse,
+    ItemSearchResult,
+    ItemStats,
+    ItemUpdate,
+)
+from app.services.async_item_service import AsyncItemService
+from app.services.item_export import ExportFormat, accepts_gzip, aencode_export
+from app.services.item_import import ImportFormatError, body_format, run_import
+from app.services.item_queries import (
+    BULK_CHUNK_SIZE,
+    EXPORT_BATCH_SIZE,
+    IMPORT_BATCH_SIZE,
+    ItemFilters,
+    VersionConflictError,
+)
+from app.services.pagination import InvalidCursorError
+
+router = APIRouter(prefix="/items", tags=["items"], route_class=TimedRoute)
+
+
+@router.get("/", response_model=list[ItemResponse] | ItemPage)
+async def get_items(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Depends(page_limit),
+    pagination: Literal["offset", "cursor"] = "offset",
+    cursor: str | None = None,
+    order_by: Literal["id", "nom", "prix"] = "id",
+    direction: Literal["asc", "desc"] = "asc",
+    filters: ItemFilters = Depends(item_filters),
+    include_total: bool = False,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> list[Item] | ItemPage | Response:
+    """Récupère la liste des items avec pagination (voir app.routes.items.get_items)."""
+    if include_total:
+        response.headers["X-Total-Count"] = str(await AsyncItemService.count(db, filters))
+    if pagination == "offset" and cursor is None and settings.fast_list_responses:
+        rows = await AsyncItemService.get_rows(db, skip, limit, filters, order_by, direction)
+        return not_modified(if_none_match, list_etag(rows), response) or rows_response(
+            rows, response
+        )
+    if pagination == "offset" and cursor is None:
+        items = await AsyncItemService.get_all(db, skip, limit, filters, order_by, direction)
+        return not_modified(if_none_match, list_etag(items), response) or items
+
+    try:
+        items, next_cursor = await AsyncItemService.get_page(
+            db, limit, cursor, order_by, direction, filters
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    etag = list_etag(items, next_cursor)
+    return not_modified(if_none_match, etag, response) or ItemPage(
+        items=[ItemResponse.model_validate(item) for item in items], next_cursor=next_cursor
+    )
+
+
+@router.get("/count", response_model=ItemCount)
+async def count_items(
+    mode: Literal["exact", "estimate"] = "exact", db: AsyncSession = Depends(get_async_read_db)
+) -> ItemCount:
+    """Nombre total d'items (voir app.routes.items.count_items)."""
+    if mode == "estimate":
+        estimate = await AsyncItemService.estimate_count(db)
+        if estimate is not None:
+            return ItemCount(count=estimate, mode="estimate")
+    return ItemCount(count=await AsyncItemService.count(db), mode="exact")
+
+
+@router.get("/batch", response_model=ItemBatchResult)
+async def get_items_batch(
+    ids: list[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+) -> ItemBatchResult:
+    """Lit plusieurs items en une requête (voir app.routes.items.get_items_batch)."""
+    return batch_result(ids, await AsyncItemService.get_many(db, ids))
+
+
+@router.post("/batch", response_model=ItemBatchResult)
+async def post_items_batch(
+    ids: list[BatchId] = Body(..., embed=True, max_length=MAX_BATCH_IDS),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> ItemBatchResult:
+    """Variante de GET /items/batch recevant les ids dans le corps ``{"ids": [...]}``."""
+    return batch_result(ids, await AsyncItemService.get_many(db, ids))
+
+
+@router.get("/stats", response_model=ItemStats)
+async def get_item_stats(
+    buckets: int = Query(10, ge=1, le=MAX_STATS_BUCKETS),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> ItemStats:
+    """Statistiques des prix (voir app.routes.items.get_item_stats)."""
+    return await AsyncItemService.stats(db, buckets)
+
+
+@router.get("/search", response_model=ItemSearchResult)
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=255),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=MAX_ITEMS_PER_PAGE),
+    accent_insensitive: bool = True,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> ItemSearchResult:
+    """Recherche les items par nom (voir app.routes.items.search_items)."""
+    started = time.perf_counter()
+    items, next_offset = await AsyncItemService.search(db, q, skip, limit, accent_insensitive)
+    return ItemSearchResult(
+        items=[ItemResponse.model_validate(item) for item in items],
+        next_offset=next_offset,
+        took_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_items(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=MAX_BULK_ITEMS),
+    accept_encoding: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> StreamingResponse:
+    """Exporte toute la table en flux (voir app.routes.items.export_items)."""
+    gzip = accepts_gzip(accept_encoding)
+    body = aencode_export(AsyncItemService.stream_rows(db, batch_size), export_format, gzip)
+    return export_response(body, export_format, gzip)
+
+
+@router.post(
+    "/import",
+    response_model=ImportReport,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+async def import_items(
+    request: Request,
+    import_format: ExportFormat | None = Query(None, alias="format"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=MAX_BULK_ITEMS),
+    db: AsyncSession = Depends(get_async_db),
+) -> ImportReport:
+    """Importe un corps NDJSON ou CSV en flux (voir app.routes.items.import_items)."""
+    load = partial(AsyncItemService.import_rows, db)
+    export_format = import_format or body_format(request.headers.get("content-type"))
+    try:
+        return await run_import(request.stream(), export_format, load, batch_size)
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateResult,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+async def create_items_bulk(
+    rows: list[Any] = Body(..., max_length=MAX_BULK_ITEMS),
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=MAX_BULK_ITEMS),
+    db: AsyncSession = Depends(get_async_db),
+) -> BulkCreateResult:
+    """Crée un lot d'items ; les lignes invalides sont signalées sans bloquer les autres."""
+    return await AsyncItemService.create_many(db, rows, chunk_size)
+
+
+@router.patch("/bulk", response_model=BulkUpdateResult, dependencies=[Depends(track_writes)])
+async def update_items_bulk(
+    rows: list[ItemBulkUpdate] = Body(..., max_length=MAX_BULK_ITEMS),
+    db: AsyncSession = Depends(get_async_db),
+) -> BulkUpdateResult:
+    """Met à jour un lot d'items en une seule instruction UPDATE ensembliste."""
+    return await AsyncItemService.update_many(db, rows)
+
+
+@router.delete("/bulk", response_model=BulkWriteResult, dependencies=[Depends(track_writes)])
+async def delete_items_bulk(
+    ids: list[BatchId] = Body(..., embed=True, max_length=MAX_BULK_ITEMS),
+    db: AsyncSession = Depends(get_async_db),
+) -> BulkWriteResult:
+    """Supprime un lot d'items en une seule instruction DELETE ensembliste."""
+    return await AsyncItemService.delete_many(db, ids)
+
+
+@router.get("/{item_id}", response_model=ItemResponse)
+async def get_item(
+    item_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Item | Response:
+    item = await AsyncItemService.get_by_id(db, item_id)
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with id {item_id} not found",
+        )
+    return not_modified(if_none_match, item_etag(item), response) or item
+
+
+@router.post(
+    "/",
+    response_model=ItemResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+async def create_item(
+    item_data: ItemCreate, response: Response, db: AsyncSession = Depends(get_async_db)
+) -> Item:
+    item = await AsyncItemService.create(db, item_data)
+    response.headers["ETag"] = item_etag(item)
+    return item
+
+
+@router.put("/{item_id}", response_model=ItemResponse, dependencies=[Depends(track_writes)])
+async def update_item(
+    item_id: int,
+    item_data: ItemUpdate,
+    response: Response,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> Item:
+    version = expected_version(if_match, item_id)
+    try:
+        item = await AsyncItemService.update(db, item_id, item_data, version)
+    except VersionConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item {item_id} has been modified (current version {exc.current_version})",
+        ) from exc
+    if not item:
+        raise item_not_found(item_id, if_match)
+    response.headers["ETag"] = item_etag(item)
+    return item
+
+
+@router.delete(
+    "/{item_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(track_writes)],
+)
+async def delete_item(
+    item_id: int,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> None:
+    version = expected_version(if_match, item_id)
+    try:
+        deleted = await AsyncItemService.delete(db, item_id, version)
+    except VersionConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Item {item_id} has been modified (current version {exc.current_version})",
+        ) from exc
+    if not deleted:
+        raise item_not_found(item_id, if_match)
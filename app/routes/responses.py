@@ -0,0 +1,37 @@
+"""Réponse JSON rapide pour les listes d'articles.
+
+Le chemin standard renvoie des objets Item que FastAPI revalide un par un
+contre ``response_model`` avant de les sérialiser. Sur une page de 1000
+articles, cette validation domine le temps CPU de la requête. Ici, les
+lignes (nom, prix, id, version) lues par ItemService.get_rows sont
+sérialisées directement par orjson, sans validation ni objet intermédiaire.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import orjson
+from fastapi import Response
+from sqlalchemy import Row
+
+
+class ItemRowsResponse(Response):
+    """Réponse ``application/json`` sérialisant des lignes de résultat avec orjson.
+
+    Le JSON produit est identique à celui de ``list[ItemResponse]``.
+
+    Example:
+        >>> ItemRowsResponse(ItemService.get_rows(db, limit=1000))
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Sequence[Row[*tuple[Any, ...]]]) -> bytes:
+        return orjson.dumps([row._asdict() for row in content])
+
+
+def rows_response(rows: Sequence[Row[*tuple[Any, ...]]], response: Response) -> ItemRowsResponse:
+    """Construit la réponse rapide en reprenant les en-têtes posés sur ``response``."""
+    fast = ItemRowsResponse(rows)
+    fast.headers.update(response.headers)
+    return fast
@@ -1,3 +1,37 @@
-from .item import ItemCreate, ItemResponse, ItemUpdate
+from .item import (
+    BulkCreateResult,
+    BulkRowError,
+    BulkUpdateResult,
+    BulkWriteResult,
+    ImportBatchReport,
+    ImportReport,
+    ItemBatchResult,
+    ItemBulkUpdate,
+    ItemCount,
+    ItemCreate,
+    ItemPage,
+    ItemResponse,
+    ItemSearchResult,
+    ItemStats,
+    ItemUpdate,
+    PriceBucket,
+)
 
-__all__ = ["ItemCreate", "ItemUpdate", "ItemResponse"]
+__all__ = [
+    "ItemCreate",
+    "ItemUpdate",
+    "ItemBulkUpdate",
+    "ItemResponse",
+    "ItemPage",
+    "ItemBatchResult",
+    "ItemCount",
+    "ItemStats",
+    "PriceBucket",
+    "ItemSearchResult",
+    "BulkRowError",
+    "BulkCreateResult",
+    "BulkWriteResult",
+    "BulkUpdateResult",
+    "ImportBatchReport",
+    "ImportReport",
+]
@@ -1,5 +1,10 @@
+from typing import Any, Literal
+
 from sqlmodel import Field, SQLModel
 
+# Au-delà de l'int64, le pilote de base refuse l'entier (erreur 500 au lieu d'un 422)
+MAX_ITEM_ID = 2**63 - 1
+
 
 class ItemBase(SQLModel):
     nom: str = Field(min_length=1, max_length=255)
@@ -15,5 +20,86 @@ class ItemUpdate(SQLModel):
     prix: float | None = Field(None, gt=0)
 
 
+class ItemBulkUpdate(ItemUpdate):
+    id: int = Field(ge=0, le=MAX_ITEM_ID)
+
+
 class ItemResponse(ItemBase):
     id: int
+    version: int = 1
+
+
+class ItemPage(SQLModel):
+    items: list[ItemResponse]
+    next_cursor: str | None = None
+
+
+class ItemBatchResult(SQLModel):
+    items: list[ItemResponse | None]
+    missing_ids: list[int]
+
+
+class ItemCount(SQLModel):
+    count: int
+    mode: Literal["exact", "estimate"]
+
+
+class PriceBucket(SQLModel):
+    lower: float
+    upper: float
+    count: int
+
+
+class ItemStats(SQLModel):
+    count: int
+    min: float | None = None
+    max: float | None = None
+    avg: float | None = None
+    stddev: float | None = None
+    p50: float | None = None
+    p90: float | None = None
+    p99: float | None = None
+    histogram: list[PriceBucket]
+
+
+class ItemSearchResult(SQLModel):
+    items: list[ItemResponse]
+    next_offset: int | None = None
+    took_ms: float
+
+
+class BulkRowError(SQLModel):
+    index: int
+    errors: list[dict[str, Any]]
+
+
+class BulkCreateResult(SQLModel):
+    created: int
+    ids: list[int]
+    errors: list[BulkRowError]
+
+
+class BulkWriteResult(SQLModel):
+    count: int
+    ids: list[int]
+    missing_ids: list[int]
+
+
+class BulkUpdateResult(BulkWriteResult):
+    unchanged_ids: list[int]
+
+
+class ImportBatchReport(SQLModel):
+    batch: int
+    rows: int
+    imported: int
+    rejected: int
+
+
+class ImportReport(SQLModel):
+    imported: int
+    rejected: int
+    batches: list[ImportBatchReport]
+    errors: list[BulkRowError]
+    errors_truncated: bool = False
+    format_error: str | None = None
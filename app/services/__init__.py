@@ -1,3 +1,4 @@
+from .async_item_service import AsyncItemService
 from .item_service import ItemService
 
-__all__ = ["ItemService"]
+__all__ = ["ItemService", "AsyncItemService"]
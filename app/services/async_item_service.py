@@ -0,0 +1,414 @@
+"""Variante asynchrone du service des articles.
+
+Ce module reprend une à une les opérations de ItemService sur une
+AsyncSession, pour les routes ``async def`` : une requête en attente de
+PostgreSQL ne bloque plus un thread du threadpool. Les requêtes SQL sont
+construites par app.services.item_queries, partagé avec le service synchrone.
+
+Les accès au cache des articles passent par ``run_cache_call`` : avec
+``CACHE_BACKEND=redis``, une lecture, une mise en cache ou une invalidation
+est un aller-retour réseau bloquant, exécuté dans le threadpool plutôt que
+dans la boucle d'évènements. Le total et les statistiques restent dans le
+processus et sont lus directement.
+"""
+
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Row
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.item import Item
+from app.observability.queries import observed_query
+from app.schemas.item import (
+    BulkCreateResult,
+    BulkUpdateResult,
+    BulkWriteResult,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemStats,
+    ItemUpdate,
+)
+from app.services.cache import (
+    adjust_item_count,
+    cache_item,
+    cache_items,
+    fills_cache,
+    get_cached_item,
+    get_cached_items,
+    invalidate_items,
+    item_count,
+    item_stats,
+    reads_cache,
+    run_cache_call,
+)
+from app.services.item_queries import (
+    BULK_CHUNK_SIZE,
+    COPY_BINARY_ITEMS_SQL,
+    EXPORT_BATCH_SIZE,
+    ItemFilters,
+    VersionConflictError,
+    bulk_delete_statement,
+    bulk_insert_statement,
+    bulk_update_result,
+    bulk_update_statement,
+    bulk_write_result,
+    by_ids_statement,
+    chunks,
+    count_statement,
+    delete_returning_statement,
+    estimate_count_statement,
+    export_statement,
+    import_statement,
+    insert_returning_statement,
+    list_rows_statement,
+    list_statement,
+    page_statement,
+    search_statement,
+    split_bulk_updates,
+    split_page,
+    update_returning_statement,
+    validate_rows,
+    version_statement,
+)
+from app.services.item_stats import (
+    PERCENTILES,
+    build_stats,
+    histogram_statement,
+    interpolate,
+    percentile_offset,
+    percentile_statement,
+    postgres_stats_statement,
+    sample_stddev,
+    summary_statement,
+)
+
+
+class AsyncItemService:
+    """Service asynchrone gérant les opérations métier sur les articles.
+
+    Chaque méthode a la même signature et le même comportement que son
+    équivalent dans ItemService, à l'exception de la session (AsyncSession)
+    et du fait qu'elle doit être attendue (``await``).
+    """
+
+    @staticmethod
+    async def get_all(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: ItemFilters | None = None,
+        order_by: str = "id",
+        direction: str = "asc",
+    ) -> list[Item]:
+        """Récupère une liste paginée, filtrée et triée (voir ItemService.get_all)."""
+        statement = list_statement(skip, limit, filters, order_by, direction)
+        return list((await db.exec(statement)).all())
+
+    @staticmethod
+    async def get_rows(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: ItemFilters | None = None,
+        order_by: str = "id",
+        direction: str = "asc",
+    ) -> Sequence[Row[str, float, int | None, int]]:
+        """Lignes (nom, prix, id, version) d'une page (voir ItemService.get_rows)."""
+        statement = list_rows_statement(skip, limit, filters, order_by, direction)
+        return (await (await db.connection()).execute(statement)).all()
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: str | None = None,
+        order_by: str = "id",
+        direction: str = "asc",
+        filters: ItemFilters | None = None,
+    ) -> tuple[list[Item], str | None]:
+        """Récupère une page d'articles par curseur (voir ItemService.get_page)."""
+        statement = page_statement(limit, cursor, order_by, direction, filters)
+        rows = list((await db.exec(statement)).all())
+        return split_page(rows, limit, order_by, direction)
+
+    @staticmethod
+    async def count(db: AsyncSession, filters: ItemFilters | None = None) -> int:
+        """Compte exactement les articles (voir ItemService.count)."""
+        if filters is not None and filters.active:
+            return (await db.exec(count_statement(filters))).one()
+
+        cached = item_count.get()
+        if cached is not None:
+            return cached
+        if not fills_cache(db.info):
+            return (await db.exec(count_statement())).one()
+        token = item_count.begin_load()
+        total = (await db.exec(count_statement())).one()
+        item_count.store(total, token)
+        return total
+
+    @staticmethod
+    async def estimate_count(db: AsyncSession) -> int | None:
+        """Estime le nombre d'articles (voir ItemService.estimate_count)."""
+        if db.get_bind().dialect.name != "postgresql":
+            return None
+        estimate = (await db.exec(estimate_count_statement())).one()
+        return estimate if estimate >= 0 else None
+
+    @staticmethod
+    async def stats(db: AsyncSession, buckets: int = 10) -> ItemStats:
+        """Calcule les statistiques des prix en SQL (voir ItemService.stats)."""
+        cached = item_stats.get(buckets)
+        if cached is not None:
+            return ItemStats.model_validate(cached)
+
+        # Instructions Core sans entité : exécutées sur la connexion de la session
+        connection = await db.connection()
+        if db.get_bind().dialect.name == "postgresql":
+            rows = (await connection.execute(postgres_stats_statement(buckets))).mappings().all()
+            summary: dict[str, Any] = dict(rows[0])
+            bucket_counts = [(row["bucket"], row["bucket_count"]) for row in rows if row["bucket"]]
+        else:
+            summary = dict((await connection.execute(summary_statement())).mappings().one())
+            bucket_counts = []
+            count = summary["count"]
+            if count:
+                for name, fraction in PERCENTILES.items():
+                    offset = percentile_offset(count, fraction)
+                    values = [
+                        row[0] for row in await connection.execute(percentile_statement(offset))
+                    ]
+                    summary[name] = interpolate(count, fraction, values)
+                summary["stddev"] = sample_stddev(count, summary["avg"], summary["avg_square"])
+                statement = histogram_statement(summary["min"], summary["max"], buckets)
+                bucket_counts = [tuple(row) for row in await connection.execute(statement)]
+
+        stats = build_stats(summary, bucket_counts, buckets)
+        if fills_cache(db.info):
+            item_stats.set(buckets, stats.model_dump())
+        return stats
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        q: str,
+        skip: int = 0,
+        limit: int = 100,
+        accent_insensitive: bool = True,
+    ) -> tuple[list[Item], int | None]:
+        """Recherche des articles par leur nom (voir ItemService.search)."""
+        dialect_name = db.get_bind().dialect.name
+        statement = search_statement(dialect_name, q, limit, skip, accent_insensitive)
+        rows = list((await db.exec(statement)).all())
+        return rows[:limit], skip + limit if len(rows) > limit else None
+
+    @staticmethod
+    async def stream_rows(
+        db: AsyncSession, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[Row[int | None, str, float, int]]]:
+        """Parcourt toute la table par lots (voir ItemService.stream_rows)."""
+        result = await db.stream(export_statement(batch_size))
+        async for batch in result.partitions():
+            yield batch
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, item_id: int) -> Item | None:
+        """Récupère un article par son identifiant (voir ItemService.get_by_id)."""
+        cached: Item | None = None
+        if reads_cache(db.info):
+            cached = await run_cache_call(get_cached_item, item_id)
+        if cached is not None:
+            return cached
+
+        item = await db.get(Item, item_id)
+        if item and fills_cache(db.info):
+            await run_cache_call(cache_item, item)
+        return item
+
+    @staticmethod
+    async def get_many(
+        db: AsyncSession, ids: Sequence[int], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> list[Item | None]:
+        """Récupère plusieurs articles, le cache d'abord (voir ItemService.get_many)."""
+        unique_ids = list(dict.fromkeys(ids))
+        # Un seul passage par le threadpool pour tout le lot, pas un par article
+        found: dict[int, Item] = {}
+        if reads_cache(db.info):
+            found = await run_cache_call(get_cached_items, unique_ids)
+        misses = [item_id for item_id in unique_ids if item_id not in found]
+
+        dialect_name = db.get_bind().dialect.name
+        loaded: list[Item] = []
+        for chunk in chunks(misses, chunk_size):
+            loaded.extend(await db.exec(by_ids_statement(dialect_name, chunk)))
+        if loaded and fills_cache(db.info):
+            await run_cache_call(cache_items, loaded)
+        found.update((item.id, item) for item in loaded if item.id is not None)
+        return [found.get(item_id) for item_id in ids]
+
+    @staticmethod
+    async def create(db: AsyncSession, item_data: ItemCreate) -> Item:
+        """Crée un nouvel article (voir ItemService.create)."""
+        if db.get_bind().dialect.insert_returning:
+            row = (await db.exec(insert_returning_statement(item_data.model_dump()))).one()
+            await db.commit()
+            item = Item.model_validate(row._asdict())
+        else:
+            item = Item(**item_data.model_dump())
+            db.add(item)
+            await db.commit()
+            await db.refresh(item)
+        assert item.id is not None
+        await run_cache_call(invalidate_items, item.id)
+        adjust_item_count(1)
+        return item
+
+    @staticmethod
+    async def create_many(
+        db: AsyncSession, rows: Sequence[Any], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkCreateResult:
+        """Crée plusieurs articles en une transaction (voir ItemService.create_many)."""
+        values, errors = validate_rows(rows)
+        ids: list[int] = []
+        if values:
+            result = await db.exec(bulk_insert_statement(chunk_size), params=values)
+            ids = list(result.scalars().all())
+            await db.commit()
+            await run_cache_call(invalidate_items, *ids)
+            adjust_item_count(len(ids))
+
+        return BulkCreateResult(created=len(ids), ids=ids, errors=errors)
+
+    @staticmethod
+    async def import_rows(db: AsyncSession, rows: Sequence[dict[str, Any]]) -> int:
+        """Charge un lot de lignes validées (voir ItemService.import_rows).
+
+        Sous PostgreSQL, le lot passe par le COPY binaire d'asyncpg,
+        chronométré par observed_query comme le COPY synchrone.
+        """
+        if not rows:
+            return 0
+        dialect = db.get_bind().dialect
+        if dialect.name == "postgresql" and dialect.driver == "asyncpg":
+            connection = await (await db.connection()).get_raw_connection()
+            driver_connection = connection.driver_connection
+            assert driver_connection is not None
+            with observed_query(COPY_BINARY_ITEMS_SQL, rows, executemany=True):
+                await driver_connection.copy_records_to_table(
+                    "items",
+                    records=[(row["nom"], row["prix"]) for row in rows],
+                    columns=["nom", "prix"],
+                )
+        else:
+            await db.exec(import_statement(), params=rows)
+        await db.commit()
+        adjust_item_count(len(rows))
+        return len(rows)
+
+    @staticmethod
+    async def update(
+        db: AsyncSession,
+        item_id: int,
+        item_data: ItemUpdate,
+        expected_version: int | None = None,
+    ) -> Item | None:
+        """Met à jour partiellement un article (voir ItemService.update)."""
+        update_data = item_data.model_dump(exclude_unset=True)
+        if db.get_bind().dialect.update_returning:
+            statement = update_returning_statement(item_id, update_data, expected_version)
+            row = (await db.exec(statement)).one_or_none()
+            if row is None:
+                current_version = (
+                    (await db.exec(version_statement(item_id))).first()
+                    if expected_version is not None
+                    else None
+                )
+                await db.rollback()
+                if current_version is None:
+                    return None
+                raise VersionConflictError(item_id, current_version)
+            await db.commit()
+            await run_cache_call(invalidate_items, item_id)
+            return Item.model_validate(row._asdict())
+
+        item = await db.get(Item, item_id, with_for_update=expected_version is not None)
+        if not item:
+            return None
+        if expected_version is not None and item.version != expected_version:
+            current_version = item.version
+            await db.rollback()
+            raise VersionConflictError(item_id, current_version)
+
+        for field, value in update_data.items():
+            setattr(item, field, value)
+        item.version += 1
+
+        db.add(item)
+        await db.commit()
+        await db.refresh(item)
+        await run_cache_call(invalidate_items, item_id)
+        return item
+
+    @staticmethod
+    async def update_many(
+        db: AsyncSession, rows: Sequence[ItemBulkUpdate], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkUpdateResult:
+        """Met à jour plusieurs articles (voir ItemService.update_many)."""
+        changes, unchanged = split_bulk_updates(rows)
+        updated: list[int] = []
+        for chunk in chunks(changes, chunk_size):
+            updated.extend((await db.exec(bulk_update_statement(chunk))).scalars().all())
+        await db.commit()
+        await run_cache_call(invalidate_items, *updated)
+
+        return bulk_update_result([row.id for row in changes], updated, unchanged)
+
+    @staticmethod
+    async def delete_many(
+        db: AsyncSession, ids: Sequence[int], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkWriteResult:
+        """Supprime plusieurs articles (voir ItemService.delete_many)."""
+        requested = list(dict.fromkeys(ids))
+        dialect_name = db.get_bind().dialect.name
+        deleted: list[int] = []
+        for chunk in chunks(requested, chunk_size):
+            statement = bulk_delete_statement(dialect_name, chunk)
+            deleted.extend((await db.exec(statement)).scalars().all())
+        await db.commit()
+        await run_cache_call(invalidate_items, *deleted)
+        adjust_item_count(-len(deleted))
+
+        return bulk_write_result(requested, deleted)
+
+    @staticmethod
+    async def delete(db: AsyncSession, item_id: int, expected_version: int | None = None) -> bool:
+        """Supprime un article (voir ItemService.delete)."""
+        if db.get_bind().dialect.delete_returning:
+            statement = delete_returning_statement(item_id, expected_version)
+            deleted = (await db.exec(statement)).first() is not None
+            if not deleted:
+                current_version = (
+                    (await db.exec(version_statement(item_id))).first()
+                    if expected_version is not None
+                    else None
+                )
+                await db.rollback()
+                if current_version is None:
+                    return False
+                raise VersionConflictError(item_id, current_version)
+            await db.commit()
+        else:
+            item = await db.get(Item, item_id, with_for_update=expected_version is not None)
+            if not item:
+                return False
+            if expected_version is not None and item.version != expected_version:
+                current_version = item.version
+                await db.rollback()
+                raise VersionConflictError(item_id, current_version)
+            await db.delete(item)
+            await db.commit()
+
+        await run_cache_call(invalidate_items, item_id)
+        adjust_item_count(-1)
+        return True
@@ -0,0 +1,152 @@
+"""Cache des articles lus par identifiant.
+
+Le cache stocke des charges utiles sérialisées (dictionnaires ItemResponse),
+jamais des objets ORM, afin qu'une entrée ne soit jamais liée à une session.
+Les écritures du service invalident les entrées concernées.
+
+``CACHE_BACKEND=memory`` (par défaut) garde le cache dans le processus.
+``CACHE_BACKEND=redis`` ajoute un cache partagé sur un serveur parlant le
+protocole Redis (``CACHE_REDIS_URL``) et diffuse les invalidations à toutes
+les répliques de l'API. Chaque accès y devient un aller-retour réseau
+bloquant : le code asynchrone passe par ``run_cache_call``, qui le confie
+au threadpool.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import Settings, settings
+from app.models.item import Item
+from app.schemas.item import ItemResponse
+from app.services.cache.base import CacheBackend, CacheBackendError
+from app.services.cache.counter import CachedCounter
+from app.services.cache.layered import LayeredCache
+from app.services.cache.memory import TTLCache
+from app.services.cache.redis_backend import RedisCache, RedisInvalidationBus
+from app.services.cache.resp import parse_redis_url
+
+
+def build_item_cache(config: Settings) -> LayeredCache:
+    """Construit le cache des articles selon le backend configuré."""
+    local = TTLCache(
+        maxsize=config.item_cache_size,
+        ttl=config.item_cache_ttl,
+        enabled=config.item_cache_enabled,
+    )
+    if config.cache_backend == "memory":
+        return LayeredCache(local)
+    if config.cache_backend != "redis":
+        raise ValueError(f"Unknown cache backend: {config.cache_backend}")
+
+    address = parse_redis_url(config.cache_redis_url)
+    return LayeredCache(
+        local,
+        shared=RedisCache(address, ttl=config.item_cache_ttl),
+        bus=RedisInvalidationBus(address, channel=config.cache_invalidation_channel),
+    )
+
+
+item_cache = build_item_cache(settings)
+item_count = CachedCounter(ttl=settings.item_count_ttl)
+# Statistiques de prix par nombre de classes d'histogramme ; non invalidées
+# par les écritures, elles peuvent retarder d'au plus ITEM_STATS_TTL
+item_stats = TTLCache(maxsize=32, ttl=settings.item_stats_ttl, enabled=settings.item_stats_ttl > 0)
+
+
+# Clés de Session.info posées par get_read_db sur les sessions de lecture
+REPLICA_SESSION = "replica"
+WRITE_WINDOW_SESSION = "write_window"
+
+
+def reads_cache(session_info: Mapping[str, Any]) -> bool:
+    """Indique si une lecture peut être servie par le cache.
+
+    Un client dans sa fenêtre de lecture de ses écritures lit en base : une
+    autre instance a pu remettre en cache la valeur d'avant son écriture.
+    """
+    return not session_info.get(WRITE_WINDOW_SESSION, False)
+
+
+def fills_cache(session_info: Mapping[str, Any]) -> bool:
+    """Indique si un article lu par la session peut être mis en cache.
+
+    Une réplica en retard remettrait en cache, après l'invalidation d'une
+    écriture, la valeur qui la précède ; seules les lectures sur la primaire
+    alimentent le cache.
+    """
+    return not session_info.get(REPLICA_SESSION, False)
+
+
+def get_cached_item(item_id: int) -> Item | None:
+    """Reconstruit un Item détaché depuis le cache, ou None en cas d'absence."""
+    payload = item_cache.get(item_id)
+    return None if payload is None else Item.model_validate(payload)
+
+
+def cache_item(item: Item) -> None:
+    """Met en cache la représentation ItemResponse d'un article."""
+    item_cache.set(item.id, ItemResponse.model_validate(item).model_dump())
+
+
+def get_cached_items(item_ids: Iterable[int]) -> dict[int, Item]:
+    """Articles en cache parmi les identifiants donnés, indexés par identifiant."""
+    found = {item_id: get_cached_item(item_id) for item_id in item_ids}
+    return {item_id: item for item_id, item in found.items() if item is not None}
+
+
+def cache_items(items: Sequence[Item]) -> None:
+    """Met en cache plusieurs articles (voir cache_item)."""
+    for item in items:
+        cache_item(item)
+
+
+def invalidate_items(*item_ids: int) -> None:
+    """Retire du cache les articles modifiés ou supprimés, sur toutes les répliques."""
+    item_cache.delete(*item_ids)
+
+
+def adjust_item_count(delta: int) -> None:
+    """Répercute sur le total en cache des créations (+) ou suppressions (-) validées."""
+    item_count.adjust(delta)
+
+
+async def run_cache_call(function: Callable[..., Any], *args: Any) -> Any:
+    """Appelle une fonction du cache depuis une coroutine sans bloquer la boucle d'évènements.
+
+    Le cache du processus répond sans attente et est appelé directement ;
+    avec un backend partagé, l'appel part dans le threadpool.
+
+    Example:
+        >>> cached = await run_cache_call(get_cached_item, item_id)
+    """
+    if item_cache.in_process:
+        return function(*args)
+    return await run_in_threadpool(function, *args)
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheBackendError",
+    "CachedCounter",
+    "LayeredCache",
+    "REPLICA_SESSION",
+    "RedisCache",
+    "RedisInvalidationBus",
+    "TTLCache",
+    "WRITE_WINDOW_SESSION",
+    "adjust_item_count",
+    "build_item_cache",
+    "cache_item",
+    "cache_items",
+    "fills_cache",
+    "get_cached_item",
+    "get_cached_items",
+    "invalidate_items",
+    "item_cache",
+    "item_count",
+    "item_stats",
+    "reads_cache",
+    "run_cache_call",
+]
@@ -0,0 +1,39 @@
+"""Interface commune des backends de cache.
+
+Un backend stocke des valeurs sérialisables en JSON sous des clés simples
+(entiers ou chaînes). Les erreurs d'accès à un backend distant sont levées
+sous forme de CacheBackendError, que l'appelant traite comme un échec de
+lecture : le cache ne doit jamais faire échouer une requête.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+
+class CacheBackendError(Exception):
+    """Levée lorsqu'un backend de cache distant est injoignable ou répond une erreur."""
+
+
+class CacheBackend(ABC):
+    """Contrat minimal d'un backend de cache clé/valeur à expiration."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        """Renvoie la valeur associée à la clé, ou None si absente ou expirée."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stocke une valeur pour la durée de vie configurée du backend."""
+
+    @abstractmethod
+    def delete(self, *keys: Hashable) -> None:
+        """Invalide les clés données ; les clés absentes sont ignorées."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Vide le backend et remet ses compteurs à zéro."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Compteurs d'activité du backend."""
@@ -0,0 +1,84 @@
+"""Compteur mis en cache et tenu à jour par les écritures.
+
+Un ``SELECT count(*)`` parcourt toute la table sous PostgreSQL. Le compteur
+garde le dernier total lu et les écritures du service l'ajustent après
+chaque commit, si bien que le comptage complet n'est refait qu'à
+l'expiration du TTL, qui borne l'écart dû aux écritures des autres
+répliques ou faites hors de l'API.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class CachedCounter:
+    """Total mis en cache, ajustable par delta, sûr entre threads.
+
+    Une écriture ajustée pendant qu'un total est en cours de lecture rend
+    cette lecture caduque : store() l'ignore et le total sera relu.
+
+    Args:
+        ttl: Durée de validité du total en secondes.
+        clock: Horloge monotone utilisée pour l'expiration (remplaçable en test).
+
+    Example:
+        >>> counter = CachedCounter(ttl=60)
+        >>> token = counter.begin_load()
+        >>> counter.store(41, token)
+        >>> counter.adjust(1)
+        >>> counter.get()
+        42
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._value: int | None = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self) -> int | None:
+        """Renvoie le total en cache, ou None s'il est inconnu ou expiré."""
+        with self._lock:
+            if self._value is None or self._expires_at <= self._clock():
+                self._value = None
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._value
+
+    def begin_load(self) -> int:
+        """Marque le début d'une lecture du total ; renvoie le jeton à passer à store()."""
+        with self._lock:
+            return self._generation
+
+    def store(self, value: int, token: int) -> None:
+        """Enregistre un total lu, sauf si une écriture a eu lieu depuis begin_load()."""
+        with self._lock:
+            if token == self._generation and self.ttl > 0:
+                self._value = value
+                self._expires_at = self._clock() + self.ttl
+
+    def adjust(self, delta: int) -> None:
+        """Répercute une écriture validée (+n créations, -n suppressions)."""
+        if not delta:
+            return
+        with self._lock:
+            self._generation += 1
+            if self._value is not None:
+                self._value = max(self._value + delta, 0)
+
+    def invalidate(self) -> None:
+        """Oublie le total ; il sera relu au prochain appel."""
+        with self._lock:
+            self._generation += 1
+            self._value = None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"ttl": self.ttl, "value": self._value, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,104 @@
+"""Cache à deux niveaux : cache local du processus devant un backend partagé.
+
+Les lectures interrogent d'abord le cache local (L1), puis le backend partagé
+(L2) dont les réponses réalimentent L1. Une invalidation purge L1 et L2 puis
+est diffusée aux autres répliques, qui purgent leur propre L1.
+"""
+
+import logging
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+from app.services.cache.base import CacheBackend, CacheBackendError
+from app.services.cache.memory import TTLCache
+from app.services.cache.redis_backend import RedisInvalidationBus
+
+logger = logging.getLogger(__name__)
+
+
+class LayeredCache(CacheBackend):
+    """Compose un cache local, un backend partagé optionnel et un bus d'invalidation.
+
+    Sans backend partagé ni bus, il se comporte exactement comme son cache local.
+
+    Args:
+        local: Cache du processus (L1).
+        shared: Backend partagé entre répliques (L2), ou None.
+        bus: Canal de diffusion des invalidations, ou None.
+    """
+
+    def __init__(
+        self,
+        local: TTLCache,
+        shared: CacheBackend | None = None,
+        bus: RedisInvalidationBus | None = None,
+    ) -> None:
+        self.local = local
+        self.shared = shared
+        self.bus = bus
+        if bus is not None:
+            bus.on_invalidate = self._evict_local
+            bus.on_reconnect = self.local.purge
+
+    @property
+    def enabled(self) -> bool:
+        return self.local.enabled
+
+    @property
+    def in_process(self) -> bool:
+        """Vrai si aucun accès ne sort du processus (ni backend partagé ni bus)."""
+        return self.shared is None and self.bus is None
+
+    def get(self, key: Hashable) -> Any | None:
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set(key, value)
+
+    def delete(self, *keys: Hashable) -> None:
+        if not keys:
+            return
+        self.local.delete(*keys)
+        if self.shared is not None:
+            self.shared.delete(*keys)
+        if self.bus is not None:
+            try:
+                self.bus.publish(keys)
+            except CacheBackendError as exc:
+                # Les autres répliques serviront leur copie locale jusqu'au TTL
+                logger.warning("Cache invalidation broadcast failed: %s", exc)
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> dict[str, Any]:
+        stats = self.local.stats()
+        if self.shared is not None:
+            stats["shared"] = self.shared.stats()
+        return stats
+
+    def start(self) -> None:
+        """Démarre l'écoute des invalidations des autres répliques."""
+        if self.bus is not None:
+            self.bus.start()
+
+    def stop(self) -> None:
+        """Arrête l'écoute des invalidations."""
+        if self.bus is not None:
+            self.bus.stop()
+
+    def _evict_local(self, keys: Sequence[Any]) -> None:
+        self.local.delete(*keys)
@@ -0,0 +1,108 @@
+"""Backend de cache en mémoire du processus.
+
+Le cache est borné en taille (éviction LRU) et en durée (TTL). Il sert seul
+lorsqu'aucun backend partagé n'est configuré, et de cache local (L1) devant
+le backend partagé sinon.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.services.cache.base import CacheBackend
+
+
+class TTLCache(CacheBackend):
+    """Cache LRU à expiration, sûr entre threads.
+
+    Args:
+        maxsize: Nombre maximal d'entrées ; la moins récemment lue est évincée au-delà.
+        ttl: Durée de vie d'une entrée en secondes.
+        enabled: Si False, le cache ne stocke rien et toutes les lectures échouent.
+        clock: Horloge monotone utilisée pour l'expiration (remplaçable en test).
+
+    Example:
+        >>> cache = TTLCache(maxsize=2, ttl=60)
+        >>> cache.set(1, {"id": 1})
+        >>> cache.get(1)
+        {'id': 1}
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled and maxsize > 0
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Renvoie la valeur en cache, ou None si absente ou expirée."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stocke une valeur et évince les entrées les plus anciennes si besoin."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: Hashable) -> None:
+        """Invalide les entrées données ; les clés absentes sont ignorées."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def purge(self) -> None:
+        """Vide le cache en conservant les compteurs."""
+        with self._lock:
+            self._entries.clear()
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Compteurs d'activité et occupation du cache."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
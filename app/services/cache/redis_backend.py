@@ -0,0 +1,196 @@
+"""Backend de cache partagé parlant le protocole Redis.
+
+RedisCache stocke les valeurs en JSON avec expiration côté serveur, ce qui
+les rend visibles de toutes les répliques de l'API. RedisInvalidationBus
+diffuse les invalidations par PUBLISH/SUBSCRIBE afin que chaque réplique
+purge son cache local.
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+from app.services.cache.base import CacheBackend, CacheBackendError
+from app.services.cache.resp import RespAddress, RespConnection
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache(CacheBackend):
+    """Cache clé/valeur partagé sur un serveur RESP.
+
+    Les erreurs réseau sont journalisées et traitées comme des absences :
+    une panne du serveur de cache dégrade les performances, pas les réponses.
+
+    Args:
+        address: Coordonnées du serveur.
+        ttl: Durée de vie des entrées en secondes (``SET ... PX``).
+        prefix: Préfixe des clés, pour partager une base entre plusieurs usages.
+        timeout: Délai maximal d'une commande en secondes.
+    """
+
+    def __init__(
+        self, address: RespAddress, ttl: float, prefix: str = "items:", timeout: float = 0.5
+    ) -> None:
+        self.ttl = ttl
+        self.prefix = prefix
+        self._connection = RespConnection(address, timeout)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}{key}"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: Hashable) -> Any | None:
+        try:
+            raw = self._connection.execute("GET", self._key(key))
+        except CacheBackendError as exc:
+            logger.warning("Shared cache read failed: %s", exc)
+            self._count("errors")
+            return None
+        if raw is None:
+            self._count("misses")
+            return None
+        try:
+            value = json.loads(raw)
+        except ValueError as exc:
+            # Valeur corrompue ou écrite par un autre client sous le même préfixe
+            logger.warning("Shared cache value is not valid JSON: %s", exc)
+            self._count("errors")
+            return None
+        self._count("hits")
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        try:
+            self._connection.execute(
+                "SET", self._key(key), json.dumps(value), "PX", int(self.ttl * 1000)
+            )
+        except CacheBackendError as exc:
+            logger.warning("Shared cache write failed: %s", exc)
+            self._count("errors")
+
+    def delete(self, *keys: Hashable) -> None:
+        if not keys:
+            return
+        try:
+            self._connection.execute("DEL", *(self._key(key) for key in keys))
+        except CacheBackendError as exc:
+            # L'écriture en base est déjà validée : la valeur périmée expirera au TTL
+            logger.warning("Shared cache invalidation failed: %s", exc)
+            self._count("errors")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+            }
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class RedisInvalidationBus:
+    """Diffusion des invalidations entre répliques par PUBLISH/SUBSCRIBE.
+
+    Chaque réplique publie les clés qu'elle invalide et écoute le canal dans
+    un thread dédié. Après une coupure, les messages manqués sont perdus :
+    le callback ``on_reconnect`` permet alors de purger le cache local.
+
+    Args:
+        address: Coordonnées du serveur.
+        channel: Canal de diffusion.
+        on_invalidate: Appelé avec les clés reçues.
+        on_reconnect: Appelé après chaque réabonnement suivant une coupure.
+        retry_delay: Attente en secondes entre deux tentatives de reconnexion.
+    """
+
+    def __init__(
+        self,
+        address: RespAddress,
+        channel: str,
+        on_invalidate: Callable[[Sequence[Any]], None] | None = None,
+        on_reconnect: Callable[[], None] | None = None,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self.address = address
+        self.channel = channel
+        self.on_invalidate = on_invalidate
+        self.on_reconnect = on_reconnect
+        self.retry_delay = retry_delay
+        self._publisher = RespConnection(address)
+        self._subscriber: RespConnection | None = None
+        self._stopping = threading.Event()
+        self._subscribed = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def publish(self, keys: Sequence[Hashable]) -> None:
+        """Diffuse les clés invalidées à toutes les répliques abonnées."""
+        self._publisher.execute("PUBLISH", self.channel, json.dumps(list(keys)))
+
+    def start(self) -> None:
+        """Démarre le thread d'écoute (sans effet s'il tourne déjà)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._listen, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def wait_subscribed(self, timeout: float) -> bool:
+        """Attend que l'abonnement soit actif ; utile au démarrage et en test."""
+        return self._subscribed.wait(timeout)
+
+    def stop(self) -> None:
+        """Arrête le thread d'écoute et ferme les connexions."""
+        self._stopping.set()
+        if self._subscriber is not None:
+            self._subscriber.interrupt()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        self._publisher.close()
+
+    def _listen(self) -> None:
+        first = True
+        while not self._stopping.is_set():
+            self._subscriber = RespConnection(self.address)
+            try:
+                self._subscriber.execute("SUBSCRIBE", self.channel)
+                self._subscribed.set()
+                if not first and self.on_reconnect is not None:
+                    self.on_reconnect()
+                first = False
+                while not self._stopping.is_set():
+                    self._dispatch(self._subscriber.read_push())
+            except CacheBackendError as exc:
+                self._subscribed.clear()
+                if not self._stopping.is_set():
+                    logger.warning("Cache invalidation channel lost: %s", exc)
+                    self._stopping.wait(self.retry_delay)
+            finally:
+                self._subscriber.close()
+
+    def _dispatch(self, message: Any) -> None:
+        if not isinstance(message, list) or len(message) != 3 or message[0] != b"message":
+            return
+        try:
+            keys = json.loads(message[2])
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation message: %r", message[2])
+            return
+        if self.on_invalidate is not None:
+            self.on_invalidate(keys)
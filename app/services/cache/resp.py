@@ -0,0 +1,183 @@
+"""Client minimal du protocole Redis (RESP2).
+
+Seules les commandes utilisées par le cache sont nécessaires (GET, SET,
+DEL, PUBLISH, SUBSCRIBE, AUTH, SELECT) ; ce client les envoie sur une
+socket TCP sans dépendance externe. Il fonctionne avec tout serveur
+parlant RESP : Redis, Valkey, KeyDB ou le faux serveur des tests.
+"""
+
+import io
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from app.services.cache.base import CacheBackendError
+
+
+class RespError(CacheBackendError):
+    """Réponse d'erreur (``-ERR ...``) renvoyée par le serveur."""
+
+
+@dataclass(frozen=True)
+class RespAddress:
+    """Coordonnées de connexion extraites d'une URL ``redis://``."""
+
+    host: str = "localhost"
+    port: int = 6379
+    db: int = 0
+    password: str | None = None
+
+
+def parse_redis_url(url: str) -> RespAddress:
+    """Analyse une URL ``redis://[:mot_de_passe@]hôte[:port][/base]``.
+
+    Example:
+        >>> parse_redis_url("redis://:secret@cache:6380/2")
+        RespAddress(host='cache', port=6380, db=2, password='secret')
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "redis":
+        raise ValueError(f"Unsupported cache URL scheme: {parts.scheme}")
+    path = parts.path.lstrip("/")
+    return RespAddress(
+        host=parts.hostname or "localhost",
+        port=parts.port or 6379,
+        db=int(path) if path else 0,
+        password=unquote(parts.password) if parts.password else None,
+    )
+
+
+def encode_command(*args: Any) -> bytes:
+    """Encode une commande en tableau RESP de chaînes binaires."""
+    chunks = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        chunks.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(chunks)
+
+
+class RespConnection:
+    """Connexion RESP unique, sûre entre threads (une commande à la fois).
+
+    La connexion est ouverte au premier appel et rouverte après une erreur
+    réseau ou une réponse mal formée ; ces erreurs sont converties en
+    CacheBackendError. Un échec de l'authentification ou du choix de la
+    base ferme la connexion, la suivante reprenant la poignée de main
+    depuis le début.
+
+    Args:
+        address: Coordonnées du serveur.
+        timeout: Délai maximal de connexion et de réponse en secondes.
+    """
+
+    def __init__(self, address: RespAddress, timeout: float = 1.0) -> None:
+        self.address = address
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader: io.BufferedReader | None = None
+        self._lock = threading.Lock()
+
+    def execute(self, *args: Any) -> Any:
+        """Envoie une commande et renvoie sa réponse décodée."""
+        with self._lock:
+            try:
+                self._ensure_connected()
+                assert self._sock is not None
+                self._sock.sendall(encode_command(*args))
+                return self._read_reply()
+            except (OSError, ValueError) as exc:
+                # Une réponse illisible laisse le flux désynchronisé : on repart d'une socket neuve
+                self._close()
+                raise CacheBackendError(f"Cache server unreachable: {exc}") from exc
+
+    def read_push(self) -> Any:
+        """Attend sans limite la prochaine réponse poussée par le serveur.
+
+        Réservé à une connexion en mode abonnement, lue par un seul thread ;
+        interrupt() débloque l'attente depuis un autre thread.
+        """
+        if self._sock is None:
+            raise CacheBackendError("Connection is closed")
+        try:
+            self._sock.settimeout(None)
+            return self._read_reply()
+        except (OSError, ValueError) as exc:
+            self._close()
+            raise CacheBackendError(f"Cache server unreachable: {exc}") from exc
+
+    def interrupt(self) -> None:
+        """Coupe la socket pour débloquer un read_push() en cours."""
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _ensure_connected(self) -> None:
+        if self._sock is not None:
+            return
+        sock = socket.create_connection((self.address.host, self.address.port), self.timeout)
+        sock.settimeout(self.timeout)
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        try:
+            if self.address.password:
+                sock.sendall(encode_command("AUTH", self.address.password))
+                self._read_reply()
+            if self.address.db:
+                sock.sendall(encode_command("SELECT", self.address.db))
+                self._read_reply()
+        except BaseException:
+            # Une connexion à moitié initialisée ne doit pas être réutilisée
+            self._close()
+            raise
+
+    def _close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def _stream(self) -> io.BufferedReader:
+        if self._reader is None:
+            raise ConnectionResetError("Connection is closed")
+        return self._reader
+
+    def _read_line(self) -> bytes:
+        line = self._stream().readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionResetError("Connection closed by cache server")
+        return line[:-2]
+
+    def _read_reply(self) -> Any:
+        line = self._read_line()
+        kind, payload = line[:1], line[1:]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RespError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._stream().read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionResetError("Connection closed by cache server")
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ValueError(f"Unexpected reply type: {line[:20]!r}")
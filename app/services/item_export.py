@@ -0,0 +1,98 @@
+"""Sérialisation en flux de l'export des articles (NDJSON ou CSV, gzip optionnel).
+
+Les lots de lignes produits par ItemService.stream_rows (ou sa variante
+asynchrone) sont convertis un par un en morceaux de texte encodés, sans
+jamais matérialiser l'export complet. La compression gzip est appliquée au
+fil de l'eau par un compresseur zlib incrémental.
+"""
+
+import csv
+import io
+import itertools
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from typing import Any, Literal
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_COLUMNS = ("id", "nom", "prix", "version")
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def format_batch(rows: Sequence[Sequence[Any]], export_format: ExportFormat) -> bytes:
+    """Encode un lot de lignes (id, nom, prix, version) au format demandé."""
+    if export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode()
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, row, strict=True)), ensure_ascii=False) + "\n"
+        for row in rows
+    ).encode()
+
+
+def export_header(export_format: ExportFormat) -> bytes:
+    """Début du flux : la ligne d'en-tête en CSV, rien en NDJSON."""
+    return (",".join(EXPORT_COLUMNS) + "\n").encode() if export_format == "csv" else b""
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Indique si l'en-tête Accept-Encoding autorise gzip (``q=0`` l'exclut)."""
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _gzip_compressor() -> Any:
+    return zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+
+def _compress(compressor: Any, chunk: bytes) -> bytes:
+    return compressor.compress(chunk) if compressor is not None else chunk
+
+
+def encode_export(
+    batches: Iterable[Sequence[Sequence[Any]]], export_format: ExportFormat, gzip: bool = False
+) -> Iterator[bytes]:
+    """Produit le flux d'export, un morceau par lot de lignes.
+
+    Example:
+        >>> chunks = encode_export(ItemService.stream_rows(db), "csv", gzip=True)
+    """
+    compressor = _gzip_compressor() if gzip else None
+    chunks = itertools.chain(
+        [export_header(export_format)],
+        (format_batch(batch, export_format) for batch in batches),
+    )
+    for chunk in chunks:
+        if data := _compress(compressor, chunk):
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
+
+
+async def aencode_export(
+    batches: AsyncIterable[Sequence[Sequence[Any]]],
+    export_format: ExportFormat,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """Variante asynchrone de encode_export, pour AsyncItemService.stream_rows."""
+    compressor = _gzip_compressor() if gzip else None
+    if data := _compress(compressor, export_header(export_format)):
+        yield data
+    async for batch in batches:
+        if data := _compress(compressor, format_batch(batch, export_format)):
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
@@ -0,0 +1,216 @@
+"""Import en flux d'articles depuis un corps NDJSON ou CSV.
+
+Le corps de la requête est lu morceau par morceau et découpé en lignes,
+puis en enregistrements, sans jamais être chargé en entier. Les
+enregistrements sont validés contre ItemCreate par lots de ``batch_size``
+et chaque lot valide est chargé puis validé en base (commit) avant de
+lire la suite : la mémoire consommée ne dépend que de la taille d'un lot.
+
+Un lot déjà chargé n'est pas annulé si un lot suivant échoue en base, ni
+si la suite du corps se révèle illisible (``format_error``) ; le rapport
+d'import indique les lots traités.
+"""
+
+import codecs
+import csv
+import json
+import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.schemas.item import BulkRowError, ImportBatchReport, ImportReport, ItemCreate
+from app.services.item_export import ExportFormat
+from app.services.item_queries import row_error
+
+logger = logging.getLogger(__name__)
+
+MAX_LINE_LENGTH = 1 << 16
+MAX_REPORTED_ERRORS = 1000
+
+BatchLoader = Callable[[list[dict[str, Any]]], Awaitable[int]]
+
+
+class ImportFormatError(ValueError):
+    """Levée lorsque le corps ne peut pas être lu comme un fichier d'import."""
+
+
+def body_format(content_type: str | None) -> ExportFormat:
+    """Déduit le format d'import de l'en-tête Content-Type (NDJSON par défaut)."""
+    media_type = (content_type or "").partition(";")[0].strip().lower()
+    return "csv" if media_type in ("text/csv", "application/csv") else "ndjson"
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Découpe un flux d'octets UTF-8 en lignes, sans leur fin de ligne.
+
+    Raises:
+        ImportFormatError: Si le flux n'est pas de l'UTF-8 valide ou si une
+            ligne dépasse MAX_LINE_LENGTH caractères.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                yield line.removesuffix("\r")
+            if len(pending) > MAX_LINE_LENGTH:
+                raise ImportFormatError(f"Line longer than {MAX_LINE_LENGTH} characters")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError("Body is not valid UTF-8") from exc
+    if pending.strip():
+        yield pending.removesuffix("\r")
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[list[str]]:
+    # Un champ entre guillemets peut contenir des sauts de ligne : un
+    # enregistrement n'est complet que si son nombre de guillemets est pair
+    buffered: list[str] = []
+    quotes = size = 0
+    async for line in lines:
+        buffered.append(line)
+        quotes += line.count('"')
+        size += len(line)
+        if quotes % 2:
+            if size > MAX_LINE_LENGTH:
+                raise ImportFormatError(f"Record longer than {MAX_LINE_LENGTH} characters")
+            continue
+        record = "\n".join(buffered)
+        buffered, quotes, size = [], 0, 0
+        if record.strip():
+            yield next(csv.reader([record]))
+    if buffered:
+        raise ImportFormatError("Unterminated quoted field at end of body")
+
+
+def _parse_error(index: int, message: str) -> BulkRowError:
+    return BulkRowError(index=index, errors=[{"loc": [], "msg": message, "type": "parse_error"}])
+
+
+async def iter_records(
+    chunks: AsyncIterable[bytes], export_format: ExportFormat
+) -> AsyncIterator[tuple[int, Any]]:
+    """Produit les enregistrements bruts du corps, numérotés à partir de 0.
+
+    Un enregistrement illisible est produit sous forme de BulkRowError. En
+    CSV, la première ligne est l'en-tête et nomme les colonnes.
+
+    Raises:
+        ImportFormatError: Si le corps est mal encodé ou si l'en-tête CSV
+            ne contient pas les colonnes ``nom`` et ``prix``.
+    """
+    lines = iter_lines(chunks)
+    if export_format == "ndjson":
+        index = 0
+        async for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield index, json.loads(line)
+            except ValueError as exc:
+                yield index, _parse_error(index, f"Invalid JSON: {exc}")
+            index += 1
+        return
+
+    records = _csv_records(lines)
+    header = await anext(records, None)
+    if header is None:
+        return
+    if not {"nom", "prix"} <= set(header):
+        raise ImportFormatError("CSV header must contain the columns nom and prix")
+    index = 0
+    async for values in records:
+        if len(values) != len(header):
+            yield index, _parse_error(index, f"Expected {len(header)} columns, got {len(values)}")
+        else:
+            yield index, dict(zip(header, values, strict=True))
+        index += 1
+
+
+async def run_import(
+    chunks: AsyncIterable[bytes],
+    export_format: ExportFormat,
+    load: BatchLoader,
+    batch_size: int,
+) -> ImportReport:
+    """Lit, valide et charge un corps d'import lot par lot.
+
+    Args:
+        chunks: Corps de la requête, morceau par morceau.
+        export_format: Format du corps, ``"ndjson"`` ou ``"csv"``.
+        load: Charge un lot de valeurs validées et renvoie le nombre de lignes
+            chargées (ItemService.import_rows ou sa variante asynchrone).
+        batch_size: Nombre d'enregistrements par lot.
+
+    Returns:
+        Le rapport d'import : totaux, détail par lot et erreurs par ligne
+        (au plus MAX_REPORTED_ERRORS, les suivantes sont seulement comptées).
+        Si le corps devient illisible après le chargement d'un lot, le
+        rapport s'arrête aux lots chargés et ``format_error`` décrit l'erreur ;
+        les enregistrements lus depuis le dernier lot ne sont pas chargés.
+
+    Raises:
+        ImportFormatError: Si le corps ne peut pas être lu avant le premier lot :
+            rien n'a été chargé.
+
+    Example:
+        >>> report = await run_import(request.stream(), "csv", load, batch_size=5000)
+    """
+    report = ImportReport(imported=0, rejected=0, batches=[], errors=[])
+    values: list[dict[str, Any]] = []
+    rejected = 0
+
+    async def flush() -> None:
+        nonlocal values, rejected
+        started = time.perf_counter()
+        imported = await load(values)
+        batch = ImportBatchReport(
+            batch=len(report.batches),
+            rows=len(values) + rejected,
+            imported=imported,
+            rejected=rejected,
+        )
+        report.batches.append(batch)
+        report.imported += imported
+        report.rejected += rejected
+        logger.info(
+            "Import batch %d: %d imported, %d rejected in %.0f ms",
+            batch.batch,
+            imported,
+            rejected,
+            (time.perf_counter() - started) * 1000,
+        )
+        values, rejected = [], 0
+
+    try:
+        async for index, record in iter_records(chunks, export_format):
+            error = record if isinstance(record, BulkRowError) else None
+            if error is None:
+                try:
+                    values.append(ItemCreate.model_validate(record).model_dump())
+                except ValidationError as exc:
+                    error = row_error(index, exc)
+            if error is not None:
+                rejected += 1
+                if len(report.errors) < MAX_REPORTED_ERRORS:
+                    report.errors.append(error)
+                else:
+                    report.errors_truncated = True
+            if len(values) + rejected >= batch_size:
+                await flush()
+    except ImportFormatError as exc:
+        if not report.batches:
+            raise
+        # Les lots précédents sont validés en base : le rapport les décrit
+        report.format_error = str(exc)
+        logger.warning(
+            "Import stopped after %d batches: %s", len(report.batches), report.format_error
+        )
+        return report
+    if values or rejected:
+        await flush()
+    return report
@@ -0,0 +1,519 @@
+"""Construction des requêtes SQL sur les articles.
+
+Ce module regroupe les instructions partagées par le service synchrone
+(ItemService) et le service asynchrone (AsyncItemService) : seules
+l'exécution et la gestion de la transaction diffèrent entre les deux.
+"""
+
+import csv
+import io
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    ColumnElement,
+    Float,
+    Insert,
+    String,
+    Update,
+    any_,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    sql,
+    table,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.dml import ReturningDelete
+from sqlmodel import col, select
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+from app.models.item import Item
+from app.schemas.item import (
+    BulkRowError,
+    BulkUpdateResult,
+    BulkWriteResult,
+    ItemBulkUpdate,
+    ItemCreate,
+)
+from app.services.pagination import (
+    CURSOR_SORT_KEYS,
+    SORT_DIRECTIONS,
+    InvalidCursorError,
+    cursor_sort,
+    decode_cursor,
+    encode_cursor,
+)
+
+SelectT = TypeVar("SelectT", bound=sql.Select[*tuple[Any, ...]])
+
+BULK_CHUNK_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+IMPORT_BATCH_SIZE = 5000
+
+# COPY charge un lot en un seul aller-retour, sans analyser d'INSERT ligne à ligne
+COPY_ITEMS_SQL = "COPY items (nom, prix) FROM STDIN WITH (FORMAT csv)"
+# Instruction émise par asyncpg (copy_records_to_table), pour la mesure des requêtes
+COPY_BINARY_ITEMS_SQL = "COPY items (nom, prix) FROM STDIN (FORMAT binary)"
+
+
+class VersionConflictError(Exception):
+    """Levée lorsqu'un article a été modifié depuis la version attendue par le client.
+
+    Attributes:
+        current_version: Version actuelle de l'article en base.
+    """
+
+    def __init__(self, item_id: int, current_version: int) -> None:
+        super().__init__(f"Item {item_id} is at version {current_version}")
+        self.current_version = current_version
+
+
+def chunks(rows: Sequence[Any], size: int) -> list[Sequence[Any]]:
+    """Découpe une séquence en tranches d'au plus ``size`` éléments."""
+    return [rows[start : start + size] for start in range(0, len(rows), size)]
+
+
+def id_in(dialect_name: str, ids: Sequence[int]) -> ColumnElement[bool]:
+    """Filtre ``id`` sur une liste : ``= ANY(:ids)`` sur PostgreSQL, ``IN`` ailleurs.
+
+    Sous PostgreSQL le tableau est envoyé comme un seul paramètre, ce qui
+    garde un texte SQL identique quelle que soit la taille de la liste. Il
+    est typé ``BIGINT[]`` pour accepter tout id admis par les routes (jusqu'à
+    MAX_ITEM_ID) : un id hors de la colonne INTEGER ne correspond à aucune ligne.
+    """
+    if dialect_name == "postgresql":
+        return col(Item.id) == any_(literal(list(ids), ARRAY(BigInteger)))
+    return col(Item.id).in_(ids)
+
+
+def by_ids_statement(dialect_name: str, ids: Sequence[int]) -> SelectOfScalar[Item]:
+    """Lecture des articles d'une liste d'ids, en une requête."""
+    return select(Item).where(id_in(dialect_name, ids))
+
+
+@dataclass(frozen=True)
+class ItemFilters:
+    """Filtres de liste poussés dans la clause WHERE.
+
+    Attributes:
+        prix_min: Prix minimal inclus, ou None.
+        prix_max: Prix maximal inclus, ou None.
+        nom_prefix: Début du nom (sensible à la casse), ou None.
+    """
+
+    prix_min: float | None = None
+    prix_max: float | None = None
+    nom_prefix: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """Indique si au moins un filtre est renseigné."""
+        return self != ItemFilters()
+
+    def apply(self, statement: SelectT) -> SelectT:
+        """Ajoute les filtres renseignés à une requête sur les articles."""
+        if self.prix_min is not None:
+            statement = statement.where(col(Item.prix) >= self.prix_min)
+        if self.prix_max is not None:
+            statement = statement.where(col(Item.prix) <= self.prix_max)
+        if self.nom_prefix:
+            statement = statement.where(col(Item.nom).startswith(self.nom_prefix, autoescape=True))
+        return statement
+
+
+def sort_columns(order_by: str) -> list[InstrumentedAttribute[Any]]:
+    """Colonnes de tri d'une clé autorisée, départagées par ``id``.
+
+    Seules les clés de CURSOR_SORT_KEYS sont acceptées : aucun nom de colonne
+    venu du client n'atteint la requête sans passer par cette liste blanche.
+
+    Raises:
+        InvalidCursorError: Si la clé de tri n'est pas autorisée.
+    """
+    if order_by not in CURSOR_SORT_KEYS:
+        raise InvalidCursorError(f"Unsupported order_by: {order_by}")
+    return [getattr(Item, key) for key in dict.fromkeys((order_by, "id"))]
+
+
+def _order_by(
+    columns: list[InstrumentedAttribute[Any]], direction: str
+) -> list[ColumnElement[Any]]:
+    if direction not in SORT_DIRECTIONS:
+        raise InvalidCursorError(f"Unsupported sort direction: {direction}")
+    if direction == "desc":
+        return [column.desc() for column in columns]
+    return [column.expression for column in columns]
+
+
+def _ordered(
+    statement: SelectOfScalar[Item], columns: list[InstrumentedAttribute[Any]], direction: str
+) -> SelectOfScalar[Item]:
+    return statement.order_by(*_order_by(columns, direction))
+
+
+def list_statement(
+    skip: int,
+    limit: int,
+    filters: ItemFilters | None = None,
+    order_by: str = "id",
+    direction: str = "asc",
+) -> SelectOfScalar[Item]:
+    """Requête d'une page en pagination par offset, filtrée et triée.
+
+    Raises:
+        InvalidCursorError: Si le tri n'est pas supporté.
+    """
+    statement = (filters or ItemFilters()).apply(select(Item))
+    return _ordered(statement, sort_columns(order_by), direction).offset(skip).limit(limit)
+
+
+def list_rows_statement(
+    skip: int,
+    limit: int,
+    filters: ItemFilters | None = None,
+    order_by: str = "id",
+    direction: str = "asc",
+) -> Select[str, float, int | None, int]:
+    """Variante de list_statement ne lisant que les colonnes de la réponse.
+
+    Les lignes renvoyées sont des tuples nommés (nom, prix, id, version),
+    dans l'ordre des champs d'ItemResponse : ni objet ORM, ni passage par
+    l'identity map de la session.
+
+    Raises:
+        InvalidCursorError: Si le tri n'est pas supporté.
+    """
+    statement = (filters or ItemFilters()).apply(
+        select(col(Item.nom), col(Item.prix), col(Item.id), col(Item.version))
+    )
+    ordering = _order_by(sort_columns(order_by), direction)
+    return statement.order_by(*ordering).offset(skip).limit(limit)
+
+
+def page_statement(
+    limit: int,
+    cursor: str | None,
+    order_by: str,
+    direction: str = "asc",
+    filters: ItemFilters | None = None,
+) -> SelectOfScalar[Item]:
+    """Construit la requête keyset d'une page, avec une ligne de plus que ``limit``.
+
+    La position est reprise par comparaison de ligne sur les colonnes de tri
+    (``(prix, id) > (:prix, :id)``, ou ``<`` en tri décroissant), servie
+    directement par les index ``(nom)`` et ``(prix, id)``.
+
+    Raises:
+        InvalidCursorError: Si le tri n'est pas supporté ou si le curseur est invalide.
+    """
+    columns = sort_columns(order_by)
+    statement = _ordered((filters or ItemFilters()).apply(select(Item)), columns, direction)
+
+    if cursor is not None:
+        values = decode_cursor(cursor, cursor_sort(order_by, direction))
+        position = tuple_(*columns) if len(columns) > 1 else columns[0]
+        after = tuple_(*values) if len(values) > 1 else values[0]
+        statement = statement.where(position < after if direction == "desc" else position > after)
+
+    # Une ligne de plus que demandé permet de savoir s'il reste une page
+    return statement.limit(limit + 1)
+
+
+def split_page(
+    rows: list[Item], limit: int, order_by: str, direction: str = "asc"
+) -> tuple[list[Item], str | None]:
+    """Sépare la page demandée de la ligne sentinelle et calcule le curseur suivant."""
+    items = rows[:limit]
+    if len(rows) <= limit:
+        return items, None
+
+    last = items[-1]
+    values = [getattr(last, column.key) for column in sort_columns(order_by)]
+    return items, encode_cursor(cursor_sort(order_by, direction), values)
+
+
+def count_statement(filters: ItemFilters | None = None) -> SelectOfScalar[int]:
+    """``SELECT count(*)`` sur les articles, filtré si demandé."""
+    return (filters or ItemFilters()).apply(select(func.count()).select_from(Item))
+
+
+def estimate_count_statement() -> SelectOfScalar[int]:
+    """Estimation PostgreSQL du nombre de lignes tenue à jour par ANALYZE/autovacuum.
+
+    ``reltuples`` vaut -1 tant que la table n'a jamais été analysée.
+    """
+    return (
+        select(cast(column("reltuples"), BigInteger))
+        .select_from(table("pg_class"))
+        .where(column("oid") == cast(literal(Item.__tablename__), REGCLASS))
+    )
+
+
+def export_statement(batch_size: int) -> Select[int | None, str, float, int]:
+    """Lecture de toute la table, colonne par colonne, sur un curseur serveur.
+
+    ``yield_per`` active ``stream_results`` : PostgreSQL renvoie les lignes
+    par lots de ``batch_size`` au lieu de charger tout le résultat en mémoire,
+    et aucun objet ORM n'est construit.
+    """
+    return (
+        select(col(Item.id), col(Item.nom), col(Item.prix), col(Item.version))
+        .order_by(col(Item.id))
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def escape_like(value: str) -> str:
+    """Échappe les jokers de LIKE (``%``, ``_``) avec ``\\`` comme caractère d'échappement."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def fts_query(q: str) -> str | None:
+    """Traduit une saisie libre en requête FTS5 : chaque mot est un préfixe requis.
+
+    Example:
+        >>> fts_query("écran 24")
+        '"écran"* "24"*'
+    """
+    words = re.findall(r"\w+", q)
+    return " ".join(f'"{word}"*' for word in words) or None
+
+
+@dataclass
+class PostgresSearch:
+    """Extensions PostgreSQL disponibles pour la recherche, constatées par app.migrations.
+
+    Sans ``pg_trgm``, la recherche se replie sur un ILIKE non indexé ; sans
+    ``unaccent``, elle reste sensible aux accents.
+
+    Attributes:
+        trigram: ``pg_trgm`` est installée (index GIN et classement par similarité).
+        unaccent: ``unaccent`` est installée (fonction ``items_unaccent``).
+    """
+
+    trigram: bool = True
+    unaccent: bool = True
+
+
+postgres_search = PostgresSearch()
+
+
+def search_statement(
+    dialect_name: str, q: str, limit: int, skip: int, accent_insensitive: bool
+) -> SelectOfScalar[Item]:
+    """Recherche classée sur ``nom``, avec une ligne de plus que ``limit``.
+
+    PostgreSQL : sous-chaîne insensible à la casse (et aux accents si demandé),
+    servie par les index trigrammes, classée par similarité. SQLite : préfixes
+    de mots via FTS5, classés par bm25 ; FTS5 ignore toujours les accents, un
+    filtre LIKE complémentaire les rend significatifs si ``accent_insensitive``
+    est faux. Ailleurs, ou sous PostgreSQL sans pg_trgm : ILIKE non indexé,
+    classé par id.
+    """
+    pattern = f"%{escape_like(q)}%"
+    statement = select(Item)
+    if dialect_name == "postgresql" and postgres_search.trigram:
+        haystack: ColumnElement[str] = func.lower(col(Item.nom))
+        needle: ColumnElement[str] = func.lower(literal(q))
+        like: ColumnElement[str] = func.lower(literal(pattern))
+        if accent_insensitive and postgres_search.unaccent:
+            haystack, needle, like = (
+                func.items_unaccent(haystack),
+                func.items_unaccent(needle),
+                func.items_unaccent(like),
+            )
+        statement = statement.where(haystack.like(like, escape="\\")).order_by(
+            func.similarity(haystack, needle).desc(), col(Item.id)
+        )
+    elif dialect_name == "sqlite":
+        match = fts_query(q)
+        if match is None:
+            return statement.where(literal(False))
+        fts = table("items_fts", column("rowid"))
+        fts_name: ColumnElement[Any] = literal_column("items_fts")
+        statement = (
+            statement.join(fts, fts.c.rowid == col(Item.id))
+            .where(fts_name.op("MATCH")(match))
+            .order_by(func.bm25(fts_name), col(Item.id))
+        )
+        if not accent_insensitive:
+            statement = statement.where(col(Item.nom).like(pattern, escape="\\"))
+    else:
+        statement = statement.where(col(Item.nom).ilike(pattern, escape="\\")).order_by(
+            col(Item.id)
+        )
+    return statement.offset(skip).limit(limit + 1)
+
+
+def validate_rows(rows: Sequence[Any]) -> tuple[list[dict[str, Any]], list[BulkRowError]]:
+    """Valide chaque ligne contre ItemCreate et sépare les valeurs valides des erreurs."""
+    valid: list[dict[str, Any]] = []
+    errors: list[BulkRowError] = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append(ItemCreate.model_validate(row).model_dump())
+        except ValidationError as exc:
+            errors.append(row_error(index, exc))
+    return valid, errors
+
+
+def row_error(index: int, exc: ValidationError) -> BulkRowError:
+    """Convertit une erreur de validation pydantic en erreur de ligne sérialisable."""
+    return BulkRowError(
+        index=index,
+        errors=[
+            {"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]}
+            for error in exc.errors()
+        ],
+    )
+
+
+def bulk_insert_statement(chunk_size: int) -> Insert:
+    """INSERT multi-lignes ``RETURNING id``, ``chunk_size`` lignes par instruction."""
+    return (
+        insert(Item)
+        .returning(col(Item.id), sort_by_parameter_order=True)
+        .execution_options(insertmanyvalues_page_size=chunk_size)
+    )
+
+
+def import_statement() -> Insert:
+    """INSERT sans RETURNING, exécuté en executemany pour un lot importé."""
+    return insert(Item)
+
+
+def copy_payload(rows: Sequence[dict[str, Any]]) -> io.StringIO:
+    """Sérialise un lot validé en CSV pour ``COPY_ITEMS_SQL``."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows((row["nom"], row["prix"]) for row in rows)
+    buffer.seek(0)
+    return buffer
+
+
+def split_bulk_updates(
+    rows: Sequence[ItemBulkUpdate],
+) -> tuple[list[ItemBulkUpdate], list[int]]:
+    """Sépare les modifications à appliquer des lignes sans aucun champ renseigné.
+
+    Si un id apparaît plusieurs fois, seule sa dernière occurrence est gardée.
+    Une ligne ne portant que son ``id`` ne modifierait rien : elle n'est ni
+    envoyée à la base, ni comptée comme mise à jour.
+
+    Returns:
+        Les modifications à appliquer, et les ids des lignes vides.
+    """
+    changes: list[ItemBulkUpdate] = []
+    unchanged: list[int] = []
+    for row in {row.id: row for row in rows}.values():
+        if row.nom is None and row.prix is None:
+            unchanged.append(row.id)
+        else:
+            changes.append(row)
+    return changes, unchanged
+
+
+def bulk_update_statement(rows: Sequence[ItemBulkUpdate]) -> Update:
+    """UPDATE ensembliste joignant les modifications comme table de valeurs.
+
+    Les champs absents valent NULL dans la table de valeurs et conservent
+    leur valeur actuelle grâce à COALESCE. La table est émise en CTE : même
+    plan que ``FROM (VALUES ...)`` sous PostgreSQL, et seule forme acceptée
+    par SQLite.
+    """
+    source = (
+        values(column("id", BigInteger), column("nom", String), column("prix", Float), name="v")
+        .data([(row.id, row.nom, row.prix) for row in rows])
+        .cte("v")
+    )
+    return (
+        update(Item)
+        .where(col(Item.id) == source.c.id)
+        .values(
+            nom=func.coalesce(cast(source.c.nom, String), col(Item.nom)),
+            prix=func.coalesce(cast(source.c.prix, Float), col(Item.prix)),
+            version=col(Item.version) + 1,
+        )
+        .returning(col(Item.id))
+    )
+
+
+def bulk_delete_statement(dialect_name: str, ids: Sequence[int]) -> ReturningDelete[int | None]:
+    """DELETE ensembliste ``RETURNING id``."""
+    return delete(Item).where(id_in(dialect_name, ids)).returning(col(Item.id))
+
+
+def insert_returning_statement(values: dict[str, Any]) -> Insert:
+    """INSERT d'un article ``RETURNING`` ses colonnes : id et valeurs par défaut sans relecture."""
+    return (
+        insert(Item)
+        .values(**values)
+        .returning(col(Item.id), col(Item.nom), col(Item.prix), col(Item.version))
+    )
+
+
+def update_returning_statement(
+    item_id: int, changes: dict[str, Any], expected_version: int | None = None
+) -> Update:
+    """UPDATE d'un article ``RETURNING`` ses colonnes : écriture et relecture en un aller-retour.
+
+    La version est incrémentée. Avec ``expected_version``, la condition sur
+    la version rend la vérification atomique sans verrou ``FOR UPDATE`` :
+    aucune ligne renvoyée signifie que l'article est absent ou a changé.
+    """
+    statement = update(Item).where(col(Item.id) == item_id)
+    if expected_version is not None:
+        statement = statement.where(col(Item.version) == expected_version)
+    return statement.values(**changes, version=col(Item.version) + 1).returning(
+        col(Item.id), col(Item.nom), col(Item.prix), col(Item.version)
+    )
+
+
+def delete_returning_statement(
+    item_id: int, expected_version: int | None = None
+) -> ReturningDelete[int | None]:
+    """DELETE d'un article ``RETURNING id`` : une ligne renvoyée si l'article existait.
+
+    Avec ``expected_version``, la ligne n'est supprimée que si sa version
+    correspond, comme pour update_returning_statement.
+    """
+    statement = delete(Item).where(col(Item.id) == item_id)
+    if expected_version is not None:
+        statement = statement.where(col(Item.version) == expected_version)
+    return statement.returning(col(Item.id))
+
+
+def version_statement(item_id: int) -> SelectOfScalar[int]:
+    """Version actuelle d'un article, pour distinguer un conflit d'une absence."""
+    return select(col(Item.version)).where(col(Item.id) == item_id)
+
+
+def bulk_write_result(requested: Sequence[int], affected: Sequence[int]) -> BulkWriteResult:
+    """Construit le compte rendu d'une écriture en masse."""
+    found = set(affected)
+    return BulkWriteResult(
+        count=len(affected),
+        ids=sorted(found),
+        missing_ids=[item_id for item_id in requested if item_id not in found],
+    )
+
+
+def bulk_update_result(
+    requested: Sequence[int], affected: Sequence[int], unchanged: Sequence[int]
+) -> BulkUpdateResult:
+    """Compte rendu d'une mise à jour en masse, lignes sans modification comprises."""
+    result = bulk_write_result(requested, affected)
+    return BulkUpdateResult(**result.model_dump(), unchanged_ids=list(unchanged))
@@ -4,10 +4,74 @@ Ce module contient la couche service qui encapsule toutes les
 opérations CRUD (Create, Read, Update, Delete) sur les articles.
 """
 
-from sqlmodel import Session, select
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import Row
+from sqlmodel import Session
 
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.observability.queries import observed_query
+from app.schemas.item import (
+    BulkCreateResult,
+    BulkUpdateResult,
+    BulkWriteResult,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemStats,
+    ItemUpdate,
+)
+from app.services.cache import (
+    adjust_item_count,
+    cache_item,
+    fills_cache,
+    get_cached_item,
+    invalidate_items,
+    item_count,
+    item_stats,
+    reads_cache,
+)
+from app.services.item_queries import (
+    BULK_CHUNK_SIZE,
+    COPY_ITEMS_SQL,
+    EXPORT_BATCH_SIZE,
+    ItemFilters,
+    VersionConflictError,
+    bulk_delete_statement,
+    bulk_insert_statement,
+    bulk_update_result,
+    bulk_update_statement,
+    bulk_write_result,
+    by_ids_statement,
+    chunks,
+    copy_payload,
+    count_statement,
+    delete_returning_statement,
+    estimate_count_statement,
+    export_statement,
+    import_statement,
+    insert_returning_statement,
+    list_rows_statement,
+    list_statement,
+    page_statement,
+    search_statement,
+    split_bulk_updates,
+    split_page,
+    update_returning_statement,
+    validate_rows,
+    version_statement,
+)
+from app.services.item_stats import (
+    PERCENTILES,
+    build_stats,
+    histogram_statement,
+    interpolate,
+    percentile_offset,
+    percentile_statement,
+    postgres_stats_statement,
+    sample_stddev,
+    summary_statement,
+)
 
 
 class ItemService:
@@ -19,28 +83,267 @@ class ItemService:
     """
 
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 100) -> list[Item]:
+    def get_all(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filters: ItemFilters | None = None,
+        order_by: str = "id",
+        direction: str = "asc",
+    ) -> list[Item]:
         """Récupère une liste paginée d'articles.
 
+        Les filtres et le tri sont appliqués en SQL ; le tri est départagé
+        par ``id`` pour que la pagination soit stable.
+
         Args:
             db: Session de base de données active.
             skip: Nombre d'articles à sauter (pour pagination). Par défaut 0.
             limit: Nombre maximum d'articles à retourner. Par défaut 100.
+            filters: Filtres sur le prix et le début du nom, None pour aucun.
+            order_by: Clé de tri, ``"id"``, ``"nom"`` ou ``"prix"``. Par défaut ``"id"``.
+            direction: Sens du tri, ``"asc"`` ou ``"desc"``. Par défaut ``"asc"``.
 
         Returns:
             Liste d'objets Item de la base de données.
 
+        Raises:
+            InvalidCursorError: Si la clé ou le sens de tri n'est pas autorisé.
+
         Example:
             >>> items = ItemService.get_all(db, skip=0, limit=10)
-            >>> len(items)  # Maximum 10 articles
+            >>> cheap = ItemService.get_all(db, filters=ItemFilters(prix_max=10), order_by="prix")
         """
-        statement = select(Item).offset(skip).limit(limit)
+        statement = list_statement(skip, limit, filters, order_by, direction)
         return list(db.exec(statement).all())
 
+    @staticmethod
+    def get_rows(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filters: ItemFilters | None = None,
+        order_by: str = "id",
+        direction: str = "asc",
+    ) -> Sequence[Row[str, float, int | None, int]]:
+        """Variante de get_all renvoyant des lignes (nom, prix, id, version).
+
+        Seules les colonnes de la réponse sont lues et aucun objet Item n'est
+        construit : c'est le chemin rapide des listes sérialisées directement
+        en JSON (voir app.routes.responses.ItemRowsResponse).
+
+        Raises:
+            InvalidCursorError: Si la clé ou le sens de tri n'est pas autorisé.
+
+        Example:
+            >>> [row.nom for row in ItemService.get_rows(db, limit=2)]
+            ['Clavier', 'Souris']
+        """
+        statement = list_rows_statement(skip, limit, filters, order_by, direction)
+        # Exécutée sur la connexion : Session.exec renverrait des tuples et non des Row
+        return db.connection().execute(statement).all()
+
+    @staticmethod
+    def get_page(
+        db: Session,
+        limit: int = 100,
+        cursor: str | None = None,
+        order_by: str = "id",
+        direction: str = "asc",
+        filters: ItemFilters | None = None,
+    ) -> tuple[list[Item], str | None]:
+        """Récupère une page d'articles par pagination à curseur (keyset).
+
+        Contrairement à get_all, le coût d'une page ne dépend pas de sa
+        profondeur : la requête reprend directement après la dernière ligne
+        vue grâce à une comparaison sur la clé de tri indexée.
+
+        Args:
+            db: Session de base de données active.
+            limit: Nombre maximum d'articles à retourner. Par défaut 100.
+            cursor: Curseur renvoyé par la page précédente, None pour la première page.
+            order_by: Clé de tri, ``"id"``, ``"nom"`` ou ``"prix"`` (départagé par ``id``).
+            direction: Sens du tri, ``"asc"`` ou ``"desc"``. Par défaut ``"asc"``.
+            filters: Filtres sur le prix et le début du nom, None pour aucun.
+
+        Returns:
+            Un tuple (articles, curseur suivant). Le curseur vaut None
+            lorsqu'il n'y a plus de page.
+
+        Raises:
+            InvalidCursorError: Si le curseur est invalide pour ce tri.
+
+        Example:
+            >>> items, next_cursor = ItemService.get_page(db, limit=50, order_by="nom")
+            >>> items, next_cursor = ItemService.get_page(db, limit=50, cursor=next_cursor)
+        """
+        statement = page_statement(limit, cursor, order_by, direction, filters)
+        rows = list(db.exec(statement).all())
+        return split_page(rows, limit, order_by, direction)
+
+    @staticmethod
+    def count(db: Session, filters: ItemFilters | None = None) -> int:
+        """Compte exactement les articles.
+
+        Sans filtre, le total est servi par un compteur en cache
+        (app.services.cache.item_count) que les créations et suppressions
+        ajustent ; ``count(*)`` n'est exécuté qu'à son expiration. Avec des
+        filtres, le comptage est fait en SQL à chaque appel. Comme pour les
+        articles, un total compté sur une réplica n'est pas mis en cache.
+
+        Args:
+            db: Session de base de données active.
+            filters: Filtres de liste, None pour compter toute la table.
+
+        Returns:
+            Le nombre d'articles.
+
+        Example:
+            >>> ItemService.count(db)
+            1250000
+        """
+        if filters is not None and filters.active:
+            return db.exec(count_statement(filters)).one()
+
+        cached = item_count.get()
+        if cached is not None:
+            return cached
+        if not fills_cache(db.info):
+            return db.exec(count_statement()).one()
+        token = item_count.begin_load()
+        total = db.exec(count_statement()).one()
+        item_count.store(total, token)
+        return total
+
+    @staticmethod
+    def estimate_count(db: Session) -> int | None:
+        """Estime le nombre d'articles sans parcourir la table.
+
+        Lit ``pg_class.reltuples``, mis à jour par ANALYZE et l'autovacuum.
+
+        Returns:
+            L'estimation, ou None si la base n'en fournit pas (SQLite, ou
+            table PostgreSQL jamais analysée).
+
+        Example:
+            >>> ItemService.estimate_count(db) or ItemService.count(db)
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
+        estimate = db.exec(estimate_count_statement()).one()
+        return estimate if estimate >= 0 else None
+
+    @staticmethod
+    def stats(db: Session, buckets: int = 10) -> ItemStats:
+        """Calcule les statistiques des prix et leur histogramme en SQL.
+
+        Sous PostgreSQL, une seule instruction (percentile_cont,
+        width_bucket) ; sous les autres bases, quelques requêtes servies par
+        l'index ``(prix, id)`` (voir app.services.item_stats). Le résultat est
+        mis en cache ITEM_STATS_TTL secondes par nombre de classes, sauf s'il
+        est calculé sur une réplica.
+
+        Args:
+            db: Session de base de données active.
+            buckets: Nombre de classes de l'histogramme.
+
+        Returns:
+            Effectif, bornes, moyenne, écart type, percentiles et histogramme.
+
+        Example:
+            >>> ItemService.stats(db, buckets=4).p90
+            87.5
+        """
+        cached = item_stats.get(buckets)
+        if cached is not None:
+            return ItemStats.model_validate(cached)
+
+        # Instructions Core sans entité : exécutées sur la connexion de la session
+        connection = db.connection()
+        if db.get_bind().dialect.name == "postgresql":
+            rows = connection.execute(postgres_stats_statement(buckets)).mappings().all()
+            summary: dict[str, Any] = dict(rows[0])
+            bucket_counts = [(row["bucket"], row["bucket_count"]) for row in rows if row["bucket"]]
+        else:
+            summary = dict(connection.execute(summary_statement()).mappings().one())
+            bucket_counts = []
+            count = summary["count"]
+            if count:
+                for name, fraction in PERCENTILES.items():
+                    offset = percentile_offset(count, fraction)
+                    values = [row[0] for row in connection.execute(percentile_statement(offset))]
+                    summary[name] = interpolate(count, fraction, values)
+                summary["stddev"] = sample_stddev(count, summary["avg"], summary["avg_square"])
+                statement = histogram_statement(summary["min"], summary["max"], buckets)
+                bucket_counts = [tuple(row) for row in connection.execute(statement)]
+
+        stats = build_stats(summary, bucket_counts, buckets)
+        if fills_cache(db.info):
+            item_stats.set(buckets, stats.model_dump())
+        return stats
+
+    @staticmethod
+    def search(
+        db: Session, q: str, skip: int = 0, limit: int = 100, accent_insensitive: bool = True
+    ) -> tuple[list[Item], int | None]:
+        """Recherche des articles par leur nom, du plus au moins pertinent.
+
+        Sous PostgreSQL, la recherche porte sur une sous-chaîne du nom et
+        s'appuie sur les index trigrammes créés par app.migrations ; sous
+        SQLite, sur les préfixes de mots via la table FTS5 ``items_fts``.
+
+        Args:
+            db: Session de base de données active.
+            q: Texte recherché.
+            skip: Nombre de résultats à sauter. Par défaut 0.
+            limit: Nombre maximum de résultats. Par défaut 100.
+            accent_insensitive: Ignorer les accents (« ecran » trouve « Écran »).
+
+        Returns:
+            Un tuple (articles, offset de la page suivante ou None).
+
+        Example:
+            >>> items, next_offset = ItemService.search(db, "ecran", limit=20)
+        """
+        dialect_name = db.get_bind().dialect.name
+        statement = search_statement(dialect_name, q, limit, skip, accent_insensitive)
+        rows = list(db.exec(statement).all())
+        return rows[:limit], skip + limit if len(rows) > limit else None
+
+    @staticmethod
+    def stream_rows(
+        db: Session, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Sequence[Row[int | None, str, float, int]]]:
+        """Parcourt toute la table par lots, sur un curseur côté serveur.
+
+        Seuls les lots en cours de traitement sont en mémoire : le coût
+        mémoire ne dépend pas de la taille de la table. Les lignes sont des
+        tuples (id, nom, prix, version), sans objets ORM.
+
+        Args:
+            db: Session de base de données active, ouverte pendant tout le parcours.
+            batch_size: Nombre de lignes par lot. Par défaut EXPORT_BATCH_SIZE.
+
+        Yields:
+            Des lots d'au plus ``batch_size`` lignes, triées par id.
+
+        Example:
+            >>> for batch in ItemService.stream_rows(db, batch_size=500):
+            ...     print(len(batch))
+        """
+        result = db.execute(export_statement(batch_size))
+        yield from result.partitions()
+
     @staticmethod
     def get_by_id(db: Session, item_id: int) -> Item | None:
         """Récupère un article par son identifiant.
 
+        La lecture passe d'abord par le cache en mémoire (app.services.cache) ;
+        en cas d'absence, l'article lu en base y est stocké sous sa forme
+        ItemResponse. Un article servi depuis le cache est un objet détaché
+        de la session. Une session de réplica ne remplit pas le cache, et
+        une session dans la fenêtre d'écriture du client ne le lit pas.
+
         Args:
             db: Session de base de données active.
             item_id: Identifiant unique de l'article à récupérer.
@@ -53,12 +356,66 @@ class ItemService:
             >>> if item:
             ...     print(item.nom)
         """
-        return db.get(Item, item_id)
+        cached = get_cached_item(item_id) if reads_cache(db.info) else None
+        if cached is not None:
+            return cached
+
+        item = db.get(Item, item_id)
+        if item and fills_cache(db.info):
+            cache_item(item)
+        return item
+
+    @staticmethod
+    def get_many(
+        db: Session, ids: Sequence[int], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> list[Item | None]:
+        """Récupère plusieurs articles par leurs identifiants.
+
+        Le cache est consulté d'abord ; seuls les ids absents du cache sont
+        lus en base, par une requête ``IN`` / ``= ANY`` par paquet, et les
+        articles lus y sont stockés (mêmes exceptions que get_by_id).
+
+        Args:
+            db: Session de base de données active.
+            ids: Identifiants demandés, éventuellement répétés.
+            chunk_size: Nombre d'ids par requête. Par défaut BULK_CHUNK_SIZE.
+
+        Returns:
+            Un élément par id demandé, dans l'ordre de la demande : l'article,
+            ou None s'il n'existe pas.
+
+        Example:
+            >>> [item and item.nom for item in ItemService.get_many(db, [2, 99, 1])]
+            ['Souris', None, 'Clavier']
+        """
+        found: dict[int, Item] = {}
+        misses: list[int] = []
+        use_cache, fill_cache = reads_cache(db.info), fills_cache(db.info)
+        for item_id in dict.fromkeys(ids):
+            cached = get_cached_item(item_id) if use_cache else None
+            if cached is not None:
+                found[item_id] = cached
+            else:
+                misses.append(item_id)
+
+        dialect_name = db.get_bind().dialect.name
+        for chunk in chunks(misses, chunk_size):
+            for item in db.exec(by_ids_statement(dialect_name, chunk)):
+                if fill_cache:
+                    cache_item(item)
+                if item.id is not None:
+                    found[item.id] = item
+        return [found.get(item_id) for item_id in ids]
 
     @staticmethod
     def create(db: Session, item_data: ItemCreate) -> Item:
         """Crée un nouvel article dans la base de données.
 
+        Sur les bases qui acceptent ``INSERT ... RETURNING``, l'id généré et
+        la version par défaut reviennent avec l'INSERT : une instruction puis
+        le commit, sans relecture. Ailleurs, l'article est inséré par l'ORM
+        puis relu.
+
         Args:
             db: Session de base de données active.
             item_data: Données validées pour créer l'article (schéma ItemCreate).
@@ -71,64 +428,277 @@ class ItemService:
             >>> created = ItemService.create(db, new_item)
             >>> print(created.id)  # ID auto-généré
         """
-        item = Item(**item_data.model_dump())
-        db.add(item)
-        db.commit()
-        db.refresh(item)
+        if db.get_bind().dialect.insert_returning:
+            row = db.exec(insert_returning_statement(item_data.model_dump())).one()
+            db.commit()
+            item = Item.model_validate(row._asdict())
+        else:
+            item = Item(**item_data.model_dump())
+            db.add(item)
+            db.commit()
+            db.refresh(item)
+        assert item.id is not None
+        invalidate_items(item.id)
+        adjust_item_count(1)
         return item
 
     @staticmethod
-    def update(db: Session, item_id: int, item_data: ItemUpdate) -> Item | None:
+    def create_many(
+        db: Session, rows: Sequence[Any], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkCreateResult:
+        """Crée plusieurs articles en une seule transaction.
+
+        Chaque ligne est validée individuellement contre ItemCreate : les
+        lignes invalides sont signalées sans interrompre le lot. Les lignes
+        valides sont insérées par des INSERT multi-lignes de ``chunk_size``
+        lignes avec ``RETURNING id``, puis validées par un unique commit.
+
+        Args:
+            db: Session de base de données active.
+            rows: Données brutes des articles (dictionnaires ou ItemCreate).
+            chunk_size: Nombre de lignes par instruction INSERT. Par défaut BULK_CHUNK_SIZE.
+
+        Returns:
+            Le nombre d'articles créés, leurs ids dans l'ordre des lignes valides
+            et les erreurs de validation indexées par position dans ``rows``.
+
+        Example:
+            >>> result = ItemService.create_many(db, [{"nom": "Écran", "prix": 299.99}])
+            >>> result.ids
+            [1]
+        """
+        values, errors = validate_rows(rows)
+        ids: list[int] = []
+        if values:
+            ids = list(db.exec(bulk_insert_statement(chunk_size), params=values).scalars().all())
+            db.commit()
+            invalidate_items(*ids)
+            adjust_item_count(len(ids))
+
+        return BulkCreateResult(created=len(ids), ids=ids, errors=errors)
+
+    @staticmethod
+    def import_rows(db: Session, rows: Sequence[dict[str, Any]]) -> int:
+        """Charge un lot de lignes déjà validées et le valide par un commit.
+
+        Sous PostgreSQL (psycopg2), le lot est envoyé par ``COPY ... FROM STDIN``,
+        chronométré par observed_query puisqu'il échappe aux évènements du
+        curseur ; ailleurs, par un INSERT exécuté en executemany. Aucun id n'est renvoyé :
+        c'est le chemin de chargement le plus rapide, réservé aux imports.
+
+        Args:
+            db: Session de base de données active.
+            rows: Valeurs validées (dictionnaires ``nom``/``prix`` issus de ItemCreate).
+
+        Returns:
+            Le nombre de lignes chargées.
+
+        Example:
+            >>> ItemService.import_rows(db, [{"nom": "Écran", "prix": 299.99}])
+            1
+        """
+        if not rows:
+            return 0
+        dialect = db.get_bind().dialect
+        if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+            cursor = db.connection().connection.cursor()
+            try:
+                with observed_query(COPY_ITEMS_SQL, rows, executemany=True):
+                    cursor.copy_expert(COPY_ITEMS_SQL, copy_payload(rows))
+            finally:
+                cursor.close()
+        else:
+            db.exec(import_statement(), params=rows)
+        db.commit()
+        adjust_item_count(len(rows))
+        return len(rows)
+
+    @staticmethod
+    def update(
+        db: Session, item_id: int, item_data: ItemUpdate, expected_version: int | None = None
+    ) -> Item | None:
         """Met à jour un article existant avec les données fournies.
 
         Effectue une mise à jour partielle en ne modifiant que les champs
-        fournis dans item_data (grâce à exclude_unset=True).
+        fournis dans item_data (grâce à exclude_unset=True), et incrémente
+        la version de l'article. Sur les bases qui acceptent ``UPDATE ...
+        RETURNING`` (PostgreSQL, SQLite >= 3.35), l'écriture et la relecture
+        tiennent en une instruction ; si ``expected_version`` est fourni, la
+        condition ``version = :expected_version`` de cette instruction
+        remplace le verrou, et la version actuelle n'est relue qu'en cas
+        d'échec pour distinguer le conflit de l'absence. Ailleurs, l'article
+        est chargé (``SELECT ... FOR UPDATE`` si la version est vérifiée),
+        modifié puis relu par l'ORM.
 
         Args:
             db: Session de base de données active.
             item_id: Identifiant de l'article à mettre à jour.
             item_data: Données de mise à jour (schéma ItemUpdate).
+            expected_version: Version connue du client, None pour ne pas la vérifier.
 
         Returns:
             L'objet Item mis à jour, ou None si l'article n'existe pas.
 
+        Raises:
+            VersionConflictError: Si la version actuelle diffère de ``expected_version``.
+
         Example:
             >>> update_data = ItemUpdate(prix=249.99)  # Ne met à jour que le prix
-            >>> updated = ItemService.update(db, 1, update_data)
+            >>> updated = ItemService.update(db, 1, update_data, expected_version=3)
         """
-        item = db.get(Item, item_id)
+        update_data = item_data.model_dump(exclude_unset=True)
+        if db.get_bind().dialect.update_returning:
+            statement = update_returning_statement(item_id, update_data, expected_version)
+            row = db.exec(statement).one_or_none()
+            if row is None:
+                current_version = (
+                    db.exec(version_statement(item_id)).first()
+                    if expected_version is not None
+                    else None
+                )
+                db.rollback()
+                if current_version is None:
+                    return None
+                raise VersionConflictError(item_id, current_version)
+            db.commit()
+            invalidate_items(item_id)
+            return Item.model_validate(row._asdict())
+
+        item = db.get(Item, item_id, with_for_update=expected_version is not None)
         if not item:
             return None
+        if expected_version is not None and item.version != expected_version:
+            current_version = item.version
+            db.rollback()
+            raise VersionConflictError(item_id, current_version)
 
-        update_data = item_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(item, field, value)
+        item.version += 1
 
         db.add(item)
         db.commit()
         db.refresh(item)
+        invalidate_items(item_id)
         return item
 
     @staticmethod
-    def delete(db: Session, item_id: int) -> bool:
+    def update_many(
+        db: Session, rows: Sequence[ItemBulkUpdate], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkUpdateResult:
+        """Met à jour plusieurs articles par des UPDATE ensemblistes.
+
+        Les modifications sont envoyées comme une table de valeurs jointe à
+        ``items`` (``UPDATE items ... FROM (VALUES ...) AS v WHERE items.id = v.id``),
+        sans charger les objets ORM. Les champs absents valent NULL dans la
+        table de valeurs et conservent leur valeur actuelle grâce à COALESCE.
+        La version de chaque article modifié est incrémentée.
+        Si un id apparaît plusieurs fois, seule sa dernière occurrence est appliquée.
+        Une ligne sans aucun champ renseigné n'est pas envoyée à la base : elle
+        ne change ni la version ni le cache, et son id est rapporté à part.
+
+        Args:
+            db: Session de base de données active.
+            rows: Modifications à appliquer, chacune identifiée par son ``id``.
+            chunk_size: Nombre de lignes par instruction UPDATE. Par défaut BULK_CHUNK_SIZE.
+
+        Returns:
+            Le nombre et les ids des articles modifiés, les ids introuvables et
+            ceux des lignes sans modification.
+
+        Example:
+            >>> rows = [ItemBulkUpdate(id=1, prix=9.99), ItemBulkUpdate(id=2, nom="Souris")]
+            >>> ItemService.update_many(db, rows).count
+            2
+        """
+        changes, unchanged = split_bulk_updates(rows)
+        updated: list[int] = []
+        for chunk in chunks(changes, chunk_size):
+            updated.extend(db.exec(bulk_update_statement(chunk)).scalars().all())
+        db.commit()
+        invalidate_items(*updated)
+
+        return bulk_update_result([row.id for row in changes], updated, unchanged)
+
+    @staticmethod
+    def delete_many(
+        db: Session, ids: Sequence[int], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkWriteResult:
+        """Supprime plusieurs articles par des DELETE ensemblistes.
+
+        Args:
+            db: Session de base de données active.
+            ids: Identifiants des articles à supprimer.
+            chunk_size: Nombre d'ids par instruction DELETE. Par défaut BULK_CHUNK_SIZE.
+
+        Returns:
+            Le nombre et les ids des articles supprimés, ainsi que les ids introuvables.
+
+        Example:
+            >>> ItemService.delete_many(db, [1, 2, 3]).missing_ids
+            [3]
+        """
+        requested = list(dict.fromkeys(ids))
+        dialect_name = db.get_bind().dialect.name
+        deleted: list[int] = []
+        for chunk in chunks(requested, chunk_size):
+            deleted.extend(db.exec(bulk_delete_statement(dialect_name, chunk)).scalars().all())
+        db.commit()
+        invalidate_items(*deleted)
+        adjust_item_count(-len(deleted))
+
+        return bulk_write_result(requested, deleted)
+
+    @staticmethod
+    def delete(db: Session, item_id: int, expected_version: int | None = None) -> bool:
         """Supprime un article de la base de données.
 
+        Sur les bases qui acceptent ``DELETE ... RETURNING``, la suppression
+        tient en une instruction dont la ligne renvoyée indique si l'article
+        existait ; ailleurs, l'article est chargé puis supprimé par l'ORM.
+        ``expected_version`` est vérifié comme dans update.
+
         Args:
             db: Session de base de données active.
             item_id: Identifiant de l'article à supprimer.
+            expected_version: Version connue du client, None pour ne pas la vérifier.
 
         Returns:
             True si l'article a été supprimé, False s'il n'existait pas.
 
+        Raises:
+            VersionConflictError: Si la version actuelle diffère de ``expected_version``.
+
         Example:
             >>> success = ItemService.delete(db, 1)
             >>> if success:
             ...     print("Article supprimé avec succès")
         """
-        item = db.get(Item, item_id)
-        if not item:
-            return False
+        if db.get_bind().dialect.delete_returning:
+            statement = delete_returning_statement(item_id, expected_version)
+            deleted = db.exec(statement).first() is not None
+            if not deleted:
+                current_version = (
+                    db.exec(version_statement(item_id)).first()
+                    if expected_version is not None
+                    else None
+                )
+                db.rollback()
+                if current_version is None:
+                    return False
+                raise VersionConflictError(item_id, current_version)
+            db.commit()
+        else:
+            item = db.get(Item, item_id, with_for_update=expected_version is not None)
+            if not item:
+                return False
+            if expected_version is not None and item.version != expected_version:
+                current_version = item.version
+                db.rollback()
+                raise VersionConflictError(item_id, current_version)
+            db.delete(item)
+            db.commit()
 
-        db.delete(item)
-        db.commit()
+        invalidate_items(item_id)
+        adjust_item_count(-1)
         return True
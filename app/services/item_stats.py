@@ -0,0 +1,148 @@
+"""Statistiques agrégées sur les prix, calculées par la base.
+
+Sous PostgreSQL, une seule instruction calcule le résumé (effectif, bornes,
+moyenne, écart type, percentiles par ``percentile_cont``) dans une CTE, puis
+l'histogramme par ``width_bucket`` sur les bornes de cette CTE : une ligne
+est renvoyée par classe non vide, le résumé étant répété sur chacune.
+
+SQLite n'a ni percentile_cont, ni stddev, ni width_bucket : le repli calcule
+le résumé en une requête (écart type à partir de la moyenne des carrés),
+chaque percentile par une lecture ``ORDER BY prix LIMIT 2 OFFSET k`` servie
+par l'index ``(prix, id)``, et l'histogramme par un GROUP BY sur une
+expression arithmétique.
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import Integer, Select, case, cast, func, select, true
+from sqlmodel import col
+
+from app.models.item import Item
+from app.schemas.item import ItemStats, PriceBucket
+
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+def postgres_stats_statement(buckets: int) -> Select[*tuple[Any, ...]]:
+    """Résumé et histogramme en une instruction (PostgreSQL)."""
+    prix = col(Item.prix)
+    summary = select(
+        func.count().label("count"),
+        func.min(prix).label("min"),
+        func.max(prix).label("max"),
+        func.avg(prix).label("avg"),
+        func.stddev_samp(prix).label("stddev"),
+        *(
+            func.percentile_cont(fraction).within_group(prix).label(name)
+            for name, fraction in PERCENTILES.items()
+        ),
+    ).cte("summary")
+    # width_bucket place le maximum dans la classe buckets + 1 et refuse
+    # des bornes égales : le maximum est ramené dans la dernière classe
+    bucket = case(
+        (summary.c.min == summary.c.max, 1),
+        else_=func.least(func.width_bucket(prix, summary.c.min, summary.c.max, buckets), buckets),
+    ).label("bucket")
+    histogram = (
+        select(bucket, func.count().label("bucket_count"))
+        .select_from(Item)
+        .join(summary, true())
+        .group_by(bucket)
+        .cte("histogram")
+    )
+    return select(summary, histogram.c.bucket, histogram.c.bucket_count).select_from(
+        summary.outerjoin(histogram, true())
+    )
+
+
+def summary_statement() -> Select[*tuple[Any, ...]]:
+    """Résumé sans percentiles, avec la moyenne des carrés pour l'écart type (repli)."""
+    prix = col(Item.prix)
+    return select(
+        func.count().label("count"),
+        func.min(prix).label("min"),
+        func.max(prix).label("max"),
+        func.avg(prix).label("avg"),
+        func.avg(prix * prix).label("avg_square"),
+    ).select_from(Item)
+
+
+def percentile_statement(offset: int) -> Select[float]:
+    """Les deux prix encadrant la position ``offset`` dans l'ordre croissant (repli)."""
+    return select(col(Item.prix)).order_by(col(Item.prix), col(Item.id)).offset(offset).limit(2)
+
+
+def histogram_statement(low: float, high: float, buckets: int) -> Select[*tuple[Any, ...]]:
+    """Effectif par classe de prix, classes numérotées de 1 à ``buckets`` (repli)."""
+    width = (high - low) / buckets if high > low else 1.0
+    raw = cast((col(Item.prix) - low) / width, Integer) + 1
+    bucket = case((raw > buckets, buckets), else_=raw).label("bucket")
+    return select(bucket, func.count().label("bucket_count")).group_by(bucket)
+
+
+def percentile_offset(count: int, fraction: float) -> int:
+    """Position inférieure de l'interpolation de percentile_cont."""
+    return math.floor(fraction * (count - 1))
+
+
+def interpolate(count: int, fraction: float, values: list[float]) -> float:
+    """percentile_cont à partir des deux valeurs lues à percentile_offset()."""
+    position = fraction * (count - 1)
+    lower = values[0]
+    upper = values[1] if len(values) > 1 else lower
+    return lower + (upper - lower) * (position - math.floor(position))
+
+
+def sample_stddev(count: int, avg: float, avg_square: float) -> float | None:
+    """Écart type d'échantillon (comme stddev_samp) depuis la moyenne et la moyenne des carrés."""
+    if count < 2:
+        return None
+    variance = max(avg_square - avg * avg, 0.0) * count / (count - 1)
+    return math.sqrt(variance)
+
+
+def build_stats(
+    summary: Mapping[str, Any], bucket_counts: Iterable[tuple[int, int]], buckets: int
+) -> ItemStats:
+    """Assemble la réponse à partir du résumé et des effectifs non nuls par classe.
+
+    Args:
+        summary: count, min, max, avg, stddev, p50, p90 et p99.
+        bucket_counts: Couples (numéro de classe à partir de 1, effectif).
+        buckets: Nombre de classes demandé.
+    """
+    count = summary["count"] or 0
+    histogram: list[PriceBucket] = []
+    if count:
+        low, high = float(summary["min"]), float(summary["max"])
+        counts = dict(bucket_counts)
+        if high == low:
+            histogram = [PriceBucket(lower=low, upper=high, count=count)]
+        else:
+            width = (high - low) / buckets
+            histogram = [
+                PriceBucket(
+                    lower=low + index * width,
+                    upper=high if index == buckets - 1 else low + (index + 1) * width,
+                    count=counts.get(index + 1, 0),
+                )
+                for index in range(buckets)
+            ]
+
+    def number(name: str) -> float | None:
+        value = summary.get(name)
+        return None if value is None else float(value)
+
+    return ItemStats(
+        count=count,
+        min=number("min"),
+        max=number("max"),
+        avg=number("avg"),
+        stddev=number("stddev"),
+        p50=number("p50"),
+        p90=number("p90"),
+        p99=number("p99"),
+        histogram=histogram,
+    )
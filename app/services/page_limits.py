@@ -0,0 +1,105 @@
+"""Taille de page adaptative par client.
+
+Chaque client (identifiant fourni par l'en-tête CLIENT_ID_HEADER, ou à
+défaut adresse IP) a un plafond de taille de page, MAX_ITEMS_PER_PAGE
+au départ. Le plafond suit une régulation AIMD, comme une fenêtre de
+congestion TCP : une page servie au-delà du budget de temps divise le
+plafond (décroissance multiplicative), une page servie dans le budget le
+relève d'un pas fixe (croissance additive). Un client qui demande des pages
+trop coûteuses voit donc ses pages rétrécir jusqu'à tenir dans le budget,
+sans pénaliser les autres.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class AdaptivePageLimiter:
+    """Plafonds de taille de page par client, régulés en AIMD, sûrs entre threads.
+
+    Seuls les clients dont le plafond est réduit sont mémorisés, au plus
+    ``maxsize`` (le moins récemment vu est oublié et retrouve le maximum).
+
+    Args:
+        max_limit: Plafond maximal (et initial) d'une page.
+        min_limit: Plafond minimal, jamais franchi à la baisse.
+        budget_ms: Budget de temps d'une page en millisecondes (0 désactive la régulation).
+        decrease: Facteur appliqué au plafond lorsqu'une page dépasse le budget.
+        increase: Pas de relèvement du plafond après une page dans le budget.
+        maxsize: Nombre maximal de clients mémorisés.
+
+    Example:
+        >>> limiter = AdaptivePageLimiter(max_limit=1000, min_limit=10, budget_ms=200)
+        >>> limiter.record("10.0.0.1", 1000, elapsed_ms=450)
+        >>> limiter.cap("10.0.0.1")
+        500
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int,
+        budget_ms: float,
+        decrease: float = 0.5,
+        increase: int = 50,
+        maxsize: int = 10000,
+    ) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.budget_ms = budget_ms
+        self.decrease = decrease
+        self.increase = increase
+        self.maxsize = maxsize
+        self._caps: OrderedDict[Hashable, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.reductions = 0
+
+    def cap(self, client: Hashable) -> int:
+        """Plafond courant du client."""
+        with self._lock:
+            return self._caps.get(client, self.max_limit)
+
+    def record(self, client: Hashable, limit: int, elapsed_ms: float) -> None:
+        """Ajuste le plafond du client après une page de ``limit`` articles.
+
+        Args:
+            client: Identifiant du client (voir app.routes.items.client_id).
+            limit: Taille de page effectivement servie.
+            elapsed_ms: Durée de traitement de la page en millisecondes.
+        """
+        if self.budget_ms <= 0:
+            return
+        with self._lock:
+            current = self._caps.get(client, self.max_limit)
+            if elapsed_ms > self.budget_ms:
+                reduced = max(self.min_limit, math.floor(min(current, limit) * self.decrease))
+                if reduced >= current:
+                    return
+                self._caps[client] = reduced
+                self._caps.move_to_end(client)
+                self.reductions += 1
+                while len(self._caps) > self.maxsize:
+                    self._caps.popitem(last=False)
+            elif client in self._caps:
+                raised = current + self.increase
+                if raised >= self.max_limit:
+                    del self._caps[client]
+                else:
+                    self._caps[client] = raised
+                    self._caps.move_to_end(client)
+
+    def clear(self) -> None:
+        """Rend à tous les clients le plafond maximal."""
+        with self._lock:
+            self._caps.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "budget_ms": self.budget_ms,
+                "limited_clients": len(self._caps),
+                "reductions": self.reductions,
+            }
@@ -0,0 +1,87 @@
+"""Encodage et décodage des curseurs de pagination (keyset pagination).
+
+Un curseur est un jeton opaque pour le client : il contient la clé et le
+sens de tri utilisés et les valeurs de la dernière ligne vue, encodées en
+JSON puis en base64 URL-safe. Le service s'en sert pour reprendre la lecture juste
+après cette ligne (``WHERE (nom, id) > (:nom, :id)``) au lieu de sauter
+``skip`` lignes.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+CURSOR_SORT_KEYS = ("id", "nom", "prix")
+SORT_DIRECTIONS = ("asc", "desc")
+
+
+class InvalidCursorError(ValueError):
+    """Levée lorsqu'un curseur fourni par le client est illisible ou incohérent."""
+
+
+def cursor_sort(order_by: str, direction: str = "asc") -> str:
+    """Identifiant du tri porté par un curseur : ``"nom"`` ou ``"nom:desc"``.
+
+    Le tri croissant garde le seul nom de la clé, ce qui laisse valides les
+    curseurs émis avant l'ajout du tri décroissant.
+    """
+    return order_by if direction == "asc" else f"{order_by}:{direction}"
+
+
+def encode_cursor(sort: str, values: list[Any]) -> str:
+    """Encode la position de la dernière ligne vue en jeton opaque.
+
+    Args:
+        sort: Tri de la pagination, tel que renvoyé par cursor_sort.
+        values: Valeurs de la clé de tri pour la dernière ligne, ``id`` en dernier.
+
+    Returns:
+        Le curseur encodé en base64 URL-safe, sans padding.
+    """
+    payload = json.dumps({"s": sort, "v": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: str) -> list[Any]:
+    """Décode un curseur et vérifie qu'il correspond à la clé de tri demandée.
+
+    Args:
+        cursor: Jeton reçu du client.
+        sort: Tri de la requête courante, tel que renvoyé par cursor_sort.
+
+    Returns:
+        Les valeurs de la clé de tri de la dernière ligne vue.
+
+    Raises:
+        InvalidCursorError: Si le jeton est mal formé ou a été émis pour un autre tri.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if not isinstance(payload, dict) or payload.get("s") != sort:
+        raise InvalidCursorError(f"Cursor was not issued for order_by={sort}")
+
+    key = sort.partition(":")[0]
+    values = payload.get("v")
+    expected = 1 if key == "id" else 2
+    if not isinstance(values, list) or len(values) != expected:
+        raise InvalidCursorError("Malformed cursor")
+    if not _is_int(values[-1]) or not _matches_key(key, values[0]):
+        raise InvalidCursorError("Malformed cursor")
+    return values
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _matches_key(key: str, value: Any) -> bool:
+    if key == "nom":
+        return isinstance(value, str)
+    if key == "prix":
+        return _is_int(value) or isinstance(value, float)
+    return True
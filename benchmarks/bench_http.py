@@ -0,0 +1,67 @@
+"""Benchmarks de bout en bout : requêtes HTTP à travers l'application ASGI.
+
+Les requêtes passent par ``app.main.app`` (routage, validation,
+sérialisation) via le TestClient, sans réseau. pytest-benchmark rapporte la
+latence par requête et le débit (colonne OPS, requêtes par seconde).
+"""
+
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.database import get_db, get_read_db
+from app.main import app
+from app.routes.items import MAX_ITEMS_PER_PAGE
+from benchmarks.tables import BenchTable
+
+pytestmark = pytest.mark.benchmark(group="http")
+
+
+@pytest.fixture
+def client(db: Session) -> Generator[TestClient]:
+    """Client HTTP sur l'application, branché sur la table peuplée."""
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_read_db] = lambda: db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _get(client: TestClient, url: str) -> None:
+    client.get(url).raise_for_status()
+
+
+def bench_list_default_page(benchmark, client: TestClient):
+    """GET /items/ : page par défaut de 100 articles."""
+    benchmark(_get, client, "/items/")
+
+
+def bench_list_full_page(benchmark, client: TestClient):
+    """GET /items/ : page maximale (MAX_ITEMS_PER_PAGE articles)."""
+    benchmark(_get, client, f"/items/?limit={MAX_ITEMS_PER_PAGE}")
+
+
+def bench_list_filtered_sorted(benchmark, client: TestClient):
+    """GET /items/ filtré par prix et trié par prix décroissant."""
+    benchmark(_get, client, "/items/?prix_min=100&prix_max=200&order_by=prix&direction=desc")
+
+
+def bench_get_item(benchmark, client: TestClient, table: BenchTable):
+    """GET /items/{item_id} (servi par le cache après le premier tour)."""
+    benchmark(_get, client, f"/items/{table.middle_id}")
+
+
+def bench_get_batch(benchmark, client: TestClient, table: BenchTable):
+    """GET /items/batch sur 100 ids."""
+    ids = ",".join(str(item_id) for item_id in range(1, min(table.size, 100) + 1))
+    benchmark(_get, client, f"/items/batch?ids={ids}")
+
+
+def bench_create_item(benchmark, client: TestClient):
+    """POST /items/."""
+
+    def create() -> None:
+        client.post("/items/", json={"nom": "Benchmark", "prix": 9.99}).raise_for_status()
+
+    benchmark(create)
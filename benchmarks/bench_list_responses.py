@@ -0,0 +1,91 @@
+"""Compare les deux chemins de GET /items/ sur des pages de MAX_ITEMS_PER_PAGE articles.
+
+- ``response_model`` : objets Item revalidés par FastAPI contre
+  ``list[ItemResponse]`` puis sérialisés ;
+- ``fast`` : colonnes seules (ItemService.get_rows) sérialisées par orjson
+  (app.routes.responses.ItemRowsResponse).
+
+La base est un SQLite en mémoire : le temps mesuré est essentiellement celui
+de l'application (construction des objets, validation, sérialisation).
+
+Usage:
+    python -m benchmarks.bench_list_responses --rows 10000 --repeat 200
+"""
+
+import argparse
+import os
+import statistics
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+from sqlmodel.pool import StaticPool  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import get_db, get_read_db  # noqa: E402
+from app.migrations import run_migrations  # noqa: E402
+from app.routes import build_items_router  # noqa: E402
+from app.routes.items import MAX_ITEMS_PER_PAGE  # noqa: E402
+from app.services.item_service import ItemService  # noqa: E402
+
+
+def build_client(rows: int) -> TestClient:
+    """Client sur les routes synchrones, base SQLite en mémoire peuplée de ``rows`` articles."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
+    session = Session(engine)
+    ItemService.create_many(
+        session, [{"nom": f"Article {index}", "prix": index + 0.99} for index in range(rows)]
+    )
+
+    api = FastAPI()
+    api.include_router(build_items_router(use_async=False))
+    api.dependency_overrides[get_db] = lambda: session
+    api.dependency_overrides[get_read_db] = lambda: session
+    return TestClient(api)
+
+
+def measure(client: TestClient, fast: bool, repeat: int) -> list[float]:
+    """Durées en millisecondes de ``repeat`` lectures d'une page complète."""
+    url = f"/items/?limit={MAX_ITEMS_PER_PAGE}"
+    durations = []
+    with patch("app.routes.items.settings", replace(settings, fast_list_responses=fast)):
+        client.get(url).raise_for_status()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            client.get(url).raise_for_status()
+            durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=MAX_ITEMS_PER_PAGE)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    client = build_client(args.rows)
+    results = {
+        "response_model": measure(client, fast=False, repeat=args.repeat),
+        "fast": measure(client, fast=True, repeat=args.repeat),
+    }
+    baseline = statistics.median(results["response_model"])
+    for name, durations in results.items():
+        median = statistics.median(durations)
+        print(
+            f"{name:>15}: median {median:7.2f} ms  "
+            f"p95 {statistics.quantiles(durations, n=20)[-1]:7.2f} ms  "
+            f"x{baseline / median:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmarks de la couche service (ItemService) selon la taille de la table."""
+
+import itertools
+
+import pytest
+from sqlmodel import Session
+
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.services.cache import item_cache
+from app.services.item_service import ItemService
+from benchmarks.tables import BenchTable
+
+pytestmark = pytest.mark.benchmark(group="service")
+
+
+def bench_get_all_first_page(benchmark, db: Session):
+    """Première page de 100 articles."""
+    items = benchmark(ItemService.get_all, db, 0, 100)
+    assert len(items) == 100
+
+
+def bench_get_all_deep_offset(benchmark, db: Session, table: BenchTable):
+    """Page de 100 articles au milieu de la table (coût de l'OFFSET)."""
+    items = benchmark(ItemService.get_all, db, table.size // 2, 100)
+    assert items
+
+
+def bench_get_page_by_cursor(benchmark, db: Session, table: BenchTable):
+    """Page de 100 articles au milieu de la table en pagination par curseur."""
+    _, cursor = ItemService.get_page(db, table.size // 2, None, "id")
+    items, _ = benchmark(ItemService.get_page, db, 100, cursor, "id")
+    assert items
+
+
+def bench_get_by_id_uncached(benchmark, db: Session, table: BenchTable):
+    """Lecture par id en base : cache et identity map vidés avant chaque tour."""
+
+    def cold() -> None:
+        item_cache.clear()
+        db.expunge_all()
+
+    item = benchmark.pedantic(
+        ItemService.get_by_id, args=(db, table.middle_id), setup=cold, rounds=200
+    )
+    assert item is not None
+
+
+def bench_get_by_id_cached(benchmark, db: Session, table: BenchTable):
+    """Lecture par id servie par le cache."""
+    ItemService.get_by_id(db, table.middle_id)
+    assert benchmark(ItemService.get_by_id, db, table.middle_id) is not None
+
+
+@pytest.mark.benchmark(group="create")
+def bench_create(benchmark, db: Session):
+    """Création d'un article (INSERT ... RETURNING et commit)."""
+    item = benchmark(ItemService.create, db, ItemCreate(nom="Benchmark", prix=9.99))
+    assert item.id is not None
+
+
+@pytest.mark.benchmark(group="create")
+def bench_create_with_refresh(benchmark, db: Session, monkeypatch: pytest.MonkeyPatch):
+    """Création par l'ORM, relue après le commit : référence du gain de bench_create."""
+    monkeypatch.setattr(db.get_bind().dialect, "insert_returning", False)
+    item = benchmark(ItemService.create, db, ItemCreate(nom="Benchmark", prix=9.99))
+    assert item.id is not None
+
+
+def bench_update(benchmark, db: Session, table: BenchTable):
+    """Mise à jour du prix d'un article (UPDATE et commit)."""
+    prices = itertools.count(1)
+
+    def update():
+        return ItemService.update(db, table.middle_id, ItemUpdate(prix=float(next(prices))))
+
+    assert benchmark(update) is not None
+
+
+def bench_delete(benchmark, db: Session):
+    """Suppression d'un article créé avant chaque tour (DELETE et commit)."""
+
+    def created() -> tuple[tuple[Session, int], dict[str, object]]:
+        return (db, ItemService.create(db, ItemCreate(nom="À supprimer", prix=1.0)).id), {}
+
+    assert benchmark.pedantic(ItemService.delete, setup=created, rounds=200) is True
@@ -0,0 +1,96 @@
+"""Configuration des benchmarks (pytest-benchmark).
+
+Chaque benchmark reçoit une table ``items`` peuplée, paramétrée par base et
+par taille :
+
+- ``--bench-sizes`` : tailles de table, séparées par des virgules
+  (``1000,10000`` par défaut ; ``1000,10000,100000,1000000`` pour la série complète) ;
+- ``BENCH_DATABASE_URL`` : URL d'un PostgreSQL local jetable (par exemple le
+  service ``db`` de docker-compose). Sans elle, seul SQLite en mémoire est
+  mesuré et les variantes PostgreSQL sont ignorées. La table ``items`` de
+  cette base est vidée et rechargée.
+
+Les résultats sont enregistrés dans ``benchmarks/baselines`` (voir README.md).
+"""
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+# Comme dans tests/conftest.py : l'app lit DATABASE_URL à l'import
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import pytest
+from sqlmodel import Session, create_engine
+from sqlmodel.pool import StaticPool
+
+from app.routes.items import page_limiter
+from app.services.cache import item_cache, item_count, item_stats
+from benchmarks.tables import BenchTable, populate
+
+BACKENDS = ("sqlite", "postgresql")
+DEFAULT_SIZES = "1000,10000"
+BASELINES = Path(__file__).parent / "baselines"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bench-sizes",
+        default=DEFAULT_SIZES,
+        help=f"Tailles de la table items, séparées par des virgules (défaut : {DEFAULT_SIZES})",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Baselines versionnées avec le code plutôt que dans ./.benchmarks
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINES}"
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "table" not in metafunc.fixturenames:
+        return
+    sizes = [int(size) for size in metafunc.config.getoption("bench_sizes").split(",")]
+    params = [(backend, size) for backend in BACKENDS for size in sizes]
+    metafunc.parametrize(
+        "table",
+        params,
+        ids=[f"{backend}-{size}" for backend, size in params],
+        indirect=True,
+        scope="session",
+    )
+
+
+@pytest.fixture(scope="session")
+def table(request: pytest.FixtureRequest) -> Generator[BenchTable]:
+    """Table peuplée pour le couple (base, taille) du paramètre."""
+    backend, size = request.param
+    if backend == "postgresql":
+        url = os.getenv("BENCH_DATABASE_URL")
+        if not url:
+            pytest.skip("BENCH_DATABASE_URL is not set")
+        engine = create_engine(url)
+    else:
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    populate(engine, size)
+    yield BenchTable(engine, size)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(table: BenchTable) -> Generator[Session]:
+    """Session sur la table peuplée."""
+    with Session(table.engine) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def reset_app_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Caches vides et taille de page fixe : chaque mesure part du même état."""
+    item_cache.clear()
+    item_count.invalidate()
+    item_stats.clear()
+    page_limiter.clear()
+    monkeypatch.setattr(page_limiter, "budget_ms", 0)
@@ -0,0 +1,353 @@
+"""Générateur de charge reproductible pour l'API des items.
+
+Envoie un mélange configurable de requêtes (lectures par id, listes, lectures
+par lot, pagination profonde, créations, mises à jour, suppressions) avec
+``--concurrency`` clients simultanés, puis écrit un rapport JSON : latences
+p50/p95/p99, débit et taux d'erreur, au total et par endpoint.
+
+Deux cibles :
+
+- en processus (par défaut) : ``app.main.app`` est appelée directement par
+  httpx (ASGITransport), lifespan compris, sur la base de ``DATABASE_URL``
+  (une base SQLite temporaire si la variable n'est pas définie) ;
+- sur le réseau : ``--url http://localhost:8000`` vise une API déjà démarrée,
+  par exemple avec les réglages de pool et de workers à valider.
+
+La suite d'opérations et leurs paramètres sont tirés d'une graine
+(``--seed``) : deux exécutions avec la même graine envoient les mêmes
+requêtes, à l'entrelacement des clients concurrents près.
+
+Usage:
+    python -m benchmarks.load --requests 5000 --concurrency 32 --output load.json
+    python -m benchmarks.load --url http://localhost:8000 --mix read=80,create=20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import httpx
+
+# Lectures (90 %) puis écritures (10 %)
+DEFAULT_MIX = {
+    "read": 60,
+    "list": 20,
+    "batch": 5,
+    "deep_page": 5,
+    "create": 5,
+    "update": 3,
+    "delete": 2,
+}
+SEED_CHUNK = 1000
+
+
+@dataclass
+class LoadConfig:
+    """Paramètres d'une exécution.
+
+    Attributes:
+        requests: Nombre total de requêtes de la phase de charge.
+        concurrency: Nombre de clients simultanés.
+        mix: Poids relatif de chaque opération (voir DEFAULT_MIX).
+        seed: Graine du tirage des opérations et de leurs paramètres.
+        seed_items: Articles créés avant la phase de charge.
+        batch_size: Nombre d'ids d'une lecture par lot.
+        page_size: Taille des pages de liste.
+    """
+
+    requests: int = 2000
+    concurrency: int = 16
+    mix: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 42
+    seed_items: int = 1000
+    batch_size: int = 50
+    page_size: int = 100
+
+
+@dataclass
+class Call:
+    """Requête à envoyer, étiquetée par son endpoint."""
+
+    endpoint: str
+    method: str
+    url: str
+    body: Any = None
+
+
+class ItemPool:
+    """Ids des articles existants, tenus à jour au fil des créations et suppressions."""
+
+    def __init__(self, ids: list[int]) -> None:
+        self.ids = ids
+
+    def pick(self, rng: random.Random) -> int:
+        return rng.choice(self.ids) if self.ids else 1
+
+    def take(self, rng: random.Random) -> int:
+        """Retire un id du pool, pour qu'aucune autre requête ne le vise ensuite."""
+        if not self.ids:
+            return 1
+        index = rng.randrange(len(self.ids))
+        self.ids[index], self.ids[-1] = self.ids[-1], self.ids[index]
+        return self.ids.pop()
+
+
+def _read(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    return Call("GET /items/{item_id}", "GET", f"/items/{pool.pick(rng)}")
+
+
+def _list(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    order_by = rng.choice(["id", "nom", "prix"])
+    return Call("GET /items/", "GET", f"/items/?limit={config.page_size}&order_by={order_by}")
+
+
+def _batch(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    ids = ",".join(str(pool.pick(rng)) for _ in range(config.batch_size))
+    return Call("GET /items/batch", "GET", f"/items/batch?ids={ids}")
+
+
+def _deep_page(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    skip = rng.randrange(len(pool.ids) // 2, len(pool.ids) + 1) if pool.ids else 0
+    return Call("GET /items/?skip=<deep>", "GET", f"/items/?skip={skip}&limit={config.page_size}")
+
+
+def _create(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    body = {"nom": f"Charge {rng.randrange(10**6)}", "prix": round(rng.uniform(1, 1000), 2)}
+    return Call("POST /items/", "POST", "/items/", body)
+
+
+def _update(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    body = {"prix": round(rng.uniform(1, 1000), 2)}
+    return Call("PUT /items/{item_id}", "PUT", f"/items/{pool.pick(rng)}", body)
+
+
+def _delete(pool: ItemPool, rng: random.Random, config: LoadConfig) -> Call:
+    return Call("DELETE /items/{item_id}", "DELETE", f"/items/{pool.take(rng)}")
+
+
+OPERATIONS: dict[str, Callable[[ItemPool, random.Random, LoadConfig], Call]] = {
+    "read": _read,
+    "list": _list,
+    "batch": _batch,
+    "deep_page": _deep_page,
+    "create": _create,
+    "update": _update,
+    "delete": _delete,
+}
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """Lit un mélange ``read=80,create=20`` ; les opérations absentes ont un poids nul.
+
+    Raises:
+        ValueError: Si une opération est inconnue ou si un poids est invalide.
+    """
+    mix = dict.fromkeys(OPERATIONS, 0)
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}, expected one of {', '.join(OPERATIONS)}")
+        mix[name] = int(weight)
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight for {name}")
+    if not any(mix.values()):
+        raise ValueError("The mix must contain at least one operation with a positive weight")
+    return mix
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Percentile par interpolation linéaire (comme percentile_cont) d'une liste triée."""
+    position = fraction * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * weight
+
+
+def summarize(
+    latencies_ms: list[float], errors: int, statuses: Counter[str], elapsed: float
+) -> dict:
+    """Statistiques d'une série de requêtes : latences, débit, taux d'erreur, statuts."""
+    ordered = sorted(latencies_ms)
+    count = len(ordered)
+    latency = (
+        {
+            "p50": round(percentile(ordered, 0.50), 3),
+            "p95": round(percentile(ordered, 0.95), 3),
+            "p99": round(percentile(ordered, 0.99), 3),
+            "mean": round(statistics.fmean(ordered), 3),
+            "max": round(ordered[-1], 3),
+        }
+        if ordered
+        else {}
+    )
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": latency,
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def _is_error(status: int) -> bool:
+    # Un 404 peut venir d'une suppression concurrente : il est compté dans
+    # les statuts mais pas comme une erreur
+    return status >= 400 and status != 404
+
+
+async def seed_items(client: httpx.AsyncClient, count: int) -> list[int]:
+    """Crée ``count`` articles par POST /items/bulk et renvoie leurs ids."""
+    ids: list[int] = []
+    for start in range(0, count, SEED_CHUNK):
+        rows = [
+            {"nom": f"Article {index}", "prix": index % 1000 + 0.99}
+            for index in range(start, min(start + SEED_CHUNK, count))
+        ]
+        response = await client.post("/items/bulk", json=rows)
+        response.raise_for_status()
+        ids.extend(response.json()["ids"])
+    return ids
+
+
+async def run_load(client: httpx.AsyncClient, config: LoadConfig) -> dict[str, Any]:
+    """Exécute la phase de charge et renvoie le rapport.
+
+    Args:
+        client: Client httpx pointant sur l'API (ASGITransport ou réseau).
+        config: Paramètres de l'exécution.
+
+    Returns:
+        Le rapport : configuration, totaux et statistiques par endpoint.
+    """
+    pool = ItemPool(await seed_items(client, config.seed_items))
+    rng = random.Random(config.seed)
+    names = [name for name, weight in config.mix.items() if weight > 0]
+    plan = rng.choices(names, weights=[config.mix[name] for name in names], k=config.requests)
+    next_index = iter(range(config.requests))
+
+    latencies: defaultdict[str, list[float]] = defaultdict(list)
+    errors: Counter[str] = Counter()
+    statuses: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    async def worker() -> None:
+        for index in next_index:
+            call_rng = random.Random(f"{config.seed}:{index}")
+            call = OPERATIONS[plan[index]](pool, call_rng, config)
+            started = time.perf_counter()
+            try:
+                response = await client.request(call.method, call.url, json=call.body)
+            except httpx.HTTPError as exc:
+                status, failed = type(exc).__name__, True
+            else:
+                status, failed = str(response.status_code), _is_error(response.status_code)
+                if call.method == "POST" and response.status_code == 201:
+                    pool.ids.append(response.json()["id"])
+            latencies[call.endpoint].append((time.perf_counter() - started) * 1000)
+            statuses[call.endpoint][status] += 1
+            errors[call.endpoint] += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    all_statuses: Counter[str] = Counter()
+    for counter in statuses.values():
+        all_statuses.update(counter)
+    return {
+        "config": asdict(config),
+        "duration_s": round(elapsed, 3),
+        "total": summarize(
+            [value for values in latencies.values() for value in values],
+            sum(errors.values()),
+            all_statuses,
+            elapsed,
+        ),
+        "endpoints": {
+            endpoint: summarize(latencies[endpoint], errors[endpoint], statuses[endpoint], elapsed)
+            for endpoint in sorted(latencies)
+        },
+    }
+
+
+async def run_in_process(config: LoadConfig) -> dict[str, Any]:
+    """Charge ``app.main.app`` en processus, lifespan compris."""
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            return await run_load(client, config)
+
+
+async def run_over_network(url: str, config: LoadConfig) -> dict[str, Any]:
+    """Charge une API déjà démarrée à l'adresse ``url``."""
+    limits = httpx.Limits(max_connections=config.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        return await run_load(client, config)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="API à charger ; par défaut, app.main.app en processus")
+    parser.add_argument("--requests", type=int, default=LoadConfig.requests)
+    parser.add_argument("--concurrency", type=int, default=LoadConfig.concurrency)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="Poids des opérations, par exemple read=60,list=20,batch=5,deep_page=5,"
+        "create=5,update=3,delete=2 (valeur par défaut)",
+    )
+    parser.add_argument("--seed", type=int, default=LoadConfig.seed)
+    parser.add_argument("--seed-items", type=int, default=LoadConfig.seed_items)
+    parser.add_argument("--batch-size", type=int, default=LoadConfig.batch_size)
+    parser.add_argument("--page-size", type=int, default=LoadConfig.page_size)
+    parser.add_argument("--output", help="Fichier du rapport JSON ; par défaut, la sortie standard")
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        mix=args.mix,
+        seed=args.seed,
+        seed_items=args.seed_items,
+        batch_size=args.batch_size,
+        page_size=args.page_size,
+    )
+    # Ce que l'application écrit sur la sortie standard pendant la charge part
+    # sur la sortie d'erreur : la sortie standard ne porte que le rapport JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.url:
+            report = asyncio.run(run_over_network(args.url, config))
+            report["target"] = args.url
+        else:
+            if "DATABASE_URL" not in os.environ:
+                database = os.path.join(tempfile.mkdtemp(prefix="items-load-"), "items.sqlite3")
+                os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+            report = asyncio.run(run_in_process(config))
+            report["target"] = "in-process"
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Tables peuplées sur lesquelles portent les benchmarks."""
+
+from dataclasses import dataclass
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from app.migrations import run_migrations
+from app.services.item_queries import IMPORT_BATCH_SIZE
+from app.services.item_service import ItemService
+
+
+@dataclass(frozen=True)
+class BenchTable:
+    """Table ``items`` peuplée de ``size`` articles d'ids 1 à ``size``."""
+
+    engine: Engine
+    size: int
+
+    @property
+    def middle_id(self) -> int:
+        return self.size // 2 or 1
+
+
+def _rows(start: int, stop: int) -> list[dict[str, object]]:
+    return [
+        {"nom": f"Article {index}", "prix": index % 1000 + 0.99} for index in range(start, stop)
+    ]
+
+
+def populate(engine: Engine, size: int) -> None:
+    """(Re)crée la table ``items`` et la charge de ``size`` articles."""
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
+    with Session(engine) as session:
+        for start in range(0, size, IMPORT_BATCH_SIZE):
+            ItemService.import_rows(session, _rows(start, min(start + IMPORT_BATCH_SIZE, size)))
@@ -1,18 +1,47 @@
 """Configuration globale des tests et fixtures partagées."""
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 
 # IMPORTANT: Définir DATABASE_URL AVANT tout import de l'app
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
-from app.database import get_db
+from app.database import get_async_db, get_async_read_db, get_db, get_read_db
 from app.main import app
+from app.migrations import migrate, run_migrations
+from app.observability import TimingMiddleware, count_queries, registry
+from app.routes import build_items_router
+from app.routes.items import page_limiter
+from app.services.cache import item_cache, item_count, item_stats
+from tests.fake_resp_server import FakeRespServer
+
+
+@pytest.fixture(autouse=True)
+def clear_item_cache() -> Generator[None]:
+    """Vide les caches, les plafonds de page et les métriques.
+
+    Chaque test a sa propre base.
+    """
+    item_cache.clear()
+    item_count.invalidate()
+    item_stats.clear()
+    page_limiter.clear()
+    registry.clear()
+    yield
+    item_cache.clear()
+    item_count.invalidate()
+    item_stats.clear()
+    page_limiter.clear()
+    registry.clear()
 
 
 @pytest.fixture(name="session", scope="function")
@@ -27,8 +56,9 @@ def session_fixture() -> Generator[Session]:
         poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
 
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -40,8 +70,84 @@ def client_fixture(session: Session) -> Generator[TestClient]:
         return session
 
     app.dependency_overrides[get_db] = get_session_override
+    app.dependency_overrides[get_read_db] = get_session_override
 
     client = TestClient(app)
     yield client
 
     app.dependency_overrides.clear()
+
+
+async def _create_tables(async_engine: AsyncEngine) -> None:
+    async with async_engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        await connection.run_sync(migrate)
+
+
+@pytest.fixture(name="async_engine")
+async def async_engine_fixture(anyio_backend: str) -> AsyncGenerator[AsyncEngine]:
+    """Fixture qui fournit un engine asynchrone SQLite en mémoire (aiosqlite)."""
+    async_engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    await _create_tables(async_engine)
+    yield async_engine
+    await async_engine.dispose()
+
+
+@pytest.fixture(name="async_session")
+async def async_session_fixture(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
+    """Fixture qui fournit une AsyncSession sur la base asynchrone de test."""
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture(name="async_client")
+def async_client_fixture() -> Generator[TestClient]:
+    """Fixture qui fournit un client de test sur les routes asynchrones des items.
+
+    L'engine aiosqlite est créé et utilisé dans la boucle d'évènements du client.
+    """
+    async_engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    async def get_async_session_override() -> AsyncGenerator[AsyncSession]:
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    async_app = FastAPI()
+    async_app.add_middleware(TimingMiddleware)
+    async_app.include_router(build_items_router(use_async=True))
+    async_app.dependency_overrides[get_async_db] = get_async_session_override
+    async_app.dependency_overrides[get_async_read_db] = get_async_session_override
+
+    with TestClient(async_app) as client:
+        client.portal.call(_create_tables, async_engine)
+        yield client
+        client.portal.call(async_engine.dispose)
+
+
+@pytest.fixture(name="resp_server")
+def resp_server_fixture() -> Generator[FakeRespServer]:
+    """Fixture qui démarre un faux serveur Redis local pour tester le cache partagé."""
+    server = FakeRespServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(name="assert_max_queries")
+def assert_max_queries_fixture() -> Callable[[int], AbstractContextManager[None]]:
+    """Fixture qui fait échouer le test si le bloc exécute plus de ``n`` requêtes SQL.
+
+    Example:
+        >>> with assert_max_queries(3):
+        ...     ItemService.update(session, item_id, changes)
+    """
+
+    @contextmanager
+    def assert_max_queries(n: int) -> Iterator[None]:
+        with count_queries() as counter:
+            yield
+        if counter.count > n:
+            statements = "\n".join(f"  {statement}" for statement in counter.statements)
+            pytest.fail(f"{counter.count} queries executed, expected at most {n}:\n{statements}")
+
+    return assert_max_queries
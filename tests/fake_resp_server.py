@@ -0,0 +1,142 @@
+"""Faux serveur parlant le protocole Redis (RESP2), pour les tests du cache partagé.
+
+Il implémente uniquement les commandes utilisées par app.services.cache :
+PING, AUTH, SELECT, GET, SET (avec PX/EX), DEL, FLUSHDB, PUBLISH et SUBSCRIBE.
+"""
+
+import socketserver
+import threading
+import time
+from typing import Any
+
+
+def _encode(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode(item) for item in value)
+    raise TypeError(type(value))
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "FakeRespServer"
+
+    def handle(self) -> None:
+        while True:
+            command = self._read_command()
+            if command is None:
+                break
+            reply = self.server.dispatch(self, command)
+            if reply is not None:
+                self.send(reply)
+        self.server.unsubscribe(self)
+
+    def send(self, data: bytes) -> None:
+        with self.server.lock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def _read_command(self) -> list[bytes] | None:
+        line = self.rfile.readline()
+        if not line.startswith(b"*"):
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+
+class FakeRespServer(socketserver.ThreadingTCPServer):
+    """Serveur RESP en mémoire, démarré dans un thread sur un port libre.
+
+    Example:
+        >>> server = FakeRespServer()
+        >>> server.start()
+        >>> url = server.url
+        >>> server.stop()
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password: str | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.password = password
+        self.lock = threading.Lock()
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.subscribers: dict[bytes, set[_Handler]] = {}
+        self.commands: list[list[bytes]] = []
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}{host}:{port}/0"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def unsubscribe(self, handler: _Handler) -> None:
+        with self.lock:
+            for handlers in self.subscribers.values():
+                handlers.discard(handler)
+
+    def dispatch(self, handler: _Handler, command: list[bytes]) -> bytes | None:
+        self.commands.append(command)
+        name, args = command[0].upper(), command[1:]
+        now = time.monotonic()
+        if name == b"PING":
+            return _encode("PONG")
+        if name == b"AUTH":
+            ok = self.password is not None and args[-1].decode() == self.password
+            return _encode("OK") if ok else b"-WRONGPASS invalid password\r\n"
+        if name in (b"SELECT", b"FLUSHDB"):
+            if name == b"FLUSHDB":
+                self.data.clear()
+            return _encode("OK")
+        if name == b"GET":
+            value, expires_at = self.data.get(args[0], (None, None))
+            if expires_at is not None and expires_at <= now:
+                self.data.pop(args[0], None)
+                value = None
+            return _encode(value)
+        if name == b"SET":
+            expires_at = None
+            options = [arg.upper() for arg in args[2:]]
+            if b"PX" in options:
+                expires_at = now + int(args[2 + options.index(b"PX") + 1]) / 1000
+            if b"EX" in options:
+                expires_at = now + int(args[2 + options.index(b"EX") + 1])
+            self.data[args[0]] = (args[1], expires_at)
+            return _encode("OK")
+        if name == b"DEL":
+            return _encode(sum(self.data.pop(key, None) is not None for key in args))
+        if name == b"PUBLISH":
+            with self.lock:
+                receivers = list(self.subscribers.get(args[0], ()))
+            for receiver in receivers:
+                receiver.send(_encode([b"message", args[0], args[1]]))
+            return _encode(len(receivers))
+        if name == b"SUBSCRIBE":
+            with self.lock:
+                for channel in args:
+                    self.subscribers.setdefault(channel, set()).add(handler)
+            for index, channel in enumerate(args, start=1):
+                handler.send(_encode([b"subscribe", channel, index]))
+            return None
+        return b"-ERR unknown command\r\n"
@@ -0,0 +1,296 @@
+"""Tests pour la pile asynchrone : AsyncItemService et routes async des items."""
+
+import json
+import threading
+from collections.abc import Hashable
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.item import Item
+from app.schemas.item import ItemBulkUpdate, ItemCreate, ItemUpdate
+from app.services.async_item_service import AsyncItemService
+from app.services.cache import (
+    REPLICA_SESSION,
+    WRITE_WINDOW_SESSION,
+    CacheBackend,
+    item_cache,
+    item_count,
+    item_stats,
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class ThreadRecordingCache(CacheBackend):
+    """Backend partagé factice notant le thread de chaque accès."""
+
+    def __init__(self) -> None:
+        self.threads: list[threading.Thread] = []
+
+    def get(self, key: Hashable) -> Any | None:
+        self.threads.append(threading.current_thread())
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.threads.append(threading.current_thread())
+
+    def delete(self, *keys: Hashable) -> None:
+        self.threads.append(threading.current_thread())
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+class TestAsyncItemService:
+    """Tests pour les méthodes du service asynchrone."""
+
+    @pytest.mark.anyio
+    async def test_create_and_get_by_id(self, async_session: AsyncSession):
+        """Test la création puis la lecture d'un item."""
+        created = await AsyncItemService.create(async_session, ItemCreate(nom="Écran", prix=199.0))
+
+        found = await AsyncItemService.get_by_id(async_session, created.id)
+
+        assert found is not None
+        assert found.nom == "Écran"
+
+    @pytest.mark.anyio
+    async def test_get_all_and_get_page(self, async_session: AsyncSession):
+        """Test la pagination offset et curseur."""
+        async_session.add_all([Item(nom=f"Item {i}", prix=float(i + 1)) for i in range(3)])
+        await async_session.commit()
+
+        items = await AsyncItemService.get_all(async_session, skip=1)
+        page, cursor = await AsyncItemService.get_page(async_session, limit=2)
+        rest, end = await AsyncItemService.get_page(async_session, limit=2, cursor=cursor)
+
+        assert [item.nom for item in items] == ["Item 1", "Item 2"]
+        assert [item.nom for item in page + rest] == ["Item 0", "Item 1", "Item 2"]
+        assert end is None
+
+    @pytest.mark.anyio
+    async def test_update_and_delete(self, async_session: AsyncSession):
+        """Test la mise à jour partielle puis la suppression."""
+        created = await AsyncItemService.create(async_session, ItemCreate(nom="Orig", prix=10.0))
+        item_id = created.id
+
+        updated = await AsyncItemService.update(async_session, item_id, ItemUpdate(prix=20.0))
+        deleted = await AsyncItemService.delete(async_session, item_id)
+
+        assert updated is not None
+        assert (updated.nom, updated.prix) == ("Orig", 20.0)
+        assert deleted is True
+        assert await AsyncItemService.update(async_session, item_id, ItemUpdate()) is None
+        assert await AsyncItemService.delete(async_session, item_id) is False
+
+    @pytest.mark.anyio
+    async def test_bulk_operations(self, async_session: AsyncSession):
+        """Test create_many, update_many et delete_many."""
+        created = await AsyncItemService.create_many(
+            async_session, [{"nom": "A", "prix": 1.0}, {"nom": ""}, {"nom": "B", "prix": 2.0}]
+        )
+        updated = await AsyncItemService.update_many(
+            async_session, [ItemBulkUpdate(id=created.ids[0], prix=5.0)]
+        )
+        deleted = await AsyncItemService.delete_many(async_session, [*created.ids, 9999])
+
+        assert created.created == 2
+        assert [error.index for error in created.errors] == [1]
+        assert updated.count == 1
+        assert deleted.count == 2
+        assert deleted.missing_ids == [9999]
+
+    @pytest.mark.anyio
+    async def test_replica_and_write_window_cache_rules(self, async_session: AsyncSession):
+        """Test qu'une réplica ne remplit pas le cache et que la fenêtre d'écriture l'ignore."""
+        item = await AsyncItemService.create(async_session, ItemCreate(nom="Caché", prix=1.0))
+        async_session.info[REPLICA_SESSION] = True
+
+        await AsyncItemService.get_by_id(async_session, item.id)
+        await AsyncItemService.get_many(async_session, [item.id])
+        assert item_cache.get(item.id) is None
+
+        item_cache.set(item.id, {"id": item.id, "nom": "Périmé", "prix": 1.0, "version": 1})
+        async_session.info[WRITE_WINDOW_SESSION] = True
+
+        assert (await AsyncItemService.get_by_id(async_session, item.id)).nom == "Caché"
+        assert (await AsyncItemService.get_many(async_session, [item.id]))[0].nom == "Caché"
+
+    @pytest.mark.anyio
+    async def test_replica_count_and_stats_are_not_cached(self, async_session: AsyncSession):
+        """Test que le total et les statistiques lus sur une réplica ne sont pas mis en cache."""
+        await AsyncItemService.create(async_session, ItemCreate(nom="A", prix=1.0))
+        async_session.info[REPLICA_SESSION] = True
+
+        assert await AsyncItemService.count(async_session) == 1
+        assert (await AsyncItemService.stats(async_session, buckets=2)).count == 1
+        assert item_count.get() is None
+        assert item_stats.get(2) is None
+
+    @pytest.mark.anyio
+    async def test_shared_cache_is_called_off_the_event_loop(
+        self, async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test qu'avec un backend partagé les accès au cache ne bloquent pas la boucle."""
+        shared = ThreadRecordingCache()
+        monkeypatch.setattr(item_cache, "shared", shared)
+
+        item = await AsyncItemService.create(async_session, ItemCreate(nom="A", prix=1.0))
+        item_cache.local.clear()
+        await AsyncItemService.get_by_id(async_session, item.id)
+        item_cache.local.clear()
+        await AsyncItemService.get_many(async_session, [item.id])
+        await AsyncItemService.delete(async_session, item.id)
+
+        assert len(shared.threads) == 6
+        assert threading.current_thread() not in shared.threads
+
+
+class TestAsyncItemsRoutes:
+    """Tests pour les routes async def des items."""
+
+    def test_full_crud_cycle(self, async_client: TestClient):
+        """Test un cycle complet CRUD sur les routes asynchrones."""
+        create_response = async_client.post("/items/", json={"nom": "Cycle", "prix": 10.0})
+        assert create_response.status_code == 201
+        item_id = create_response.json()["id"]
+
+        assert async_client.get(f"/items/{item_id}").json()["nom"] == "Cycle"
+        assert async_client.put(f"/items/{item_id}", json={"prix": 12.0}).json()["prix"] == 12.0
+        assert async_client.delete(f"/items/{item_id}").status_code == 204
+        assert async_client.get(f"/items/{item_id}").status_code == 404
+
+    def test_list_and_bulk_routes(self, async_client: TestClient):
+        """Test la liste, la pagination à curseur et les routes bulk."""
+        created = async_client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 3).json()
+        ids = created["ids"]
+
+        page = async_client.get("/items/?pagination=cursor&limit=2").json()
+        patched = async_client.patch("/items/bulk", json=[{"id": ids[0], "nom": "Z"}]).json()
+        deleted = async_client.request("DELETE", "/items/bulk", json={"ids": ids}).json()
+
+        assert len(async_client.get("/items/").json()) == 0
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] is not None
+        assert patched["count"] == 1
+        assert deleted["count"] == 3
+
+    def test_bulk_ids_beyond_int64_are_rejected(self, async_client: TestClient):
+        """Test que les routes bulk asynchrones bornent les ids comme les synchrones."""
+        huge = 2**63
+
+        deleted = async_client.request("DELETE", "/items/bulk", json={"ids": [huge]})
+        patched = async_client.patch("/items/bulk", json=[{"id": huge, "nom": "A"}])
+
+        assert deleted.status_code == 422
+        assert patched.status_code == 422
+
+    def test_conditional_requests(self, async_client: TestClient):
+        """Test les ETags, le 304 et le 412 sur les routes asynchrones."""
+        created = async_client.post("/items/", json={"nom": "Etag", "prix": 1.0})
+        item_id, etag = created.json()["id"], created.headers["ETag"]
+
+        not_modified = async_client.get(f"/items/{item_id}", headers={"If-None-Match": etag})
+        updated = async_client.put(
+            f"/items/{item_id}", json={"prix": 2.0}, headers={"If-Match": etag}
+        )
+        stale = async_client.put(
+            f"/items/{item_id}", json={"prix": 3.0}, headers={"If-Match": etag}
+        )
+
+        assert not_modified.status_code == 304
+        assert updated.headers["ETag"] == f'"{item_id}-2"'
+        assert stale.status_code == 412
+
+    def test_conditional_delete(self, async_client: TestClient):
+        """Test le DELETE conditionnel et l'If-Match sur un article absent."""
+        created = async_client.post("/items/", json={"nom": "Etag", "prix": 1.0})
+        item_id, etag = created.json()["id"], created.headers["ETag"]
+        async_client.put(f"/items/{item_id}", json={"prix": 2.0})
+
+        stale = async_client.delete(f"/items/{item_id}", headers={"If-Match": etag})
+        current = async_client.delete(f"/items/{item_id}", headers={"If-Match": f'"{item_id}-2"'})
+        missing = async_client.put(
+            f"/items/{item_id}", json={"prix": 3.0}, headers={"If-Match": "*"}
+        )
+
+        assert stale.status_code == 412
+        assert current.status_code == 204
+        assert missing.status_code == 412
+
+    def test_export(self, async_client: TestClient):
+        """Test l'export en flux NDJSON et CSV gzip sur la route asynchrone."""
+        async_client.post(
+            "/items/bulk", json=[{"nom": "A", "prix": 1.0}, {"nom": "B", "prix": 2.0}]
+        )
+
+        ndjson = async_client.get("/items/export?batch_size=1")
+        csv_gzip = async_client.get("/items/export?format=csv", headers={"Accept-Encoding": "gzip"})
+
+        assert [line["nom"] for line in map(json.loads, ndjson.text.splitlines())] == ["A", "B"]
+        assert csv_gzip.headers["content-encoding"] == "gzip"
+        assert csv_gzip.text.splitlines()[0] == "id,nom,prix,version"
+
+    def test_import(self, async_client: TestClient):
+        """Test l'import en flux sur la route asynchrone."""
+        body = b'{"nom": "A", "prix": 1}\n{"nom": "B"}\n{"nom": "C", "prix": 3}\n'
+
+        report = async_client.post("/items/import?batch_size=2", content=body).json()
+
+        assert (report["imported"], report["rejected"]) == (2, 1)
+        assert [item["nom"] for item in async_client.get("/items/").json()] == ["A", "C"]
+
+    def test_search(self, async_client: TestClient):
+        """Test la recherche FTS5 sur la route asynchrone."""
+        async_client.post(
+            "/items/bulk", json=[{"nom": "Écran", "prix": 1.0}, {"nom": "Souris", "prix": 2.0}]
+        )
+
+        data = async_client.get("/items/search?q=ecran").json()
+
+        assert [item["nom"] for item in data["items"]] == ["Écran"]
+
+    def test_count(self, async_client: TestClient):
+        """Test le comptage et l'en-tête X-Total-Count sur les routes asynchrones."""
+        async_client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 2)
+
+        count = async_client.get("/items/count?mode=estimate").json()
+        listing = async_client.get("/items/?include_total=true&limit=1")
+
+        assert count == {"count": 2, "mode": "exact"}
+        assert listing.headers["x-total-count"] == "2"
+
+    def test_stats(self, async_client: TestClient):
+        """Test les statistiques des prix sur les routes asynchrones."""
+        async_client.post(
+            "/items/bulk", json=[{"nom": "A", "prix": 1.0}, {"nom": "B", "prix": 3.0}]
+        )
+
+        data = async_client.get("/items/stats?buckets=2").json()
+
+        assert (data["count"], data["p50"], data["max"]) == (2, 2.0, 3.0)
+        assert [bucket["count"] for bucket in data["histogram"]] == [1, 1]
+
+    def test_batch(self, async_client: TestClient):
+        """Test la lecture par lot sur les routes asynchrones."""
+        created = async_client.post("/items/", json={"nom": "A", "prix": 1.0}).json()
+
+        by_query = async_client.get(f"/items/batch?ids=7,{created['id']}").json()
+        by_body = async_client.post("/items/batch", json={"ids": [created["id"]]}).json()
+
+        assert by_query["items"] == [None, created]
+        assert by_query["missing_ids"] == [7]
+        assert by_body["items"] == [created]
+
+    def test_invalid_cursor(self, async_client: TestClient):
+        """Test qu'un curseur invalide renvoie 400."""
+        assert async_client.get("/items/?cursor=invalide").status_code == 400
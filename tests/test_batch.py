@@ -0,0 +1,111 @@
+"""Tests pour la lecture d'items par lot (GET et POST /items/batch)."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.models.item import Item
+from app.routes.items import MAX_BATCH_IDS
+from app.services.cache import item_cache
+from app.services.item_queries import by_ids_statement
+from app.services.item_service import ItemService
+
+
+def _add_items(session: Session, count: int) -> list[Item]:
+    items = [Item(nom=f"Article {index}", prix=index + 1.0) for index in range(count)]
+    session.add_all(items)
+    session.commit()
+    return items
+
+
+class TestItemServiceGetMany:
+    """Tests pour ItemService.get_many."""
+
+    def test_request_order_and_missing(self, session: Session):
+        """Test l'ordre de la demande, les doublons et les ids introuvables."""
+        first, second = _add_items(session, 2)
+
+        items = ItemService.get_many(session, [second.id, 999, first.id, second.id])
+
+        assert [item and item.id for item in items] == [second.id, None, first.id, second.id]
+
+    def test_only_cache_misses_are_queried(self, session: Session):
+        """Test qu'une seule requête lit les ids absents du cache."""
+        first, second, third = _add_items(session, 3)
+        ids = [first.id, second.id, third.id]
+        ItemService.get_by_id(session, first.id)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            items = ItemService.get_many(session, ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert [item.nom for item in items] == ["Article 0", "Article 1", "Article 2"]
+        assert len(statements) == 1
+        assert statements[0].count("?") == 2
+        assert item_cache.get(third.id) is not None
+
+    def test_postgres_array_accepts_ids_beyond_int32(self):
+        """Test que le tableau ``= ANY`` de PostgreSQL est un BIGINT[], pas un INTEGER[]."""
+        compiled = by_ids_statement("postgresql", [1, 2**31]).compile(dialect=postgresql.dialect())
+
+        assert "::BIGINT[]" in str(compiled)
+        assert list(compiled.params.values()) == [[1, 2**31]]
+
+    def test_misses_are_chunked(self, session: Session):
+        """Test que les ids sont lus par paquets de chunk_size."""
+        items = _add_items(session, 5)
+
+        found = ItemService.get_many(session, [item.id for item in items], chunk_size=2)
+
+        assert [item.id for item in found] == [item.id for item in items]
+
+
+class TestBatchRoutes:
+    """Tests pour GET et POST /items/batch."""
+
+    def test_get_batch(self, client: TestClient):
+        """Test la lecture par query string avec un id introuvable."""
+        created = client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 2).json()
+        first, second = created["ids"]
+
+        data = client.get(f"/items/batch?ids={second},999,{first}").json()
+
+        assert [item and item["id"] for item in data["items"]] == [second, None, first]
+        assert data["missing_ids"] == [999]
+
+    def test_post_batch(self, client: TestClient):
+        """Test la lecture avec les ids dans le corps."""
+        created = client.post("/items/", json={"nom": "A", "prix": 1.0}).json()
+
+        data = client.post("/items/batch", json={"ids": [created["id"], 42]}).json()
+
+        assert data["items"][0]["nom"] == "A"
+        assert data["items"][1] is None
+        assert data["missing_ids"] == [42]
+
+    def test_invalid_ids(self, client: TestClient):
+        """Test qu'une liste mal formée ou trop longue est refusée."""
+        too_many = ",".join(["1"] * (MAX_BATCH_IDS + 1))
+        too_long = client.post("/items/batch", json={"ids": [1] * (MAX_BATCH_IDS + 1)})
+
+        assert client.get("/items/batch?ids=1,a").status_code == 422
+        assert client.get("/items/batch?ids=").status_code == 422
+        assert client.get(f"/items/batch?ids={too_many}").status_code == 422
+        assert too_long.status_code == 422
+
+    def test_ids_beyond_int64_are_rejected(self, client: TestClient):
+        """Test qu'un id hors de l'int64 donne un 422 et non une erreur du pilote."""
+        huge = 99999999999999999999999
+
+        assert client.get(f"/items/batch?ids=1,{huge}").status_code == 422
+        assert client.post("/items/batch", json={"ids": [1, huge]}).status_code == 422
+        assert client.post("/items/batch", json={"ids": [-1]}).status_code == 422
+        assert client.get(f"/items/batch?ids={2**63 - 1}").json()["missing_ids"] == [2**63 - 1]
@@ -0,0 +1,159 @@
+"""Tests pour le cache en mémoire des items."""
+
+from sqlmodel import Session
+
+from app.models.item import Item
+from app.schemas.item import ItemBulkUpdate, ItemCreate, ItemUpdate
+from app.services.cache import REPLICA_SESSION, WRITE_WINDOW_SESSION, TTLCache, item_cache
+from app.services.item_service import ItemService
+
+
+class FakeClock:
+    """Horloge manuelle pour tester l'expiration."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests pour la structure TTLCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test que les lectures réussies et manquées sont comptées."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(1, "un")
+
+        assert cache.get(1) == "un"
+        assert cache.get(2) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test que l'entrée la moins récemment lue est évincée."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set(1, "un")
+        cache.set(2, "deux")
+        cache.get(1)
+        cache.set(3, "trois")
+
+        assert cache.get(2) is None
+        assert cache.get(1) == "un"
+        assert cache.get(3) == "trois"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiration(self):
+        """Test qu'une entrée expirée n'est plus servie."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+        cache.set(1, "un")
+
+        clock.now = 4.9
+        assert cache.get(1) == "un"
+        clock.now = 5.0
+        assert cache.get(1) is None
+        assert cache.stats()["size"] == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        """Test qu'un cache désactivé ne stocke rien."""
+        cache = TTLCache(maxsize=10, ttl=60, enabled=False)
+        cache.set(1, "un")
+
+        assert cache.get(1) is None
+        assert cache.stats()["enabled"] is False
+
+    def test_delete_and_clear(self):
+        """Test l'invalidation ciblée et le vidage complet."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(1, "un")
+        cache.set(2, "deux")
+
+        cache.delete(1, 99)
+        assert cache.get(1) is None
+        cache.clear()
+        assert cache.stats()["size"] == 0
+
+
+class TestItemServiceCache:
+    """Tests pour la lecture via cache et l'invalidation par les écritures."""
+
+    def _create(self, session: Session) -> Item:
+        item = Item(nom="Caché", prix=10.0)
+        session.add(item)
+        session.commit()
+        session.refresh(item)
+        return item
+
+    def test_second_read_is_served_from_cache(self, session: Session):
+        """Test que la seconde lecture ne touche pas la base."""
+        item = self._create(session)
+
+        ItemService.get_by_id(session, item.id)
+        session.delete(item)
+        session.commit()
+        cached = ItemService.get_by_id(session, item.id)
+
+        assert cached is not None
+        assert cached.nom == "Caché"
+        assert item_cache.stats()["hits"] == 1
+
+    def test_update_invalidates(self, session: Session):
+        """Test que update invalide l'entrée en cache."""
+        item = self._create(session)
+        ItemService.get_by_id(session, item.id)
+
+        ItemService.update(session, item.id, ItemUpdate(nom="Modifié"))
+
+        assert ItemService.get_by_id(session, item.id).nom == "Modifié"
+
+    def test_delete_invalidates(self, session: Session):
+        """Test que delete invalide l'entrée en cache."""
+        item = self._create(session)
+        ItemService.get_by_id(session, item.id)
+
+        ItemService.delete(session, item.id)
+
+        assert ItemService.get_by_id(session, item.id) is None
+
+    def test_bulk_writes_invalidate(self, session: Session):
+        """Test que les écritures en masse invalident les entrées concernées."""
+        first = self._create(session)
+        second = self._create(session)
+        ItemService.get_by_id(session, first.id)
+        ItemService.get_by_id(session, second.id)
+
+        ItemService.update_many(session, [ItemBulkUpdate(id=first.id, prix=99.0)])
+        ItemService.delete_many(session, [second.id])
+
+        assert ItemService.get_by_id(session, first.id).prix == 99.0
+        assert ItemService.get_by_id(session, second.id) is None
+
+    def test_create_invalidates_reused_id(self, session: Session):
+        """Test que create invalide une entrée éventuelle pour l'id attribué."""
+        item_cache.set(1, {"id": 1, "nom": "Fantôme", "prix": 1.0})
+
+        created = ItemService.create(session, ItemCreate(nom="Nouveau", prix=2.0))
+
+        assert created.id == 1
+        assert ItemService.get_by_id(session, 1).nom == "Nouveau"
+
+    def test_replica_reads_do_not_fill_the_cache(self, session: Session):
+        """Test qu'une lecture sur une réplica ne met rien en cache."""
+        item = self._create(session)
+        session.info[REPLICA_SESSION] = True
+
+        assert ItemService.get_by_id(session, item.id) is not None
+        assert ItemService.get_many(session, [item.id])[0] is not None
+        assert item_cache.get(item.id) is None
+
+    def test_write_window_skips_the_cache(self, session: Session):
+        """Test qu'un client dans sa fenêtre d'écriture lit en base, pas dans le cache."""
+        item = self._create(session)
+        item_cache.set(item.id, {"id": item.id, "nom": "Périmé", "prix": 1.0, "version": 1})
+        session.info[WRITE_WINDOW_SESSION] = True
+
+        assert ItemService.get_by_id(session, item.id).nom == "Caché"
+        assert ItemService.get_many(session, [item.id])[0].nom == "Caché"
+        assert item_cache.stats()["hits"] == 0
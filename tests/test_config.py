@@ -0,0 +1,65 @@
+"""Tests pour les paramètres de l'application."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app.config import Settings
+
+
+class TestSettingsFromEnv:
+    """Tests pour la lecture des paramètres depuis l'environnement."""
+
+    def test_defaults(self):
+        """Test les valeurs par défaut lorsque rien n'est défini."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = Settings.from_env()
+
+        assert config.database_url == ""
+        assert config.use_async_db is False
+        assert config.pool_size == 10
+        assert config.pool_pre_ping is True
+        assert config.statement_timeout_ms == 0
+        assert config.item_count_ttl == 60.0
+        assert config.item_stats_ttl == 5.0
+
+    def test_values_are_parsed_and_typed(self):
+        """Test que les variables sont converties dans le bon type."""
+        env = {
+            "DATABASE_URL": "postgresql://db/items",
+            "USE_ASYNC_DB": "true",
+            "DB_POOL_SIZE": "25",
+            "DB_MAX_OVERFLOW": "5",
+            "DB_POOL_TIMEOUT": "2.5",
+            "DB_POOL_RECYCLE": "600",
+            "DB_POOL_PRE_PING": "0",
+            "DB_STATEMENT_TIMEOUT_MS": "5000",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = Settings.from_env()
+
+        assert config == Settings(
+            database_url="postgresql://db/items",
+            use_async_db=True,
+            pool_size=25,
+            max_overflow=5,
+            pool_timeout=2.5,
+            pool_recycle=600,
+            pool_pre_ping=False,
+            statement_timeout_ms=5000,
+        )
+
+    def test_invalid_integer_is_rejected(self):
+        """Test qu'une valeur numérique invalide fait échouer le démarrage."""
+        with patch.dict(os.environ, {"DB_POOL_SIZE": "beaucoup"}, clear=True):
+            with pytest.raises(ValueError):
+                Settings.from_env()
+
+    def test_replica_urls_are_split(self):
+        """Test que la liste des réplicas ignore les espaces et les entrées vides."""
+        env = {"DATABASE_REPLICA_URLS": " postgresql://r1/items, ,postgresql://r2/items,"}
+        with patch.dict(os.environ, env, clear=True):
+            config = Settings.from_env()
+
+        assert config.database_replica_urls == ("postgresql://r1/items", "postgresql://r2/items")
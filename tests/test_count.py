@@ -0,0 +1,124 @@
+"""Tests pour le comptage des items (GET /items/count et X-Total-Count)."""
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.models.item import Item
+from app.schemas.item import ItemCreate
+from app.services.cache import REPLICA_SESSION, CachedCounter, item_count
+from app.services.item_queries import ItemFilters, estimate_count_statement
+from app.services.item_service import ItemService
+from tests.test_cache import FakeClock
+
+
+class TestCachedCounter:
+    """Tests pour le compteur en cache."""
+
+    def test_adjust_known_total(self):
+        """Test que les écritures ajustent un total connu."""
+        counter = CachedCounter(ttl=60)
+        counter.store(10, counter.begin_load())
+
+        counter.adjust(3)
+        counter.adjust(-5)
+
+        assert counter.get() == 8
+
+    def test_expiration(self):
+        """Test que le total expire après le TTL."""
+        clock = FakeClock()
+        counter = CachedCounter(ttl=60, clock=clock)
+        counter.store(10, counter.begin_load())
+
+        clock.now = 61
+
+        assert counter.get() is None
+
+    def test_write_during_load_discards_loaded_total(self):
+        """Test qu'un total lu pendant une écriture concurrente n'est pas conservé."""
+        counter = CachedCounter(ttl=60)
+        token = counter.begin_load()
+        counter.adjust(1)
+
+        counter.store(10, token)
+
+        assert counter.get() is None
+
+    def test_zero_ttl_disables_cache(self):
+        """Test qu'un TTL nul ne garde jamais le total."""
+        counter = CachedCounter(ttl=0)
+        counter.store(10, counter.begin_load())
+
+        assert counter.get() is None
+
+
+class TestItemServiceCount:
+    """Tests pour ItemService.count et estimate_count."""
+
+    def test_count_is_cached_and_kept_up_to_date(self, session: Session):
+        """Test que create, create_many et delete ajustent le total sans recompter."""
+        session.add_all([Item(nom="A", prix=1.0), Item(nom="B", prix=2.0)])
+        session.commit()
+        assert ItemService.count(session) == 2
+
+        created = ItemService.create(session, ItemCreate(nom="C", prix=3.0))
+        ItemService.create_many(session, [{"nom": "D", "prix": 4.0}, {"nom": "E", "prix": 5.0}])
+        ItemService.delete(session, created.id)
+        ItemService.delete_many(session, [1, 999])
+
+        assert item_count.get() == 3
+        assert ItemService.count(session) == 3
+
+    def test_count_with_filters_is_not_cached(self, session: Session):
+        """Test qu'un comptage filtré est fait en SQL."""
+        session.add_all([Item(nom="A", prix=1.0), Item(nom="B", prix=20.0)])
+        session.commit()
+
+        assert ItemService.count(session, ItemFilters(prix_min=10)) == 1
+        assert item_count.get() is None
+
+    def test_replica_count_is_not_cached(self, session: Session):
+        """Test qu'un total compté sur une réplica ne remplit pas le cache."""
+        session.add(Item(nom="A", prix=1.0))
+        session.commit()
+        session.info[REPLICA_SESSION] = True
+
+        assert ItemService.count(session) == 1
+        assert item_count.get() is None
+
+    def test_estimate_is_unavailable_on_sqlite(self, session: Session):
+        """Test que SQLite ne fournit pas d'estimation."""
+        assert ItemService.estimate_count(session) is None
+
+    def test_estimate_statement_is_scalar(self):
+        """Test que l'estimation se lit comme un entier (Session.exec renvoie des scalaires)."""
+        assert isinstance(estimate_count_statement(), SelectOfScalar)
+
+
+class TestCountRoutes:
+    """Tests pour GET /items/count et l'en-tête X-Total-Count."""
+
+    def test_count_exact(self, client: TestClient):
+        """Test le comptage exact après des créations."""
+        client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 3)
+
+        assert client.get("/items/count").json() == {"count": 3, "mode": "exact"}
+
+    def test_count_estimate_falls_back_to_exact(self, client: TestClient):
+        """Test que le mode estimate se replie sur le total exact sans statistique."""
+        client.post("/items/", json={"nom": "A", "prix": 1.0})
+
+        assert client.get("/items/count?mode=estimate").json() == {"count": 1, "mode": "exact"}
+
+    def test_total_header_is_opt_in(self, client: TestClient):
+        """Test que X-Total-Count n'est envoyé que sur demande et suit les filtres."""
+        client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}, {"nom": "B", "prix": 9.0}])
+
+        plain = client.get("/items/?limit=1")
+        total = client.get("/items/?limit=1&include_total=true")
+        filtered = client.get("/items/?include_total=true&prix_min=5")
+
+        assert "x-total-count" not in plain.headers
+        assert total.headers["x-total-count"] == "2"
+        assert filtered.headers["x-total-count"] == "1"
@@ -0,0 +1,110 @@
+"""Tests pour l'export en flux des items (GET /items/export)."""
+
+import csv
+import gzip
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.item import Item
+from app.services.item_export import accepts_gzip, encode_export
+from app.services.item_service import ItemService
+
+
+def _create_items(session: Session, count: int) -> None:
+    session.add_all([Item(nom=f"Item {i}", prix=float(i + 1)) for i in range(count)])
+    session.commit()
+
+
+class TestStreamRows:
+    """Tests pour ItemService.stream_rows."""
+
+    def test_stream_rows_yields_batches_in_id_order(self, session: Session):
+        """Test le découpage en lots et l'ordre des lignes."""
+        _create_items(session, 5)
+
+        batches = list(ItemService.stream_rows(session, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [tuple(row) for row in batches[0]] == [(1, "Item 0", 1.0, 1), (2, "Item 1", 2.0, 1)]
+
+    def test_stream_rows_empty_table(self, session: Session):
+        """Test qu'une table vide ne produit aucun lot."""
+        assert list(ItemService.stream_rows(session)) == []
+
+
+class TestEncodeExport:
+    """Tests pour la sérialisation du flux d'export."""
+
+    def test_csv_has_header_and_escapes_values(self):
+        """Test l'en-tête CSV et l'échappement des virgules."""
+        body = b"".join(encode_export([[(1, "Écran, 24 pouces", 199.9, 2)]], "csv"))
+
+        rows = list(csv.reader(io.StringIO(body.decode())))
+
+        assert rows == [["id", "nom", "prix", "version"], ["1", "Écran, 24 pouces", "199.9", "2"]]
+
+    def test_gzip_stream_decompresses_to_plain_stream(self):
+        """Test que le flux compressé redonne le flux en clair."""
+        batches = [[(1, "A", 1.0, 1)], [(2, "B", 2.0, 1)]]
+
+        plain = b"".join(encode_export(batches, "ndjson"))
+        compressed = b"".join(encode_export(batches, "ndjson", gzip=True))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_accepts_gzip(self):
+        """Test l'analyse de l'en-tête Accept-Encoding."""
+        assert accepts_gzip("gzip, deflate, br")
+        assert accepts_gzip("br;q=1.0, gzip;q=0.5")
+        assert not accepts_gzip("gzip;q=0")
+        assert not accepts_gzip("identity")
+        assert not accepts_gzip(None)
+
+
+class TestExportRoute:
+    """Tests pour la route GET /items/export."""
+
+    def test_export_ndjson(self, client: TestClient, session: Session):
+        """Test l'export NDJSON de toute la table, au-delà d'un lot."""
+        _create_items(session, 5)
+
+        response = client.get("/items/export?batch_size=2", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "content-encoding" not in response.headers
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [1, 2, 3, 4, 5]
+        assert lines[0] == {"id": 1, "nom": "Item 0", "prix": 1.0, "version": 1}
+
+    def test_export_csv(self, client: TestClient, session: Session):
+        """Test l'export CSV et le nom du fichier proposé."""
+        _create_items(session, 2)
+
+        response = client.get("/items/export?format=csv")
+
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="items.csv"' in response.headers["content-disposition"]
+        assert response.text.splitlines() == [
+            "id,nom,prix,version",
+            "1,Item 0,1.0,1",
+            "2,Item 1,2.0,1",
+        ]
+
+    def test_export_gzip(self, client: TestClient, session: Session):
+        """Test la compression gzip à la volée lorsque le client l'accepte."""
+        _create_items(session, 3)
+
+        response = client.get("/items/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        # httpx décompresse le corps de lui-même
+        assert len(response.text.splitlines()) == 3
+
+    def test_export_invalid_format(self, client: TestClient):
+        """Test qu'un format inconnu est refusé."""
+        assert client.get("/items/export?format=xml").status_code == 422
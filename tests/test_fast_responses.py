@@ -0,0 +1,85 @@
+"""Tests pour le chemin rapide des listes (FAST_LIST_RESPONSES)."""
+
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.config import settings
+from app.models.item import Item
+from app.services.item_queries import ItemFilters
+from app.services.item_service import ItemService
+
+
+@pytest.fixture
+def slow_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Désactive le chemin rapide pour les routes synchrones et asynchrones."""
+    disabled = replace(settings, fast_list_responses=False)
+    monkeypatch.setattr("app.routes.items.settings", disabled)
+    monkeypatch.setattr("app.routes.items_async.settings", disabled)
+
+
+class TestItemServiceGetRows:
+    """Tests pour ItemService.get_rows."""
+
+    def test_rows_match_get_all(self, session: Session):
+        """Test que les lignes suivent les filtres et le tri de get_all."""
+        session.add_all([Item(nom=f"Article {prix}", prix=float(prix)) for prix in (3, 1, 2, 9)])
+        session.commit()
+        filters = ItemFilters(prix_max=5)
+
+        rows = ItemService.get_rows(session, 0, 10, filters, "prix", "desc")
+        items = ItemService.get_all(session, 0, 10, filters, "prix", "desc")
+
+        assert [row._asdict() for row in rows] == [
+            {"nom": item.nom, "prix": item.prix, "id": item.id, "version": item.version}
+            for item in items
+        ]
+
+
+class TestFastListResponses:
+    """Tests comparant les deux chemins de GET /items/."""
+
+    def _populate(self, client: TestClient) -> None:
+        client.post("/items/bulk", json=[{"nom": f"Écran {i}", "prix": i + 0.5} for i in range(5)])
+
+    def test_same_body_and_headers(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        """Test que le corps, l'ETag et X-Total-Count sont identiques sur les deux chemins."""
+        self._populate(client)
+        url = "/items/?limit=3&order_by=prix&direction=desc&include_total=true"
+
+        fast = client.get(url)
+        monkeypatch.setattr(
+            "app.routes.items.settings", replace(settings, fast_list_responses=False)
+        )
+        slow = client.get(url)
+
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.content == slow.content
+        assert fast.headers["etag"] == slow.headers["etag"]
+        assert fast.headers["x-total-count"] == slow.headers["x-total-count"] == "5"
+
+    def test_not_modified(self, client: TestClient):
+        """Test que le chemin rapide répond 304 à un client à jour."""
+        self._populate(client)
+        etag = client.get("/items/").headers["etag"]
+
+        assert client.get("/items/", headers={"If-None-Match": etag}).status_code == 304
+
+    @pytest.mark.usefixtures("slow_path")
+    def test_slow_path_still_serves_lists(self, client: TestClient):
+        """Test que le chemin response_model reste disponible."""
+        self._populate(client)
+
+        assert len(client.get("/items/?limit=2").json()) == 2
+
+    def test_async_routes(self, async_client: TestClient):
+        """Test le chemin rapide des routes asynchrones."""
+        async_client.post("/items/", json={"nom": "A", "prix": 1.0})
+
+        response = async_client.get("/items/?include_total=true")
+
+        assert response.json() == [{"id": 1, "nom": "A", "prix": 1.0, "version": 1}]
+        assert response.headers["x-total-count"] == "1"
+        assert "etag" in response.headers
@@ -0,0 +1,189 @@
+"""Tests pour l'import en flux des items (POST /items/import)."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.models.item import Item
+from app.schemas.item import BulkRowError
+from app.services import item_import
+from app.services.item_import import ImportFormatError, iter_lines, iter_records, run_import
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(iterator) -> list:
+    return [value async for value in iterator]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class TestIncrementalParsing:
+    """Tests pour le découpage du corps en lignes et en enregistrements."""
+
+    @pytest.mark.anyio
+    async def test_lines_split_across_chunks(self):
+        """Test qu'une ligne ou un caractère coupé entre deux morceaux est reconstitué."""
+        body = "nom\r\nÉcran\nSouris".encode()
+        accent = body.index(b"\xc3")
+
+        lines = await _collect(iter_lines(_chunks(body[: accent + 1], body[accent + 1 :])))
+
+        assert lines == ["nom", "Écran", "Souris"]
+
+    @pytest.mark.anyio
+    async def test_line_too_long(self, monkeypatch: pytest.MonkeyPatch):
+        """Test qu'une ligne sans fin dépassant la limite est refusée."""
+        monkeypatch.setattr(item_import, "MAX_LINE_LENGTH", 10)
+
+        with pytest.raises(ImportFormatError):
+            await _collect(iter_lines(_chunks(b"x" * 20)))
+
+    @pytest.mark.anyio
+    async def test_csv_quoted_newline(self):
+        """Test qu'un champ CSV entre guillemets peut contenir un saut de ligne."""
+        body = b'nom,prix\n"Ecran\n24 pouces",199.9\nSouris,9.9\n'
+
+        records = await _collect(iter_records(_chunks(body), "csv"))
+
+        assert records == [
+            (0, {"nom": "Ecran\n24 pouces", "prix": "199.9"}),
+            (1, {"nom": "Souris", "prix": "9.9"}),
+        ]
+
+    @pytest.mark.anyio
+    async def test_csv_missing_columns(self):
+        """Test qu'un en-tête CSV sans nom ni prix est refusé."""
+        with pytest.raises(ImportFormatError):
+            await _collect(iter_records(_chunks(b"a,b\n1,2\n"), "csv"))
+
+    @pytest.mark.anyio
+    async def test_ndjson_invalid_line(self):
+        """Test qu'une ligne JSON invalide devient une erreur de ligne."""
+        records = await _collect(iter_records(_chunks(b'{"nom": "A"}\n\n{oops\n'), "ndjson"))
+
+        assert records[0] == (0, {"nom": "A"})
+        assert isinstance(records[1][1], BulkRowError)
+        assert records[1][0] == 1
+
+
+class TestFormatErrorMidStream:
+    """Tests pour une erreur de format survenant après le chargement d'un lot."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("tail", "message"),
+        [
+            (b"Clavier,\xff\n", "Body is not valid UTF-8"),
+            (b"x" * 64, "Line longer than 32 characters"),
+            (b'"Clavier,29.9\n', "Unterminated quoted field at end of body"),
+        ],
+    )
+    async def test_report_keeps_loaded_batches(
+        self, monkeypatch: pytest.MonkeyPatch, tail: bytes, message: str
+    ):
+        """Test que le rapport décrit les lots chargés et l'erreur, sans relever l'exception."""
+        monkeypatch.setattr(item_import, "MAX_LINE_LENGTH", 32)
+        loaded: list[list[dict]] = []
+
+        async def load(rows: list[dict]) -> int:
+            loaded.append(rows)
+            return len(rows)
+
+        chunks = _chunks(b"nom,prix\nEcran,199.9\nSouris,9.9\n", b"Tapis,5.0\n", tail, b"\n")
+        report = await run_import(chunks, "csv", load, batch_size=2)
+
+        assert report.format_error == message
+        assert report.imported == 2
+        assert [batch.imported for batch in report.batches] == [2]
+        assert [[row["nom"] for row in rows] for rows in loaded] == [["Ecran", "Souris"]]
+
+    @pytest.mark.anyio
+    async def test_error_before_any_batch_raises(self):
+        """Test qu'une erreur avant le premier lot lève ImportFormatError : rien n'est chargé."""
+
+        async def load(rows: list[dict]) -> int:
+            raise AssertionError("nothing should be loaded")
+
+        with pytest.raises(ImportFormatError):
+            await run_import(_chunks(b"nom,prix\n\xff\n"), "csv", load, batch_size=2)
+
+
+class TestImportRoute:
+    """Tests pour la route POST /items/import."""
+
+    def test_import_ndjson_in_batches(self, client: TestClient, session: Session):
+        """Test l'import NDJSON, le découpage en lots et le rapport d'erreurs."""
+        lines = [b'{"nom": "Item %d", "prix": %d}\n' % (i, i + 1) for i in range(5)]
+        lines.insert(2, b'{"nom": "", "prix": 1}\n')
+
+        response = client.post("/items/import?batch_size=2", content=iter(lines))
+
+        assert response.status_code == 201
+        report = response.json()
+        assert (report["imported"], report["rejected"]) == (5, 1)
+        assert [batch["rows"] for batch in report["batches"]] == [2, 2, 2]
+        assert [error["index"] for error in report["errors"]] == [2]
+        names = session.exec(select(Item.nom).order_by(Item.id)).all()
+        assert names == [f"Item {i}" for i in range(5)]
+
+    def test_import_csv_from_content_type(self, client: TestClient, session: Session):
+        """Test l'import CSV détecté par le Content-Type, colonnes supplémentaires ignorées."""
+        body = "id,nom,prix,version\n1,Écran,199.9,4\n2,Souris,abc,1\n3,Clavier\n"
+
+        response = client.post(
+            "/items/import", content=body.encode(), headers={"Content-Type": "text/csv"}
+        )
+
+        report = response.json()
+        assert (report["imported"], report["rejected"]) == (1, 2)
+        assert [error["index"] for error in report["errors"]] == [1, 2]
+        item = session.exec(select(Item)).one()
+        assert (item.nom, item.prix, item.version) == ("Écran", 199.9, 1)
+
+    def test_import_round_trip_with_export(self, client: TestClient, session: Session):
+        """Test qu'un export CSV peut être réimporté tel quel."""
+        session.add_all([Item(nom="A, B", prix=1.5), Item(nom='Guillemet "x"', prix=2.0)])
+        session.commit()
+        exported = client.get("/items/export?format=csv").content
+
+        report = client.post("/items/import?format=csv", content=exported).json()
+
+        assert report["imported"] == 2
+        assert session.exec(select(Item.nom).where(Item.id > 2)).all() == ["A, B", 'Guillemet "x"']
+
+    def test_import_truncates_reported_errors(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test que seules les premières erreurs sont détaillées."""
+        monkeypatch.setattr(item_import, "MAX_REPORTED_ERRORS", 2)
+
+        report = client.post("/items/import", content=b"{}\n" * 5).json()
+
+        assert report["rejected"] == 5
+        assert len(report["errors"]) == 2
+        assert report["errors_truncated"] is True
+
+    def test_import_invalid_encoding(self, client: TestClient):
+        """Test qu'un corps qui n'est pas de l'UTF-8 renvoie 400."""
+        response = client.post("/items/import", content=b'{"nom": "\xff"}\n')
+
+        assert response.status_code == 400
+
+    def test_format_error_after_a_batch(self, client: TestClient, session: Session):
+        """Test qu'une erreur de format en cours de flux renvoie le rapport des lots validés."""
+        body = b'nom,prix\nEcran,199.9\nSouris,9.9\nTapis,5.0\n"Clavier,29.9\n'
+
+        response = client.post("/items/import?format=csv&batch_size=2", content=body)
+
+        assert response.status_code == 201
+        report = response.json()
+        assert report["format_error"] == "Unterminated quoted field at end of body"
+        assert [batch["imported"] for batch in report["batches"]] == [2]
+        assert session.exec(select(Item.nom).order_by(Item.id)).all() == ["Ecran", "Souris"]
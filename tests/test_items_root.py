@@ -1,9 +1,12 @@
 """Tests pour les routes API des items."""
 
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.models.item import Item
+from app.routes.conditional import MAX_VERSION, expected_version
 
 
 class TestGetItemsRoute:
@@ -66,6 +69,90 @@ class TestGetItemsRoute:
         assert data["prix"] == 49.99
 
 
+class TestGetItemsCursorPagination:
+    """Tests pour le mode de pagination à curseur de GET /items/."""
+
+    def test_cursor_mode_returns_page_with_next_cursor(self, client: TestClient, session: Session):
+        """Test que le mode cursor renvoie une page et un curseur suivant."""
+        for i in range(5):
+            session.add(Item(nom=f"Item {i}", prix=float(i + 1)))
+        session.commit()
+
+        response = client.get("/items/?pagination=cursor&limit=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["nom"] for item in data["items"]] == ["Item 0", "Item 1"]
+        assert data["next_cursor"] is not None
+
+    def test_cursor_mode_follows_cursor_to_the_end(self, client: TestClient, session: Session):
+        """Test que suivre next_cursor parcourt tous les items."""
+        for i in range(5):
+            session.add(Item(nom=f"Item {i}", prix=float(i + 1)))
+        session.commit()
+
+        noms = []
+        params = {"pagination": "cursor", "limit": 2}
+        while True:
+            data = client.get("/items/", params=params).json()
+            noms.extend(item["nom"] for item in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params = {"cursor": data["next_cursor"], "limit": 2}
+
+        assert noms == [f"Item {i}" for i in range(5)]
+
+    def test_cursor_mode_invalid_cursor(self, client: TestClient):
+        """Test qu'un curseur invalide renvoie 400."""
+        response = client.get("/items/?cursor=invalide")
+
+        assert response.status_code == 400
+
+    def test_offset_mode_is_still_a_list(self, client: TestClient, session: Session):
+        """Test que le mode offset par défaut renvoie toujours une liste."""
+        session.add(Item(nom="Item", prix=10.0))
+        session.commit()
+
+        response = client.get("/items/?limit=1")
+
+        assert isinstance(response.json(), list)
+
+
+class TestGetItemsFilteringAndSorting:
+    """Tests pour les filtres et tris de la route GET /items/."""
+
+    def _create_items(self, session: Session) -> None:
+        for nom, prix in [("Souris", 30.0), ("Écran", 10.0), ("Support", 20.0)]:
+            session.add(Item(nom=nom, prix=prix))
+        session.commit()
+
+    def test_filters_and_sort_in_offset_mode(self, client: TestClient, session: Session):
+        """Test les filtres de prix et de nom avec un tri décroissant."""
+        self._create_items(session)
+
+        response = client.get(
+            "/items/",
+            params={"prix_min": 15, "nom_prefix": "S", "order_by": "prix", "direction": "desc"},
+        )
+
+        assert [item["nom"] for item in response.json()] == ["Souris", "Support"]
+
+    def test_filters_in_cursor_mode(self, client: TestClient, session: Session):
+        """Test le tri par prix en mode curseur."""
+        self._create_items(session)
+
+        first = client.get("/items/?pagination=cursor&order_by=prix&limit=2").json()
+        rest = client.get(f"/items/?order_by=prix&limit=2&cursor={first['next_cursor']}").json()
+
+        assert [item["prix"] for item in first["items"] + rest["items"]] == [10.0, 20.0, 30.0]
+
+    def test_rejects_unknown_sort_key(self, client: TestClient):
+        """Test qu'une clé de tri hors liste blanche est refusée."""
+        assert client.get("/items/?order_by=version").status_code == 422
+        assert client.get("/items/?direction=random").status_code == 422
+        assert client.get("/items/?prix_min=-1").status_code == 422
+
+
 class TestGetItemRoute:
     """Tests pour la route GET /items/{item_id}."""
 
@@ -172,6 +259,115 @@ class TestCreateItemRoute:
         assert response.status_code == 422
 
 
+class TestCreateItemsBulkRoute:
+    """Tests pour la route POST /items/bulk."""
+
+    def test_bulk_create_success(self, client: TestClient, session: Session):
+        """Test la création d'un lot d'items."""
+        rows = [{"nom": f"Item {i}", "prix": float(i + 1)} for i in range(3)]
+
+        response = client.post("/items/bulk?chunk_size=2", json=rows)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 3
+        assert len(data["ids"]) == 3
+        assert data["errors"] == []
+        assert session.get(Item, data["ids"][0]).nom == "Item 0"
+
+    def test_bulk_create_partial_failure(self, client: TestClient):
+        """Test que les lignes invalides sont rapportées par index."""
+        rows = [{"nom": "Valide", "prix": 10.0}, {"nom": "Invalide"}]
+
+        response = client.post("/items/bulk", json=rows)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 1
+        assert data["errors"][0]["index"] == 1
+
+    def test_bulk_create_requires_a_list(self, client: TestClient):
+        """Test que le corps doit être une liste."""
+        response = client.post("/items/bulk", json={"nom": "Seul", "prix": 1.0})
+
+        assert response.status_code == 422
+
+
+class TestBulkUpdateDeleteRoutes:
+    """Tests pour les routes PATCH et DELETE /items/bulk."""
+
+    def test_bulk_update(self, client: TestClient, session: Session):
+        """Test la mise à jour d'un lot d'items."""
+        item = Item(nom="Original", prix=10.0)
+        session.add(item)
+        session.commit()
+        session.refresh(item)
+
+        response = client.patch(
+            "/items/bulk", json=[{"id": item.id, "prix": 20.0}, {"id": 9999, "nom": "X"}]
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "count": 1,
+            "ids": [item.id],
+            "missing_ids": [9999],
+            "unchanged_ids": [],
+        }
+        session.expire_all()
+        assert session.get(Item, item.id).prix == 20.0
+
+    def test_bulk_update_reports_rows_without_changes(self, client: TestClient, session: Session):
+        """Test qu'une ligne ne portant que son id n'est pas comptée comme mise à jour."""
+        item = Item(nom="Original", prix=10.0)
+        session.add(item)
+        session.commit()
+        session.refresh(item)
+
+        response = client.patch("/items/bulk", json=[{"id": item.id}])
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "count": 0,
+            "ids": [],
+            "missing_ids": [],
+            "unchanged_ids": [item.id],
+        }
+        session.expire_all()
+        assert session.get(Item, item.id).version == 1
+
+    def test_bulk_update_validation(self, client: TestClient):
+        """Test que les lignes de mise à jour sont validées."""
+        response = client.patch("/items/bulk", json=[{"id": 1, "prix": -1.0}])
+
+        assert response.status_code == 422
+
+    def test_bulk_ids_beyond_int64_are_rejected(self, client: TestClient):
+        """Test qu'un id hors de l'int64 renvoie 422, pas une erreur du pilote."""
+        huge = 99999999999999999999999
+
+        deleted = client.request("DELETE", "/items/bulk", json={"ids": [1, huge]})
+        patched = client.patch("/items/bulk", json=[{"id": huge, "nom": "A"}])
+
+        assert deleted.status_code == 422
+        assert patched.status_code == 422
+        assert client.patch("/items/bulk", json=[{"id": -1, "nom": "A"}]).status_code == 422
+
+    def test_bulk_delete(self, client: TestClient, session: Session):
+        """Test la suppression d'un lot d'items."""
+        item = Item(nom="À Supprimer", prix=10.0)
+        session.add(item)
+        session.commit()
+        session.refresh(item)
+        item_id = item.id
+
+        response = client.request("DELETE", "/items/bulk", json={"ids": [item_id, 9999]})
+
+        assert response.status_code == 200
+        assert response.json() == {"count": 1, "ids": [item_id], "missing_ids": [9999]}
+        assert session.get(Item, item_id) is None
+
+
 class TestUpdateItemRoute:
     """Tests pour la route PUT /items/{item_id}."""
 
@@ -249,6 +445,150 @@ class TestUpdateItemRoute:
         assert updated_item.nom == "Persisté"
 
 
+class TestConditionalRequests:
+    """Tests pour les ETags, If-None-Match et If-Match sur les routes des items."""
+
+    def _create_item(self, client: TestClient) -> tuple[int, str]:
+        response = client.post("/items/", json={"nom": "Conditionnel", "prix": 10.0})
+        return response.json()["id"], response.headers["ETag"]
+
+    def test_get_item_returns_version_etag(self, client: TestClient):
+        """Test que l'ETag d'un item est dérivé de son id et de sa version."""
+        item_id, etag = self._create_item(client)
+
+        response = client.get(f"/items/{item_id}")
+
+        assert response.headers["ETag"] == etag == f'"{item_id}-1"'
+        assert response.json()["version"] == 1
+
+    def test_get_item_not_modified(self, client: TestClient):
+        """Test qu'un If-None-Match à jour renvoie 304 sans corps."""
+        item_id, etag = self._create_item(client)
+
+        response = client.get(f"/items/{item_id}", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_get_item_modified_after_update(self, client: TestClient):
+        """Test qu'une mise à jour change l'ETag et invalide le 304."""
+        item_id, etag = self._create_item(client)
+        client.put(f"/items/{item_id}", json={"prix": 20.0})
+
+        response = client.get(f"/items/{item_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{item_id}-2"'
+
+    def test_get_items_list_etag(self, client: TestClient):
+        """Test l'ETag de liste en mode offset et curseur."""
+        item_id, _ = self._create_item(client)
+        listing = client.get("/items/")
+        page = client.get("/items/?pagination=cursor")
+
+        assert (
+            client.get("/items/", headers={"If-None-Match": listing.headers["ETag"]}).status_code
+            == 304
+        )
+        assert page.headers["ETag"] != listing.headers["ETag"]
+
+        client.put(f"/items/{item_id}", json={"nom": "Renommé"})
+        refreshed = client.get("/items/", headers={"If-None-Match": listing.headers["ETag"]})
+        assert refreshed.status_code == 200
+
+    def test_list_not_modified_keeps_headers(self, client: TestClient):
+        """Test que le 304 d'une liste porte les mêmes en-têtes que le 200."""
+        self._create_item(client)
+        listing = client.get("/items/?include_total=true&limit=10")
+
+        response = client.get(
+            "/items/?include_total=true&limit=10",
+            headers={"If-None-Match": listing.headers["ETag"]},
+        )
+
+        assert response.status_code == 304
+        for header in ("ETag", "X-Page-Limit", "X-Total-Count"):
+            assert response.headers[header] == listing.headers[header]
+
+    def test_put_with_matching_if_match(self, client: TestClient):
+        """Test qu'un If-Match à jour autorise la mise à jour."""
+        item_id, etag = self._create_item(client)
+
+        response = client.put(f"/items/{item_id}", json={"prix": 15.0}, headers={"If-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{item_id}-2"'
+
+    def test_put_with_stale_if_match(self, client: TestClient):
+        """Test qu'un If-Match périmé renvoie 412 sans modifier l'item."""
+        item_id, etag = self._create_item(client)
+        client.put(f"/items/{item_id}", json={"prix": 15.0})
+
+        response = client.put(f"/items/{item_id}", json={"prix": 99.0}, headers={"If-Match": etag})
+
+        assert response.status_code == 412
+        assert client.get(f"/items/{item_id}").json()["prix"] == 15.0
+
+    def test_put_with_foreign_if_match(self, client: TestClient):
+        """Test qu'un If-Match désignant un autre item renvoie 412."""
+        item_id, _ = self._create_item(client)
+
+        response = client.put(
+            f"/items/{item_id}", json={"prix": 1.0}, headers={"If-Match": '"999-1"'}
+        )
+
+        assert response.status_code == 412
+
+    def test_put_with_wildcard_if_match(self, client: TestClient):
+        """Test qu'un If-Match * ne vérifie pas la version."""
+        item_id, _ = self._create_item(client)
+
+        response = client.put(f"/items/{item_id}", json={"prix": 1.0}, headers={"If-Match": "*"})
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("version", ["99999999999999999999999", "2147483648"])
+    def test_put_with_out_of_range_if_match(self, client: TestClient, version: str):
+        """Test qu'une version hors de la colonne INTEGER est un désaccord : 412."""
+        item_id, _ = self._create_item(client)
+
+        response = client.put(
+            f"/items/{item_id}", json={"prix": 1.0}, headers={"If-Match": f'"{item_id}-{version}"'}
+        )
+
+        assert response.status_code == 412
+
+    def test_non_ascii_digits_are_rejected(self):
+        """Test qu'une version en chiffres non ASCII ne désigne aucune version."""
+        with pytest.raises(HTTPException) as error:
+            expected_version('"1-١"', 1)
+
+        assert error.value.status_code == 412
+        assert expected_version(f'"1-{MAX_VERSION}"', 1) == MAX_VERSION
+
+    @pytest.mark.parametrize("if_match", ['"999-1"', "*"])
+    def test_if_match_on_missing_item(self, client: TestClient, if_match: str):
+        """Test qu'un If-Match sur un article absent renvoie 412 (RFC 9110, 13.1.1)."""
+        put = client.put("/items/999", json={"prix": 1.0}, headers={"If-Match": if_match})
+        deleted = client.delete("/items/999", headers={"If-Match": if_match})
+
+        assert put.status_code == 412
+        assert deleted.status_code == 412
+        assert client.delete("/items/999").status_code == 404
+
+    def test_delete_with_if_match(self, client: TestClient):
+        """Test qu'un DELETE conditionnel périmé renvoie 412, et à jour supprime l'article."""
+        item_id, etag = self._create_item(client)
+        client.put(f"/items/{item_id}", json={"prix": 15.0})
+
+        stale = client.delete(f"/items/{item_id}", headers={"If-Match": etag})
+        current = client.delete(f"/items/{item_id}", headers={"If-Match": f'"{item_id}-2"'})
+
+        assert stale.status_code == 412
+        assert current.status_code == 204
+
+
 class TestDeleteItemRoute:
     """Tests pour la route DELETE /items/{item_id}."""
 
@@ -1,10 +1,14 @@
 """Tests pour le service ItemService."""
 
-from sqlmodel import Session
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
 
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.item import ItemBulkUpdate, ItemCreate, ItemUpdate
+from app.services.item_queries import ItemFilters, VersionConflictError
 from app.services.item_service import ItemService
+from app.services.pagination import InvalidCursorError
 
 
 class TestItemServiceGetAll:
@@ -72,6 +76,159 @@ class TestItemServiceGetAll:
         assert items[2].nom == "Item 4"
 
 
+class TestItemServiceGetPage:
+    """Tests pour la méthode get_page (pagination à curseur) du service."""
+
+    def test_get_page_walks_all_items_by_id(self, session: Session):
+        """Test que l'enchaînement des curseurs parcourt tous les items une seule fois."""
+        for i in range(7):
+            session.add(Item(nom=f"Item {i}", prix=float(i + 1)))
+        session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            items, cursor = ItemService.get_page(session, limit=3, cursor=cursor)
+            seen.extend(item.id for item in items)
+            if cursor is None:
+                break
+
+        assert seen == sorted(seen)
+        assert len(seen) == 7
+
+    def test_get_page_by_nom_breaks_ties_on_id(self, session: Session):
+        """Test que le tri par nom départage les doublons par id."""
+        for nom in ["B", "A", "B", "A", "C"]:
+            session.add(Item(nom=nom, prix=10.0))
+        session.commit()
+
+        first, cursor = ItemService.get_page(session, limit=3, order_by="nom")
+        second, end = ItemService.get_page(session, limit=3, cursor=cursor, order_by="nom")
+
+        assert [item.nom for item in first] == ["A", "A", "B"]
+        assert [item.nom for item in second] == ["B", "C"]
+        assert end is None
+        assert first[2].id < second[0].id
+
+    def test_get_page_last_page_has_no_cursor(self, session: Session):
+        """Test qu'une page incomplète ne renvoie pas de curseur."""
+        session.add(Item(nom="Seul", prix=10.0))
+        session.commit()
+
+        items, cursor = ItemService.get_page(session, limit=5)
+
+        assert len(items) == 1
+        assert cursor is None
+
+    def test_get_page_rejects_cursor_from_other_sort(self, session: Session):
+        """Test qu'un curseur émis pour un autre tri est refusé."""
+        for i in range(3):
+            session.add(Item(nom=f"Item {i}", prix=10.0))
+        session.commit()
+
+        _, cursor = ItemService.get_page(session, limit=1, order_by="id")
+
+        with pytest.raises(InvalidCursorError):
+            ItemService.get_page(session, limit=1, cursor=cursor, order_by="nom")
+
+    def test_get_page_rejects_malformed_cursor(self, session: Session):
+        """Test qu'un curseur illisible est refusé."""
+        with pytest.raises(InvalidCursorError):
+            ItemService.get_page(session, cursor="pas-un-curseur")
+
+
+class TestItemServiceFilteringAndSorting:
+    """Tests pour les filtres et tris de get_all et get_page."""
+
+    def _create_items(self, session: Session) -> None:
+        rows = [
+            ("Souris", 30.0),
+            ("Écran", 10.0),
+            ("Clavier", 20.0),
+            ("Câble", 10.0),
+            ("Support", 50.0),
+        ]
+        session.add_all([Item(nom=nom, prix=prix) for nom, prix in rows])
+        session.commit()
+
+    def test_get_all_filters_on_price_range(self, session: Session):
+        """Test le filtre prix_min/prix_max (bornes incluses) trié par prix."""
+        self._create_items(session)
+
+        items = ItemService.get_all(
+            session, filters=ItemFilters(prix_min=10.0, prix_max=30.0), order_by="prix"
+        )
+
+        assert [(item.prix, item.id) for item in items] == [
+            (10.0, 2),
+            (10.0, 4),
+            (20.0, 3),
+            (30.0, 1),
+        ]
+
+    def test_get_all_filters_on_name_prefix(self, session: Session):
+        """Test le filtre nom_prefix, jokers LIKE compris littéralement."""
+        self._create_items(session)
+        session.add(Item(nom="S%per", prix=1.0))
+        session.commit()
+
+        items = ItemService.get_all(session, filters=ItemFilters(nom_prefix="S"), order_by="nom")
+        escaped = ItemService.get_all(session, filters=ItemFilters(nom_prefix="S%"))
+
+        assert [item.nom for item in items] == ["S%per", "Souris", "Support"]
+        assert [item.nom for item in escaped] == ["S%per"]
+
+    def test_get_all_sorts_descending(self, session: Session):
+        """Test le tri décroissant départagé par id décroissant."""
+        self._create_items(session)
+
+        items = ItemService.get_all(session, order_by="prix", direction="desc")
+
+        assert [item.id for item in items] == [5, 1, 3, 4, 2]
+
+    def test_get_all_rejects_unknown_sort(self, session: Session):
+        """Test que seules les clés de tri de la liste blanche sont acceptées."""
+        with pytest.raises(InvalidCursorError):
+            ItemService.get_all(session, order_by="version")
+        with pytest.raises(InvalidCursorError):
+            ItemService.get_all(session, direction="sideways")
+
+    def test_get_page_by_price_descending_with_filters(self, session: Session):
+        """Test l'enchaînement des curseurs sur un tri par prix décroissant filtré."""
+        self._create_items(session)
+        filters = ItemFilters(prix_max=30.0)
+
+        seen = []
+        cursor = None
+        while True:
+            items, cursor = ItemService.get_page(
+                session, limit=2, cursor=cursor, order_by="prix", direction="desc", filters=filters
+            )
+            seen.extend(item.id for item in items)
+            if cursor is None:
+                break
+
+        assert seen == [1, 3, 4, 2]
+
+    def test_get_page_rejects_cursor_from_other_direction(self, session: Session):
+        """Test qu'un curseur émis pour le tri croissant est refusé en décroissant."""
+        self._create_items(session)
+        _, cursor = ItemService.get_page(session, limit=1, order_by="prix")
+
+        with pytest.raises(InvalidCursorError):
+            ItemService.get_page(session, cursor=cursor, order_by="prix", direction="desc")
+
+    def test_price_range_uses_composite_index(self, session: Session):
+        """Test que filtre et tri sur le prix sont servis par l'index (prix, id), sans tri."""
+        statement = select(Item).where(Item.prix >= 10).order_by(Item.prix, Item.id)
+        sql = str(statement.compile(compile_kwargs={"literal_binds": True}))
+
+        plan = " ".join(row[-1] for row in session.exec(text(f"EXPLAIN QUERY PLAN {sql}")).all())
+
+        assert "ix_items_prix_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
 class TestItemServiceGetById:
     """Tests pour la méthode get_by_id du service."""
 
@@ -132,6 +289,54 @@ class TestItemServiceCreate:
         assert item1.nom == "Item 1"
         assert item2.nom == "Item 2"
 
+    def test_create_without_returning(self, session: Session, monkeypatch: pytest.MonkeyPatch):
+        """Test le chemin ORM des bases sans INSERT ... RETURNING."""
+        monkeypatch.setattr(session.get_bind().dialect, "insert_returning", False)
+
+        created_item = ItemService.create(session, ItemCreate(nom="ORM", prix=5.0))
+
+        assert created_item.id is not None
+        assert created_item.version == 1
+
+
+class TestItemServiceCreateMany:
+    """Tests pour la méthode create_many du service."""
+
+    def test_create_many_inserts_all_rows(self, session: Session):
+        """Test que toutes les lignes valides sont insérées, dans l'ordre."""
+        rows = [{"nom": f"Item {i}", "prix": float(i + 1)} for i in range(5)]
+
+        result = ItemService.create_many(session, rows, chunk_size=2)
+
+        assert result.created == 5
+        assert result.errors == []
+        noms = [session.get(Item, item_id).nom for item_id in result.ids]
+        assert noms == [f"Item {i}" for i in range(5)]
+
+    def test_create_many_reports_invalid_rows(self, session: Session):
+        """Test que les lignes invalides sont signalées sans bloquer le lot."""
+        rows = [
+            {"nom": "Valide", "prix": 10.0},
+            {"nom": "", "prix": 10.0},
+            {"nom": "Prix négatif", "prix": -1.0},
+            ItemCreate(nom="Schéma", prix=5.0),
+            "pas un objet",
+        ]
+
+        result = ItemService.create_many(session, rows)
+
+        assert result.created == 2
+        assert [error.index for error in result.errors] == [1, 2, 4]
+        assert result.errors[1].errors[0]["loc"] == ["prix"]
+        assert len(ItemService.get_all(session)) == 2
+
+    def test_create_many_empty(self, session: Session):
+        """Test qu'un lot vide ne crée rien."""
+        result = ItemService.create_many(session, [])
+
+        assert result.created == 0
+        assert result.ids == []
+
 
 class TestItemServiceUpdate:
     """Tests pour la méthode update du service."""
@@ -190,6 +395,40 @@ class TestItemServiceUpdate:
         found_item = session.get(Item, item.id)
         assert found_item.nom == "Persisté"
 
+    def test_update_increments_version(self, session: Session):
+        """Test que chaque mise à jour incrémente la version de l'item."""
+        item = ItemService.create(session, ItemCreate(nom="Versionné", prix=10.0))
+        assert item.version == 1
+
+        ItemService.update(session, item.id, ItemUpdate(prix=11.0))
+        updated = ItemService.update(session, item.id, ItemUpdate(prix=12.0), expected_version=2)
+
+        assert updated.version == 3
+
+    def test_update_with_stale_version_raises(self, session: Session):
+        """Test qu'une version attendue périmée lève VersionConflictError sans modifier l'item."""
+        item = ItemService.create(session, ItemCreate(nom="Versionné", prix=10.0))
+        ItemService.update(session, item.id, ItemUpdate(prix=11.0))
+
+        with pytest.raises(VersionConflictError) as exc_info:
+            ItemService.update(session, item.id, ItemUpdate(prix=99.0), expected_version=1)
+
+        assert exc_info.value.current_version == 2
+        session.expire_all()
+        assert session.get(Item, item.id).prix == 11.0
+
+    def test_update_without_returning(self, session: Session, monkeypatch: pytest.MonkeyPatch):
+        """Test le chemin ORM des bases sans UPDATE ... RETURNING."""
+        monkeypatch.setattr(session.get_bind().dialect, "update_returning", False)
+        item = ItemService.create(session, ItemCreate(nom="Versionné", prix=10.0))
+
+        updated = ItemService.update(session, item.id, ItemUpdate(prix=11.0), expected_version=1)
+
+        assert (updated.prix, updated.version) == (11.0, 2)
+        assert ItemService.update(session, 9999, ItemUpdate(prix=1.0)) is None
+        with pytest.raises(VersionConflictError):
+            ItemService.update(session, item.id, ItemUpdate(prix=12.0), expected_version=1)
+
 
 class TestItemServiceDelete:
     """Tests pour la méthode delete du service."""
@@ -215,6 +454,15 @@ class TestItemServiceDelete:
 
         assert result is False
 
+    def test_delete_without_returning(self, session: Session, monkeypatch: pytest.MonkeyPatch):
+        """Test le chemin ORM des bases sans DELETE ... RETURNING."""
+        monkeypatch.setattr(session.get_bind().dialect, "delete_returning", False)
+        item = ItemService.create(session, ItemCreate(nom="À Supprimer", prix=15.0))
+
+        assert ItemService.delete(session, item.id) is True
+        assert ItemService.delete(session, item.id) is False
+        assert session.get(Item, item.id) is None
+
     def test_delete_item_removes_from_database(self, session: Session):
         """Test que l'item est bien supprimé de la base."""
         # Créer 2 items
@@ -233,3 +481,70 @@ class TestItemServiceDelete:
         items = ItemService.get_all(session)
         assert len(items) == 1
         assert items[0].nom == "Item 2"
+
+
+class TestItemServiceBulkWrites:
+    """Tests pour les méthodes update_many et delete_many du service."""
+
+    def _create_items(self, session: Session, count: int) -> list[int]:
+        items = [Item(nom=f"Item {i}", prix=float(i + 1)) for i in range(count)]
+        session.add_all(items)
+        session.commit()
+        return [item.id for item in items]
+
+    def test_update_many_applies_partial_changes(self, session: Session):
+        """Test que seuls les champs fournis sont modifiés."""
+        ids = self._create_items(session, 3)
+        rows = [
+            ItemBulkUpdate(id=ids[0], prix=99.0),
+            ItemBulkUpdate(id=ids[1], nom="Renommé"),
+        ]
+
+        result = ItemService.update_many(session, rows, chunk_size=1)
+
+        assert result.count == 2
+        assert result.ids == sorted(ids[:2])
+        assert result.missing_ids == []
+        session.expire_all()
+        first, second, third = (session.get(Item, item_id) for item_id in ids)
+        assert (first.nom, first.prix) == ("Item 0", 99.0)
+        assert (second.nom, second.prix) == ("Renommé", 2.0)
+        assert (third.nom, third.prix) == ("Item 2", 3.0)
+        assert (first.version, second.version, third.version) == (2, 2, 1)
+
+    def test_update_many_reports_missing_ids(self, session: Session):
+        """Test que les ids inexistants sont rapportés."""
+        ids = self._create_items(session, 1)
+
+        result = ItemService.update_many(
+            session, [ItemBulkUpdate(id=ids[0], prix=5.0), ItemBulkUpdate(id=9999, prix=5.0)]
+        )
+
+        assert result.count == 1
+        assert result.missing_ids == [9999]
+
+    def test_update_many_skips_rows_without_changes(self, session: Session):
+        """Test qu'une ligne sans champ renseigné ne touche ni la base ni le compte rendu."""
+        ids = self._create_items(session, 2)
+
+        result = ItemService.update_many(
+            session, [ItemBulkUpdate(id=ids[0]), ItemBulkUpdate(id=ids[1], prix=7.0)]
+        )
+
+        assert result.count == 1
+        assert result.ids == [ids[1]]
+        assert result.unchanged_ids == [ids[0]]
+        session.expire_all()
+        assert session.get(Item, ids[0]).version == 1
+        assert session.get(Item, ids[1]).version == 2
+
+    def test_delete_many_removes_rows(self, session: Session):
+        """Test que delete_many supprime les items existants et ignore les autres."""
+        ids = self._create_items(session, 3)
+
+        result = ItemService.delete_many(session, [ids[0], ids[2], 9999], chunk_size=2)
+
+        assert result.count == 2
+        assert result.ids == [ids[0], ids[2]]
+        assert result.missing_ids == [9999]
+        assert [item.id for item in ItemService.get_all(session)] == [ids[1]]
@@ -0,0 +1,75 @@
+"""Tests pour le générateur de charge (benchmarks/load.py)."""
+
+import asyncio
+import json
+import sys
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from benchmarks.load import LoadConfig, main, parse_mix, percentile, run_load
+
+
+class TestLoadHelpers:
+    """Tests pour la lecture du mélange et le calcul des percentiles."""
+
+    def test_parse_mix(self):
+        """Test que les opérations absentes ont un poids nul."""
+        mix = parse_mix("read=80, create=20")
+
+        assert mix["read"] == 80
+        assert mix["create"] == 20
+        assert mix["delete"] == 0
+
+    @pytest.mark.parametrize("text", ["lire=1", "read=-1", "read=0"])
+    def test_invalid_mix(self, text: str):
+        """Test qu'un mélange invalide est refusé."""
+        with pytest.raises(ValueError):
+            parse_mix(text)
+
+    def test_percentile_interpolates(self):
+        """Test l'interpolation linéaire entre deux valeurs."""
+        values = [float(value) for value in range(1, 11)]
+
+        assert percentile(values, 0.5) == pytest.approx(5.5)
+        assert percentile(values, 0.99) == pytest.approx(9.91)
+        assert percentile([3.0], 0.95) == 3.0
+
+
+class TestRunLoad:
+    """Tests pour une exécution courte en processus."""
+
+    def test_report(self, client: TestClient):
+        """Test le rapport : totaux cohérents et statistiques par endpoint."""
+        config = LoadConfig(requests=60, concurrency=1, seed_items=20, batch_size=5, page_size=10)
+
+        async def run() -> dict:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                return await run_load(http, config)
+
+        report = asyncio.run(run())
+
+        assert report["total"]["requests"] == 60
+        assert report["total"]["errors"] == 0
+        assert sum(endpoint["requests"] for endpoint in report["endpoints"].values()) == 60
+        assert report["endpoints"]["GET /items/{item_id}"]["latency_ms"]["p99"] > 0
+        assert report["config"]["mix"]["read"] == 60
+
+    def test_main_writes_only_json_to_stdout(
+        self,
+        client: TestClient,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test que la sortie standard de main() se lit en JSON, écritures comprises."""
+        argv = ["load", "--requests", "30", "--concurrency", "1", "--mix", "update=1,delete=1"]
+        monkeypatch.setattr(sys, "argv", argv)
+
+        main()
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["total"]["requests"] == 30
+        assert report["target"] == "in-process"
@@ -29,3 +29,24 @@ def test_app_metadata(client: TestClient):
     assert openapi["info"]["title"] == "Items CRUD API"
     assert openapi["info"]["version"] == "1.0.0"
     assert "API pour gérer une liste d'articles" in openapi["info"]["description"]
+
+
+def test_health_pool_endpoint(client: TestClient):
+    """Test que l'endpoint health/pool expose l'occupation du pool synchrone."""
+    response = client.get("/health/pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["sync"]) == {"pool", "size", "checked_out", "idle", "overflow"}
+
+
+def test_health_cache_endpoint(client: TestClient):
+    """Test que l'endpoint health/cache expose les compteurs du cache."""
+    client.get("/items/9999")
+
+    response = client.get("/health/cache")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["misses"] == 1
+    assert {"hits", "evictions", "size", "maxsize", "ttl", "enabled"} <= set(data)
@@ -0,0 +1,115 @@
+"""Tests pour le registre de métriques et l'endpoint /metrics."""
+
+import re
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.observability import CallbackMetric, Counter, Histogram, MetricsRegistry
+
+
+def sample(text: str, name: str, **labels: str) -> float | None:
+    """Valeur d'une série de l'exposition texte, ou None si elle est absente."""
+    for line in text.splitlines():
+        series, _, value = line.rpartition(" ")
+        match = re.fullmatch(rf"{name}(?:\{{(.*)\}})?", series)
+        if match is None:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(1) or ""))
+        if found == labels:
+            return float(value)
+    return None
+
+
+class TestMetricsRegistry:
+    """Tests pour les métriques et leur exposition."""
+
+    def test_histogram_is_cumulative(self):
+        """Test les classes cumulées, la somme et le nombre d'observations."""
+        registry = MetricsRegistry()
+        histogram = registry.register(Histogram("latency", "Latency.", ("route",), (0.1, 1.0)))
+
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value, ("/a",))
+        text = registry.render()
+
+        assert "# TYPE latency histogram" in text
+        assert sample(text, "latency_bucket", route="/a", le="0.1") == 1
+        assert sample(text, "latency_bucket", route="/a", le="1") == 3
+        assert sample(text, "latency_bucket", route="/a", le="+Inf") == 4
+        assert sample(text, "latency_sum", route="/a") == 4.25
+        assert sample(text, "latency_count", route="/a") == 4
+
+    def test_threads_are_summed(self):
+        """Test que les parts écrites par plusieurs threads sont additionnées."""
+        counter = Counter("hits_total", "Hits.")
+
+        def work() -> None:
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value() == 4000
+
+    def test_callback_and_escaping(self):
+        """Test les métriques calculées : valeurs None omises, labels échappés."""
+        registry = MetricsRegistry()
+        registry.register(
+            CallbackMetric(
+                "ratio", "Ratio.", "gauge", lambda: {('a"b',): 0.5, ("c",): None}, ("cache",)
+            )
+        )
+
+        text = registry.render()
+
+        assert 'ratio{cache="a\\"b"} 0.5' in text
+        assert 'cache="c"' not in text
+
+    def test_duplicate_name(self):
+        """Test qu'un nom de métrique ne peut être enregistré qu'une fois."""
+        registry = MetricsRegistry()
+        registry.register(Counter("hits_total", "Hits."))
+
+        with pytest.raises(ValueError):
+            registry.register(Counter("hits_total", "Hits."))
+
+
+class TestMetricsEndpoint:
+    """Tests pour GET /metrics sur l'application."""
+
+    def test_http_and_database_metrics(self, client: TestClient):
+        """Test la latence par modèle de route et les requêtes SQL par requête HTTP."""
+        item_id = client.post("/items/", json={"nom": "A", "prix": 1.0}).json()["id"]
+        client.get(f"/items/{item_id + 1}")
+        client.get("/nowhere")
+
+        response = client.get("/metrics")
+        text = response.text
+
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "404"}
+        assert sample(text, "http_request_duration_seconds_count", **labels) == 1
+        unmatched = {**labels, "route": "unmatched"}
+        assert sample(text, "http_request_duration_seconds_count", **unmatched) == 1
+        assert sample(text, "http_request_db_queries_sum", method="POST", route="/items/") >= 1
+        assert sample(text, "db_query_duration_seconds_count", operation="INSERT") >= 1
+        assert sample(text, "http_requests_in_flight") == 1
+
+    def test_pool_and_cache_metrics(self, client: TestClient):
+        """Test les jauges de pool et le taux de succès du cache des articles."""
+        item_id = client.post("/items/", json={"nom": "A", "prix": 1.0}).json()["id"]
+        client.get(f"/items/{item_id}")
+        client.get(f"/items/{item_id}")
+
+        text = client.get("/metrics").text
+
+        # Le pool de SQLite en mémoire n'a pas de compteurs : seules les en-têtes sont exposées
+        assert "# TYPE db_pool_connections gauge" in text
+        assert sample(text, "cache_lookups_total", cache="item", result="hit") >= 1
+        assert 0 < sample(text, "cache_hit_ratio", cache="item") <= 1
@@ -0,0 +1,68 @@
+"""Tests pour les migrations de schéma appliquées au démarrage."""
+
+from sqlalchemy import inspect, text
+from sqlmodel import Session, create_engine
+from sqlmodel.pool import StaticPool
+
+from app.migrations import run_migrations
+from app.models.item import Item
+from app.services.item_service import ItemService
+
+
+def _legacy_engine():
+    """Base contenant la table items telle que créée avant la colonne version."""
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE items "
+                "(id INTEGER PRIMARY KEY, nom VARCHAR NOT NULL, prix FLOAT NOT NULL)"
+            )
+        )
+        connection.execute(text("INSERT INTO items (nom, prix) VALUES ('Ancien', 5.0)"))
+    return engine
+
+
+class TestRunMigrations:
+    """Tests pour run_migrations."""
+
+    def test_adds_version_column_to_existing_rows(self):
+        """Test que les lignes existantes reçoivent la version 1."""
+        engine = _legacy_engine()
+
+        run_migrations(engine)
+
+        columns = {column["name"] for column in inspect(engine).get_columns("items")}
+        assert "version" in columns
+        with Session(engine) as session:
+            assert session.get(Item, 1).version == 1
+
+    def test_is_idempotent(self):
+        """Test que les migrations peuvent être rejouées à chaque démarrage."""
+        engine = _legacy_engine()
+
+        run_migrations(engine)
+        run_migrations(engine)
+
+        columns = [column["name"] for column in inspect(engine).get_columns("items")]
+        assert columns.count("version") == 1
+
+    def test_without_items_table(self):
+        """Test que l'absence de table items n'est pas une erreur."""
+        engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+
+        run_migrations(engine)
+
+        assert not inspect(engine).has_table("items")
+
+    def test_indexes_existing_rows_for_search(self):
+        """Test que la table FTS5 est reconstruite à partir des lignes existantes."""
+        engine = _legacy_engine()
+
+        run_migrations(engine)
+
+        with Session(engine) as session:
+            items, _ = ItemService.search(session, "ancien")
+        assert [item.nom for item in items] == ["Ancien"]
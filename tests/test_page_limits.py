@@ -0,0 +1,114 @@
+"""Tests pour la taille de page bornée et adaptative de GET /items/."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.routes.items import MAX_ITEMS_PER_PAGE, page_limiter
+from app.services.page_limits import AdaptivePageLimiter
+
+
+class TestAdaptivePageLimiter:
+    """Tests pour la régulation AIMD des plafonds de page."""
+
+    def test_over_budget_halves_the_cap(self):
+        """Test la décroissance multiplicative, bornée par min_limit."""
+        limiter = AdaptivePageLimiter(max_limit=1000, min_limit=100, budget_ms=200)
+
+        limiter.record("a", 1000, elapsed_ms=300)
+        assert limiter.cap("a") == 500
+        limiter.record("a", 500, elapsed_ms=300)
+        limiter.record("a", 250, elapsed_ms=300)
+        limiter.record("a", 125, elapsed_ms=300)
+
+        assert limiter.cap("a") == 100
+        assert limiter.cap("b") == 1000
+
+    def test_reduction_follows_the_served_page(self):
+        """Test qu'une petite page trop lente réduit le plafond sous sa taille."""
+        limiter = AdaptivePageLimiter(max_limit=1000, min_limit=10, budget_ms=200)
+
+        limiter.record("a", 100, elapsed_ms=300)
+
+        assert limiter.cap("a") == 50
+
+    def test_within_budget_raises_the_cap_back(self):
+        """Test la croissance additive jusqu'au maximum, où le client est oublié."""
+        limiter = AdaptivePageLimiter(max_limit=1000, min_limit=10, budget_ms=200, increase=300)
+        limiter.record("a", 1000, elapsed_ms=300)
+
+        limiter.record("a", 500, elapsed_ms=50)
+        assert limiter.cap("a") == 800
+        limiter.record("a", 800, elapsed_ms=50)
+
+        assert limiter.cap("a") == 1000
+        assert limiter.stats()["limited_clients"] == 0
+
+    def test_zero_budget_disables_regulation(self):
+        """Test qu'un budget nul ne réduit jamais le plafond."""
+        limiter = AdaptivePageLimiter(max_limit=1000, min_limit=10, budget_ms=0)
+
+        limiter.record("a", 1000, elapsed_ms=10_000)
+
+        assert limiter.cap("a") == 1000
+
+    def test_maxsize_forgets_oldest_client(self):
+        """Test que le nombre de clients mémorisés est borné."""
+        limiter = AdaptivePageLimiter(max_limit=1000, min_limit=10, budget_ms=1, maxsize=2)
+
+        for client in ("a", "b", "c"):
+            limiter.record(client, 1000, elapsed_ms=5)
+
+        assert [limiter.cap(client) for client in ("a", "b", "c")] == [1000, 500, 500]
+
+
+class TestPageLimitRoutes:
+    """Tests pour les bornes et l'en-tête X-Page-Limit de GET /items/."""
+
+    @pytest.mark.parametrize("query", ["limit=0", f"limit={MAX_ITEMS_PER_PAGE + 1}", "skip=-1"])
+    def test_out_of_bounds_parameters(self, client: TestClient, query: str):
+        """Test que limit et skip hors bornes sont refusés."""
+        assert client.get(f"/items/?{query}").status_code == 422
+
+    def test_effective_limit_header(self, client: TestClient):
+        """Test que la taille de page appliquée est renvoyée, en offset comme en curseur."""
+        client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 3)
+
+        offset = client.get("/items/?limit=2")
+        cursor = client.get("/items/?pagination=cursor&limit=1")
+
+        assert offset.headers["x-page-limit"] == "2"
+        assert len(offset.json()) == 2
+        assert cursor.headers["x-page-limit"] == "1"
+
+    def test_slow_pages_shrink_the_client_cap(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test qu'une page hors budget réduit la taille de page suivante du client."""
+        client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 5)
+        monkeypatch.setattr(page_limiter, "budget_ms", 1e-9)
+        monkeypatch.setattr(page_limiter, "min_limit", 2)
+
+        first = client.get("/items/?limit=4")
+        second = client.get("/items/?limit=4")
+
+        assert first.headers["x-page-limit"] == "4"
+        assert second.headers["x-page-limit"] == "2"
+        assert len(second.json()) == 2
+
+    def test_cap_is_kept_per_client_id(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        """Test que, derrière une même adresse, un client lent ne réduit que son plafond."""
+        client.post("/items/bulk", json=[{"nom": "A", "prix": 1.0}] * 5)
+        monkeypatch.setattr(page_limiter, "budget_ms", 1e-9)
+        monkeypatch.setattr(page_limiter, "min_limit", 2)
+
+        client.get("/items/?limit=4", headers={"X-Client-Id": "lent"})
+        slow = client.get("/items/?limit=4", headers={"X-Client-Id": "lent"})
+        other = client.get("/items/?limit=4", headers={"X-Client-Id": "autre"})
+
+        assert slow.headers["x-page-limit"] == "2"
+        assert other.headers["x-page-limit"] == "4"
+
+    def test_async_routes(self, async_client: TestClient):
+        """Test les bornes et l'en-tête sur les routes asynchrones."""
+        assert async_client.get(f"/items/?limit={MAX_ITEMS_PER_PAGE + 1}").status_code == 422
+        assert async_client.get("/items/?limit=5").headers["x-page-limit"] == "5"
@@ -0,0 +1,153 @@
+"""Tests pour le journal des requêtes lentes et le budget de requêtes SQL."""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.observability import (
+    count_queries,
+    instrument_engine_metrics,
+    instrument_engines,
+    instrument_query_profiler,
+    observed_query,
+    parameters_shape,
+    profiler,
+    queries,
+)
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.services.item_service import ItemService
+
+
+class TestParametersShape:
+    """Tests pour la forme des paramètres journalisée à la place des valeurs."""
+
+    def test_named_parameters(self):
+        """Test que seuls les noms et les types sont conservés."""
+        assert parameters_shape({"id": 1, "nom": "secret"}) == {"id": "int", "nom": "str"}
+
+    def test_positional_parameters(self):
+        """Test la forme des paramètres positionnels, simples et multiples."""
+        assert parameters_shape((1, "A")) == ("int", "str")
+        assert parameters_shape([(1, "A"), (2, "B")], executemany=True) == "2 x (int, str)"
+
+
+class TestSharedHook:
+    """Tests pour le point d'accroche SQL commun à la mesure, aux métriques et au profiler."""
+
+    def test_one_hook_feeds_every_instrumentation(self, session: Session):
+        """Test que les trois instrumentations s'inscrivent sur un seul trio de listeners."""
+        instrument_engines()
+        instrument_engine_metrics()
+        instrument_query_profiler(0, 0)
+        instrument_engines()
+
+        assert event.contains(Engine, "before_cursor_execute", queries._before_cursor_execute)
+        assert len(queries._observers) == 3
+        with count_queries() as counter:
+            ItemService.get_by_id(session, 1)
+        assert counter.count == 1
+        assert not session.connection().info.get(queries._QUERY_STARTS)
+
+    def test_observed_query_reaches_observers(self):
+        """Test qu'une instruction passée hors curseur (COPY) est comptée comme les autres."""
+        with count_queries() as counter:
+            with observed_query("COPY items (nom, prix) FROM STDIN", [{"nom": "A"}], True):
+                pass
+
+        assert counter.statements == ["COPY items (nom, prix) FROM STDIN"]
+
+
+class TestSlowQueryLog:
+    """Tests pour le journal des requêtes SQL lentes et le budget par requête HTTP."""
+
+    def test_slow_query_is_logged_with_route(
+        self, client: TestClient, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test qu'une requête au-delà du seuil est journalisée avec sa route."""
+        item_id = client.post("/items/", json={"nom": "A", "prix": 1.0}).json()["id"]
+        client.get(f"/items/{item_id}")
+        monkeypatch.setitem(profiler._limits, "slow_query_ms", 1e-9)
+
+        with caplog.at_level(logging.WARNING, logger="app.observability.profiler"):
+            client.put(f"/items/{item_id}", json={"prix": 2.0})
+
+        records = [record for record in caplog.records if hasattr(record, "slow_query")]
+        assert records
+        slow_query = records[0].slow_query
+        assert slow_query["route"] == "/items/{item_id}"
+        assert slow_query["statement"].startswith("UPDATE")
+        assert "float" in str(slow_query["parameters"])
+        assert "2.0" not in str(slow_query["parameters"])
+
+    def test_fast_queries_are_not_logged(
+        self, client: TestClient, caplog: pytest.LogCaptureFixture
+    ):
+        """Test qu'aucune requête n'est journalisée sous le seuil par défaut."""
+        with caplog.at_level(logging.WARNING, logger="app.observability.profiler"):
+            client.get("/items/")
+
+        assert not caplog.records
+
+    def test_query_budget(
+        self, client: TestClient, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test qu'une requête HTTP au-delà du budget de requêtes SQL est signalée."""
+        item_id = client.post("/items/", json={"nom": "A", "prix": 1.0}).json()["id"]
+        monkeypatch.setitem(profiler._limits, "query_budget", 1)
+
+        with caplog.at_level(logging.WARNING, logger="app.observability.profiler"):
+            client.get("/items/")
+            # Version périmée : UPDATE sans ligne, puis relecture de la version
+            stale = {"If-Match": f'"{item_id}-9"'}
+            client.put(f"/items/{item_id}", json={"prix": 2.0}, headers=stale)
+
+        (record,) = caplog.records
+        assert record.query_budget["method"] == "PUT"
+        assert record.query_budget["route"] == "/items/{item_id}"
+        assert record.query_budget["queries"] == 2
+
+
+class TestRoundTrips:
+    """Nombre d'allers-retours des méthodes d'ItemService, à ne pas dépasser."""
+
+    def test_get_by_id(self, session: Session, assert_max_queries):
+        """Test qu'une lecture coûte une requête, puis aucune depuis le cache."""
+        item = ItemService.create(session, ItemCreate(nom="A", prix=1.0))
+
+        with assert_max_queries(1):
+            ItemService.get_by_id(session, item.id)
+        with assert_max_queries(0):
+            ItemService.get_by_id(session, item.id)
+
+    def test_create(self, session: Session, assert_max_queries):
+        """Test le coût d'une création : un INSERT ... RETURNING, sans relecture."""
+        with assert_max_queries(1):
+            item = ItemService.create(session, ItemCreate(nom="A", prix=1.0))
+
+        with assert_max_queries(0):
+            assert (item.id, item.version) == (1, 1)
+
+    def test_update(self, session: Session, assert_max_queries):
+        """Test le coût d'une mise à jour : un UPDATE ... RETURNING."""
+        item = ItemService.create(session, ItemCreate(nom="A", prix=1.0))
+
+        with assert_max_queries(1):
+            ItemService.update(session, item.id, ItemUpdate(prix=2.0), expected_version=1)
+
+    def test_delete(self, session: Session, assert_max_queries):
+        """Test le coût d'une suppression : un DELETE ... RETURNING."""
+        item = ItemService.create(session, ItemCreate(nom="A", prix=1.0))
+
+        with assert_max_queries(1):
+            ItemService.delete(session, item.id)
+
+    def test_fixture_fails_over_budget(self, session: Session, assert_max_queries):
+        """Test que la fixture fait échouer le test en listant les requêtes exécutées."""
+        with pytest.raises(pytest.fail.Exception, match="2 queries executed, expected at most 1"):
+            with assert_max_queries(1):
+                ItemService.create(session, ItemCreate(nom="A", prix=1.0))
+                ItemService.get_by_id(session, 10_000)
@@ -0,0 +1,173 @@
+"""Tests pour le routage des lectures vers les réplicas."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+from app import database
+from app.database import LAST_WRITE_COOKIE, ReplicaRouter, WriteWindow, get_pool_status
+from app.main import app
+from app.migrations import run_migrations
+from app.models.item import Item
+from app.services.cache import item_cache
+
+
+def sqlite_engine(path: Path) -> Engine:
+    """Base SQLite sur fichier, avec un vrai pool de connexions (QueuePool)."""
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
+    return engine
+
+
+@pytest.fixture(name="databases")
+def databases_fixture(tmp_path: Path) -> Generator[tuple[Engine, Engine, Engine]]:
+    """Une primaire et deux réplicas SQLite, chacune sur son fichier."""
+    engines = tuple(sqlite_engine(tmp_path / f"{name}.db") for name in ("primary", "r0", "r1"))
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+class TestReplicaRouter:
+    """Tests pour le choix de la base d'une lecture."""
+
+    def test_round_robin(self, databases: tuple[Engine, Engine, Engine]):
+        """Test que les lectures alternent entre les réplicas."""
+        _, *replicas = databases
+        router = ReplicaRouter("round_robin")
+        pools = [replica.pool for replica in replicas]
+
+        assert [router.choose(pools) for _ in range(4)] == [0, 1, 0, 1]
+
+    def test_least_connections(self, databases: tuple[Engine, Engine, Engine]):
+        """Test que la réplica dont le pool prête le moins de connexions est choisie."""
+        _, busy, idle = databases
+        router = ReplicaRouter("least_connections")
+
+        with busy.connect():
+            choices = {router.choose([busy.pool, idle.pool]) for _ in range(4)}
+
+        assert choices == {1}
+
+    def test_no_replica(self):
+        """Test que la primaire sert toutes les lectures sans réplica."""
+        assert ReplicaRouter().choose([]) is None
+
+    def test_unknown_strategy(self):
+        """Test qu'une stratégie inconnue est refusée."""
+        with pytest.raises(ValueError):
+            ReplicaRouter("random")
+
+
+class TestWriteWindow:
+    """Tests pour la fenêtre de lecture de ses écritures, portée par un cookie signé."""
+
+    def test_window_expires(self):
+        """Test que le cookie ouvre la fenêtre, puis plus après ``seconds`` secondes."""
+        window = WriteWindow(seconds=5, secret="clé")
+        token = window.token(100.0)
+
+        assert window.contains(token, now=104.9)
+        assert not window.contains(token, now=105.0)
+
+    def test_shared_secret(self):
+        """Test qu'une autre instance de même clé accepte le cookie, pas une autre clé."""
+        token = WriteWindow(secret="clé").token(100.0)
+
+        assert WriteWindow(secret="clé").contains(token, now=101.0)
+        assert not WriteWindow(secret="autre").contains(token, now=101.0)
+
+    def test_tampered_token(self):
+        """Test qu'un cookie dont l'heure a été modifiée est refusé."""
+        window = WriteWindow(secret="clé")
+        _, _, signature = window.token(100.0).rpartition(".")
+
+        assert not window.contains(f"200.000.{signature}", now=201.0)
+        assert not window.contains("pas-un-cookie", now=201.0)
+        assert not window.contains(None, now=201.0)
+
+    def test_window_disabled(self):
+        """Test qu'une fenêtre nulle n'envoie jamais de lecture sur la primaire."""
+        window = WriteWindow(seconds=0)
+
+        assert not window.contains(window.token(100.0), now=100.0)
+
+
+class TestReadRouting:
+    """Tests de bout en bout : écritures sur la primaire, lectures sur une réplica."""
+
+    @pytest.fixture(autouse=True)
+    def routed_app(
+        self, databases: tuple[Engine, Engine, Engine], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Branche l'application sur la primaire et une réplica en retard."""
+        primary, replica, _ = databases
+        for engine, nom in ((primary, "Primaire"), (replica, "Réplica")):
+            with Session(engine) as session:
+                session.add(Item(nom=nom, prix=1.0))
+                session.commit()
+        monkeypatch.setattr(database, "engine", primary)
+        monkeypatch.setattr(database, "replica_engines", [replica])
+        monkeypatch.setattr(database, "replica_router", ReplicaRouter())
+        monkeypatch.setattr(database, "write_window", WriteWindow(seconds=5, secret="clé"))
+
+    def test_reads_go_to_the_replica(self):
+        """Test que les lectures sont servies par la réplica."""
+        client = TestClient(app, client=("10.0.0.1", 50000))
+
+        assert [item["nom"] for item in client.get("/items/").json()] == ["Réplica"]
+        assert "replica0" in get_pool_status()
+
+    def test_writer_reads_its_writes(self):
+        """Test qu'après une écriture, seul son auteur lit sur la primaire."""
+        writer = TestClient(app, client=("10.0.0.1", 50000))
+        other = TestClient(app, client=("10.0.0.1", 50000))
+
+        created = writer.post("/items/", json={"nom": "Nouveau", "prix": 2.0})
+
+        assert created.status_code == 201
+        assert LAST_WRITE_COOKIE in created.cookies
+        assert [item["nom"] for item in writer.get("/items/").json()] == ["Primaire", "Nouveau"]
+        assert [item["nom"] for item in other.get("/items/").json()] == ["Réplica"]
+
+    def test_window_travels_with_the_client(self, monkeypatch: pytest.MonkeyPatch):
+        """Test que le cookie suffit, depuis une autre adresse, et expire avec la fenêtre."""
+        now = [1000.0]
+        monkeypatch.setattr(database.time, "time", lambda: now[0])
+        token = database.write_window.token(now[0])
+        client = TestClient(app, client=("10.0.0.9", 50000), cookies={LAST_WRITE_COOKIE: token})
+
+        assert [item["nom"] for item in client.get("/items/").json()] == ["Primaire"]
+        now[0] += 5
+        assert [item["nom"] for item in client.get("/items/").json()] == ["Réplica"]
+
+    def test_replica_reads_are_not_cached(self):
+        """Test qu'un article lu sur la réplica n'entre pas dans le cache."""
+        client = TestClient(app)
+
+        assert client.get("/items/1").json()["nom"] == "Réplica"
+        assert item_cache.get(1) is None
+
+    def test_failed_writes_do_not_set_the_cookie(self):
+        """Test qu'une écriture en échec (404, 412, 422) n'ouvre pas la fenêtre."""
+        client = TestClient(app)
+
+        missing = client.put("/items/999", json={"prix": 2.0})
+        conflict = client.put("/items/1", json={"prix": 2.0}, headers={"If-Match": '"1-9"'})
+        invalid = client.post("/items/", json={"nom": "", "prix": 2.0})
+
+        assert [missing.status_code, conflict.status_code, invalid.status_code] == [404, 412, 422]
+        for response in (missing, conflict, invalid):
+            assert LAST_WRITE_COOKIE not in response.cookies
+        assert [item["nom"] for item in client.get("/items/").json()] == ["Réplica"]
+
+    def test_reads_do_not_set_the_cookie(self):
+        """Test que seules les routes d'écriture posent le cookie."""
+        response = TestClient(app).get("/items/")
+
+        assert LAST_WRITE_COOKIE not in response.cookies
@@ -0,0 +1,143 @@
+"""Tests pour la recherche des items par nom (GET /items/search)."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.models.item import Item
+from app.services.item_queries import escape_like, fts_query, postgres_search, search_statement
+from app.services.item_service import ItemService
+
+NOMS = ["Écran 24 pouces", "Ecran tactile", "Souris sans fil", "Clavier écran", "Tapis"]
+
+
+def _create_items(session: Session) -> None:
+    session.add_all([Item(nom=nom, prix=10.0) for nom in NOMS])
+    session.commit()
+
+
+class TestSearchQueries:
+    """Tests pour la construction des requêtes de recherche."""
+
+    def test_fts_query_uses_word_prefixes(self):
+        """Test que chaque mot devient un préfixe FTS5 et que la ponctuation est ignorée."""
+        assert fts_query('écran "24"') == '"écran"* "24"*'
+        assert fts_query("-- !") is None
+
+    def test_escape_like(self):
+        """Test l'échappement des jokers LIKE."""
+        assert escape_like("100%_\\") == "100\\%\\_\\\\"
+
+    def test_postgres_statement_uses_trigram_expression(self):
+        """Test que la requête PostgreSQL reprend l'expression des index trigrammes."""
+        statement = search_statement("postgresql", "ecran", 10, 0, accent_insensitive=True)
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "items_unaccent(lower(items.nom)) LIKE" in sql
+        assert "similarity(" in sql
+
+    def test_postgres_statement_without_extensions(self, monkeypatch):
+        """Test le repli sur ILIKE quand pg_trgm et unaccent n'ont pas pu être installées."""
+        monkeypatch.setattr(postgres_search, "trigram", False)
+        monkeypatch.setattr(postgres_search, "unaccent", False)
+        statement = search_statement("postgresql", "ecran", 10, 0, accent_insensitive=True)
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "ILIKE" in sql
+        assert "similarity(" not in sql
+        assert "items_unaccent" not in sql
+
+    def test_postgres_statement_without_unaccent(self, monkeypatch):
+        """Test que la recherche trigramme reste disponible sans unaccent."""
+        monkeypatch.setattr(postgres_search, "unaccent", False)
+        statement = search_statement("postgresql", "ecran", 10, 0, accent_insensitive=True)
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "lower(items.nom) LIKE" in sql
+        assert "items_unaccent" not in sql
+
+
+class TestItemServiceSearch:
+    """Tests pour ItemService.search sur SQLite (FTS5)."""
+
+    def test_search_ignores_accents(self, session: Session):
+        """Test qu'une recherche sans accent trouve les noms accentués."""
+        _create_items(session)
+
+        items, next_offset = ItemService.search(session, "ecran")
+
+        assert sorted(item.nom for item in items) == [
+            "Clavier écran",
+            "Ecran tactile",
+            "Écran 24 pouces",
+        ]
+        assert next_offset is None
+
+    def test_search_accent_sensitive(self, session: Session):
+        """Test que l'option accent_insensitive=False tient compte des accents."""
+        _create_items(session)
+
+        items, _ = ItemService.search(session, "écran", accent_insensitive=False)
+
+        assert [item.nom for item in items] == ["Clavier écran"]
+
+    def test_search_matches_word_prefix(self, session: Session):
+        """Test la recherche par début de mot."""
+        _create_items(session)
+
+        items, _ = ItemService.search(session, "sour")
+
+        assert [item.nom for item in items] == ["Souris sans fil"]
+
+    def test_search_follows_updates_and_deletes(self, session: Session):
+        """Test que l'index FTS suit les modifications et suppressions."""
+        _create_items(session)
+        souris = session.get(Item, 3)
+        souris.nom = "Écran souris"
+        session.delete(session.get(Item, 4))
+        session.commit()
+
+        items, _ = ItemService.search(session, "ecran")
+
+        assert sorted(item.id for item in items) == [1, 2, 3]
+
+    def test_search_pagination(self, session: Session):
+        """Test la pagination des résultats."""
+        _create_items(session)
+
+        first, next_offset = ItemService.search(session, "ecran", limit=2)
+        rest, end = ItemService.search(session, "ecran", skip=next_offset, limit=2)
+
+        assert next_offset == 2
+        assert len({item.id for item in first + rest}) == 3
+        assert end is None
+
+
+class TestSearchRoute:
+    """Tests pour la route GET /items/search."""
+
+    def test_search_route(self, client: TestClient, session: Session):
+        """Test la réponse paginée et la durée rapportée."""
+        _create_items(session)
+
+        response = client.get("/items/search", params={"q": "ecran", "limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["next_offset"] == 2
+        assert data["took_ms"] >= 0
+
+    def test_search_requires_query(self, client: TestClient):
+        """Test que le paramètre q est obligatoire et non vide."""
+        assert client.get("/items/search").status_code == 422
+        assert client.get("/items/search?q=").status_code == 422
+
+    def test_search_without_words(self, client: TestClient, session: Session):
+        """Test qu'une saisie sans mot ne renvoie rien."""
+        _create_items(session)
+
+        assert client.get("/items/search", params={"q": "%%"}).json()["items"] == []
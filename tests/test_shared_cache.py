@@ -0,0 +1,235 @@
+"""Tests pour le cache partagé (protocole Redis) et la diffusion des invalidations."""
+
+import time
+
+import pytest
+
+from app.config import Settings
+from app.services.cache import (
+    LayeredCache,
+    RedisCache,
+    RedisInvalidationBus,
+    TTLCache,
+    build_item_cache,
+)
+from app.services.cache.base import CacheBackendError
+from app.services.cache.resp import RespAddress, RespConnection, parse_redis_url
+from tests.fake_resp_server import FakeRespServer
+
+
+def wait_until(condition, timeout: float = 2.0) -> bool:
+    """Attend qu'une condition devienne vraie (messages asynchrones)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def make_replica(server: FakeRespServer) -> LayeredCache:
+    address = parse_redis_url(server.url)
+    replica = LayeredCache(
+        TTLCache(maxsize=100, ttl=60),
+        shared=RedisCache(address, ttl=60),
+        bus=RedisInvalidationBus(address, channel="items:invalidate"),
+    )
+    replica.start()
+    assert replica.bus.wait_subscribed(2)
+    return replica
+
+
+class TestRespClient:
+    """Tests pour le client RESP minimal."""
+
+    def test_parse_redis_url(self):
+        """Test l'analyse des URL redis://."""
+        assert parse_redis_url("redis://:secret@cache:6380/2") == RespAddress(
+            host="cache", port=6380, db=2, password="secret"
+        )
+        assert parse_redis_url("redis://localhost") == RespAddress()
+        with pytest.raises(ValueError):
+            parse_redis_url("http://localhost")
+
+    def test_commands_round_trip(self, resp_server: FakeRespServer):
+        """Test l'envoi de commandes et le décodage des réponses."""
+        connection = RespConnection(parse_redis_url(resp_server.url))
+
+        assert connection.execute("PING") == "PONG"
+        assert connection.execute("SET", "clé", "valeur") == "OK"
+        assert connection.execute("GET", "clé") == b"valeur"
+        assert connection.execute("GET", "absente") is None
+        assert connection.execute("DEL", "clé", "absente") == 1
+        connection.close()
+
+    def test_authentication(self):
+        """Test que le mot de passe de l'URL est envoyé à la connexion."""
+        server = FakeRespServer(password="secret")
+        server.start()
+        try:
+            connection = RespConnection(parse_redis_url(server.url))
+            assert connection.execute("PING") == "PONG"
+            assert server.commands[0] == [b"AUTH", b"secret"]
+            connection.close()
+        finally:
+            server.stop()
+
+    def test_failed_handshake_resets_connection(self):
+        """Test qu'un AUTH refusé ne laisse pas une connexion réutilisable à moitié ouverte."""
+        server = FakeRespServer(password="secret")
+        server.start()
+        try:
+            address = parse_redis_url(server.url)
+            connection = RespConnection(RespAddress(address.host, address.port, password="faux"))
+            with pytest.raises(CacheBackendError):
+                connection.execute("PING")
+            with pytest.raises(CacheBackendError):
+                connection.execute("PING")
+            assert [command[0] for command in server.commands] == [b"AUTH", b"AUTH"]
+            connection.close()
+        finally:
+            server.stop()
+
+    def test_malformed_reply_resets_connection(self):
+        """Test qu'une réponse illisible ferme la socket au lieu de la laisser désynchronisée."""
+
+        class GarbledServer(FakeRespServer):
+            def dispatch(self, handler, command):
+                if command[0].upper() == b"GET" and len(self.commands) == 0:
+                    self.commands.append(command)
+                    return b":abc\r\n"
+                return super().dispatch(handler, command)
+
+        server = GarbledServer()
+        server.start()
+        try:
+            connection = RespConnection(parse_redis_url(server.url))
+            with pytest.raises(CacheBackendError):
+                connection.execute("GET", "clé")
+            assert connection._sock is None
+            assert connection.execute("PING") == "PONG"
+            connection.close()
+        finally:
+            server.stop()
+
+    def test_unreachable_server(self):
+        """Test qu'un serveur injoignable lève CacheBackendError."""
+        connection = RespConnection(RespAddress(host="127.0.0.1", port=1), timeout=0.2)
+
+        with pytest.raises(CacheBackendError):
+            connection.execute("PING")
+
+
+class TestRedisCache:
+    """Tests pour le backend RedisCache."""
+
+    def test_get_set_delete(self, resp_server: FakeRespServer):
+        """Test le stockage JSON et l'invalidation."""
+        cache = RedisCache(parse_redis_url(resp_server.url), ttl=60)
+
+        cache.set(1, {"id": 1, "nom": "Écran", "prix": 10.0})
+        assert cache.get(1) == {"id": 1, "nom": "Écran", "prix": 10.0}
+        cache.delete(1)
+        assert cache.get(1) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_undecodable_value_is_an_error(self, resp_server: FakeRespServer):
+        """Test qu'une valeur qui n'est pas du JSON est comptée en erreur et traitée en absence."""
+        cache = RedisCache(parse_redis_url(resp_server.url), ttl=60)
+        connection = RespConnection(parse_redis_url(resp_server.url))
+        connection.execute("SET", f"{cache.prefix}1", "pas du json")
+        connection.execute("SET", f"{cache.prefix}2", b"\xff")
+        connection.close()
+
+        assert cache.get(1) is None
+        assert cache.get(2) is None
+        assert cache.stats()["errors"] == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_entries_expire_server_side(self, resp_server: FakeRespServer):
+        """Test que le TTL est transmis au serveur."""
+        cache = RedisCache(parse_redis_url(resp_server.url), ttl=0.05)
+
+        cache.set(1, {"id": 1})
+        time.sleep(0.1)
+
+        assert cache.get(1) is None
+
+    def test_server_down_is_a_miss(self):
+        """Test qu'une panne du serveur est traitée comme une absence."""
+        cache = RedisCache(RespAddress(host="127.0.0.1", port=1), ttl=60, timeout=0.2)
+
+        cache.set(1, {"id": 1})
+        cache.delete(1)
+
+        assert cache.get(1) is None
+        assert cache.stats()["errors"] == 3
+
+
+class TestLayeredCache:
+    """Tests pour le cache à deux niveaux et la diffusion entre répliques."""
+
+    def test_memory_backend_by_default(self):
+        """Test que le backend mémoire n'a ni cache partagé ni bus."""
+        cache = build_item_cache(Settings())
+
+        assert cache.shared is None
+        assert cache.bus is None
+
+    def test_unknown_backend(self):
+        """Test qu'un backend inconnu est refusé."""
+        with pytest.raises(ValueError):
+            build_item_cache(Settings(cache_backend="memcached"))
+
+    def test_shared_value_is_visible_from_other_replica(self, resp_server: FakeRespServer):
+        """Test qu'une valeur mise en cache par une réplique profite aux autres."""
+        first, second = make_replica(resp_server), make_replica(resp_server)
+        try:
+            first.set(1, {"id": 1, "nom": "Partagé"})
+
+            assert second.get(1) == {"id": 1, "nom": "Partagé"}
+            assert second.local.get(1) == {"id": 1, "nom": "Partagé"}
+        finally:
+            first.stop()
+            second.stop()
+
+    def test_invalidation_is_broadcast(self, resp_server: FakeRespServer):
+        """Test qu'une invalidation purge le cache local de toutes les répliques."""
+        first, second = make_replica(resp_server), make_replica(resp_server)
+        try:
+            first.set(1, {"id": 1, "nom": "Ancien"})
+            assert second.get(1) is not None
+
+            first.delete(1)
+
+            assert wait_until(lambda: second.local.get(1) is None)
+            assert second.get(1) is None
+        finally:
+            first.stop()
+            second.stop()
+
+    def test_item_service_writes_publish_invalidations(
+        self, resp_server: FakeRespServer, session, monkeypatch
+    ):
+        """Test que ItemService.update publie l'invalidation aux autres répliques."""
+        from app.models.item import Item
+        from app.schemas.item import ItemUpdate
+        from app.services import cache as cache_module
+        from app.services.item_service import ItemService
+
+        local, remote = make_replica(resp_server), make_replica(resp_server)
+        monkeypatch.setattr(cache_module, "item_cache", local)
+        try:
+            item = Item(nom="Avant", prix=1.0)
+            session.add(item)
+            session.commit()
+            session.refresh(item)
+            remote.local.set(item.id, {"id": item.id, "nom": "Avant", "prix": 1.0})
+
+            ItemService.update(session, item.id, ItemUpdate(nom="Après"))
+
+            assert wait_until(lambda: remote.local.get(item.id) is None)
+        finally:
+            local.stop()
+            remote.stop()
@@ -0,0 +1,114 @@
+"""Tests pour les statistiques des prix (GET /items/stats)."""
+
+import statistics
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.models.item import Item
+from app.services.cache import REPLICA_SESSION, item_stats
+from app.services.item_service import ItemService
+from app.services.item_stats import postgres_stats_statement
+
+
+@pytest.fixture
+def ten_items(session: Session) -> list[float]:
+    """Dix articles de prix 1 à 10."""
+    prices = [float(prix) for prix in range(1, 11)]
+    session.add_all([Item(nom=f"Article {prix}", prix=prix) for prix in prices])
+    session.commit()
+    return prices
+
+
+class TestItemServiceStats:
+    """Tests pour ItemService.stats."""
+
+    def test_summary_matches_percentile_cont(self, session: Session, ten_items: list[float]):
+        """Test le résumé et les percentiles interpolés comme percentile_cont."""
+        stats = ItemService.stats(session, buckets=3)
+
+        assert stats.count == 10
+        assert (stats.min, stats.max, stats.avg) == (1.0, 10.0, 5.5)
+        assert stats.stddev == pytest.approx(statistics.stdev(ten_items))
+        assert stats.p50 == pytest.approx(5.5)
+        assert stats.p90 == pytest.approx(9.1)
+        assert stats.p99 == pytest.approx(9.91)
+
+    def test_histogram_buckets(self, session: Session, ten_items: list[float]):
+        """Test des classes de même largeur, le maximum étant dans la dernière."""
+        stats = ItemService.stats(session, buckets=3)
+
+        assert [(b.lower, b.upper, b.count) for b in stats.histogram] == [
+            (1.0, 4.0, 3),
+            (4.0, 7.0, 3),
+            (7.0, 10.0, 4),
+        ]
+
+    def test_empty_table(self, session: Session):
+        """Test qu'une table vide donne un effectif nul et aucune classe."""
+        stats = ItemService.stats(session)
+
+        assert stats.count == 0
+        assert stats.p50 is None
+        assert stats.histogram == []
+
+    def test_single_price(self, session: Session):
+        """Test qu'un prix unique donne une seule classe et pas d'écart type."""
+        session.add_all([Item(nom="A", prix=5.0), Item(nom="B", prix=5.0)])
+        session.commit()
+
+        stats = ItemService.stats(session, buckets=4)
+
+        assert stats.stddev == 0.0
+        assert stats.p99 == 5.0
+        assert [(b.lower, b.upper, b.count) for b in stats.histogram] == [(5.0, 5.0, 2)]
+
+    def test_result_is_cached(self, session: Session, ten_items: list[float]):
+        """Test que le résultat est servi par le cache jusqu'à son expiration."""
+        first = ItemService.stats(session, buckets=3)
+        session.add(Item(nom="Nouveau", prix=100.0))
+        session.commit()
+
+        assert ItemService.stats(session, buckets=3) == first
+        item_stats.clear()
+        assert ItemService.stats(session, buckets=3).count == 11
+
+    def test_replica_result_is_not_cached(self, session: Session, ten_items: list[float]):
+        """Test que des statistiques calculées sur une réplica ne remplissent pas le cache."""
+        session.info[REPLICA_SESSION] = True
+
+        assert ItemService.stats(session, buckets=3).count == 10
+        assert item_stats.get(3) is None
+
+    def test_postgres_statement_is_a_single_query(self):
+        """Test que la variante PostgreSQL utilise percentile_cont et width_bucket."""
+        sql = str(postgres_stats_statement(10).compile(dialect=postgresql.dialect()))
+
+        assert "percentile_cont" in sql
+        assert "WITHIN GROUP (ORDER BY items.prix)" in sql
+        assert "width_bucket" in sql
+        assert "stddev_samp" in sql
+
+
+class TestStatsRoute:
+    """Tests pour GET /items/stats."""
+
+    def test_get_stats(self, client: TestClient):
+        """Test la réponse de la route."""
+        client.post("/items/bulk", json=[{"nom": "A", "prix": 2.0}, {"nom": "B", "prix": 4.0}])
+
+        data = client.get("/items/stats?buckets=2").json()
+
+        assert data["count"] == 2
+        assert data["avg"] == 3.0
+        assert data["histogram"] == [
+            {"lower": 2.0, "upper": 3.0, "count": 1},
+            {"lower": 3.0, "upper": 4.0, "count": 1},
+        ]
+
+    @pytest.mark.parametrize("buckets", [0, 101])
+    def test_bucket_count_is_bounded(self, client: TestClient, buckets: int):
+        """Test que le nombre de classes est borné."""
+        assert client.get(f"/items/stats?buckets={buckets}").status_code == 422
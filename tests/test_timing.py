@@ -0,0 +1,102 @@
+"""Tests pour la mesure du temps des requêtes (en-tête Server-Timing)."""
+
+import logging
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.observability import RequestTiming
+
+
+def server_timing(response) -> dict[str, str]:
+    """Métriques de l'en-tête Server-Timing, par nom."""
+    metrics = {}
+    for metric in response.headers["server-timing"].split(", "):
+        name, _, params = metric.partition(";")
+        metrics[name] = params
+    return metrics
+
+
+def duration(params: str) -> float:
+    return float(re.search(r"dur=([\d.]+)", params).group(1))
+
+
+class TestRequestTiming:
+    """Tests pour le calcul des mesures d'une requête."""
+
+    def test_fields(self):
+        """Test le découpage du temps total en étapes, en millisecondes."""
+        timing = RequestTiming(
+            started=1.0,
+            db=0.002,
+            queries=2,
+            endpoint_started=1.001,
+            endpoint_finished=1.004,
+            response_started=1.005,
+        )
+
+        fields = timing.fields(now=1.010)
+
+        assert fields["total_ms"] == pytest.approx(10.0)
+        assert fields["validation_ms"] == pytest.approx(1.0)
+        assert fields["app_ms"] == pytest.approx(3.0)
+        assert fields["serialization_ms"] == pytest.approx(1.0)
+        assert fields["db_ms"] == pytest.approx(2.0)
+        assert fields["queries"] == 2
+
+    def test_unobserved_steps_are_omitted(self):
+        """Test qu'une requête sans fonction de route (404) n'a que db et total."""
+        header = RequestTiming(started=1.0).server_timing(now=1.5)
+
+        assert header == 'db;dur=0.0;desc="0 queries", total;dur=500.0'
+
+
+class TestTimingMiddleware:
+    """Tests pour l'en-tête Server-Timing et le journal des requêtes."""
+
+    def test_item_route_header(self, client: TestClient):
+        """Test que les requêtes SQL et les étapes sont mesurées sur une route d'items."""
+        client.post("/items/", json={"nom": "A", "prix": 1.0})
+
+        metrics = server_timing(client.get("/items/"))
+
+        assert {"db", "validation", "app", "serialization", "total"} <= metrics.keys()
+        assert re.search(r'desc="[1-9]\d* queries"', metrics["db"])
+        assert duration(metrics["db"]) <= duration(metrics["total"])
+
+    def test_route_without_database(self, client: TestClient):
+        """Test qu'une route hors items reçoit l'en-tête, sans requête SQL."""
+        metrics = server_timing(client.get("/health"))
+
+        assert 'desc="0 queries"' in metrics["db"]
+        assert "total" in metrics
+
+    def test_structured_log(self, client: TestClient, caplog: pytest.LogCaptureFixture):
+        """Test que chaque requête est journalisée avec ses mesures en champs structurés."""
+        with caplog.at_level(logging.INFO, logger="app.observability.timing"):
+            client.get("/items/")
+
+        (record,) = caplog.records
+        assert record.timing["method"] == "GET"
+        assert record.timing["path"] == "/items/"
+        assert record.timing["status"] == 200
+        assert record.timing["queries"] >= 1
+        assert record.timing["total_ms"] >= record.timing["db_ms"]
+
+    def test_disabled(self):
+        """Test qu'une application sans le middleware ne renvoie pas l'en-tête."""
+        bare_app = FastAPI()
+        bare_app.get("/")(lambda: {})
+
+        assert "server-timing" not in TestClient(bare_app).get("/").headers
+
+    def test_async_routes(self, async_client: TestClient):
+        """Test la mesure des requêtes SQL faites par l'AsyncEngine."""
+        response = async_client.post("/items/", json={"nom": "A", "prix": 1.0})
+
+        assert response.status_code == 201
+        metrics = server_timing(response)
+        assert re.search(r'desc="[1-9]\d* queries"', metrics["db"])
+        assert "app" in metrics